@@ -0,0 +1,271 @@
+"""
+Benchmark shell completion latency for all the shells supported by Typer.
+
+Synthetic apps with 10, 100 and 1000 commands/options/choices are driven through
+`BashComplete`, `ZshComplete`, `FishComplete` and `PowerShellComplete`, both
+in-process (only the completion request) and in a subprocess (what the shell
+actually waits for, including interpreter startup and building the Click tree).
+
+Run it from the repository root:
+
+    python scripts/benchmark_completion.py
+    python scripts/benchmark_completion.py --size 1000 --no-subprocess
+    python scripts/benchmark_completion.py --json > completion.json
+"""
+
+import inspect
+import json
+import os
+import subprocess
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from enum import Enum
+from pathlib import Path
+from typing import Annotated, Any
+
+import click
+import typer
+from benchmark_utils import measure, summarize
+from click.shell_completion import CompletionItem, ShellComplete
+from typer._completion_classes import (
+    BashComplete,
+    FishComplete,
+    PowerShellComplete,
+    ZshComplete,
+    _sanitize_help_text,
+    completion_init,
+)
+from typer.main import get_command
+
+PROG_NAME = "bench"
+COMPLETE_VAR = "_BENCH_COMPLETE"
+DEFAULT_SIZES = [10, 100, 1000]
+
+SHELLS: dict[str, type[ShellComplete]] = {
+    "bash": BashComplete,
+    "zsh": ZshComplete,
+    "fish": FishComplete,
+    "powershell": PowerShellComplete,
+}
+
+app = typer.Typer()
+
+
+class Case(str, Enum):
+    subcommand = "subcommand"
+    option_name = "option-name"
+    choice = "choice"
+    callback = "callback"
+
+
+def build_app(size: int) -> typer.Typer:
+    """
+    Build a synthetic app with `size` subcommands, and a `target` command with
+    `size` options, a choice option with `size` values and an autocompletion
+    callback returning `size` items.
+    """
+    bench_app = typer.Typer()
+    choices = Enum("Choices", {f"value_{i}": f"value-{i}" for i in range(size)})  # type: ignore[misc]
+
+    def complete_custom(incomplete: str) -> Iterator[tuple[str, str]]:
+        for i in range(size):
+            yield f"item-{i}", f"The [bold]item[/bold] number {i}: it's `{i}`"
+
+    for i in range(size):
+
+        def command() -> None:
+            pass  # pragma: no cover
+
+        command.__doc__ = f"Command number {i}."
+        bench_app.command(f"cmd-{i}")(command)
+
+    def target(**kwargs: Any) -> None:
+        pass  # pragma: no cover
+
+    # Options can't be declared dynamically in a function definition, build the
+    # signature that Typer will inspect instead
+    parameters = [
+        inspect.Parameter(
+            "choice",
+            inspect.Parameter.KEYWORD_ONLY,
+            default=None,
+            annotation=Annotated[choices | None, typer.Option(help="A choice.")],
+        ),
+        inspect.Parameter(
+            "custom",
+            inspect.Parameter.KEYWORD_ONLY,
+            default="",
+            annotation=Annotated[
+                str,
+                typer.Option(autocompletion=complete_custom, help="Custom values."),
+            ],
+        ),
+    ]
+    parameters.extend(
+        inspect.Parameter(
+            f"opt_{i}",
+            inspect.Parameter.KEYWORD_ONLY,
+            default=0,
+            annotation=Annotated[int, typer.Option(help=f"Option number {i}.")],
+        )
+        for i in range(size)
+    )
+    target.__signature__ = inspect.Signature(parameters)  # type: ignore[attr-defined]
+    target.__annotations__ = {p.name: p.annotation for p in parameters}
+    bench_app.command("target")(target)
+    return bench_app
+
+
+def get_case_words(case: Case) -> tuple[list[str], str]:
+    """Return the complete args and the incomplete value for a completion case."""
+    if case == Case.subcommand:
+        return [], "cmd-1"
+    if case == Case.option_name:
+        return ["target"], "--opt-1"
+    if case == Case.choice:
+        return ["target", "--choice"], "value-1"
+    return ["target", "--custom"], "item-1"
+
+
+def get_completion_env(shell: str, args: list[str], incomplete: str) -> dict[str, str]:
+    """Emulate the environment each shell's completion script sets up."""
+    words = " ".join([PROG_NAME, *args, incomplete])
+    if shell == "bash":
+        return {"COMP_WORDS": words, "COMP_CWORD": str(len(args) + 1)}
+    env = {"_TYPER_COMPLETE_ARGS": words}
+    if shell == "fish":
+        env["_TYPER_COMPLETE_FISH_ACTION"] = "get-args"
+    if shell == "powershell":
+        env["_TYPER_COMPLETE_WORD_TO_COMPLETE"] = incomplete
+    return env
+
+
+@contextmanager
+def patched_environ(env: dict[str, str]) -> Iterator[None]:
+    old = {key: os.environ.get(key) for key in env}
+    os.environ.update(env)
+    try:
+        yield
+    finally:
+        for key, value in old.items():
+            if value is None:
+                del os.environ[key]
+            else:
+                os.environ[key] = value
+
+
+def bench_in_process(
+    cli: click.Command, *, size: int, repeat: int
+) -> Iterator[dict[str, Any]]:
+    for shell, comp_cls in SHELLS.items():
+        comp = comp_cls(cli, {}, PROG_NAME, COMPLETE_VAR)
+        for case in Case:
+            args, incomplete = get_case_words(case)
+            with patched_environ(get_completion_env(shell, args, incomplete)):
+                # Don't measure a request that fails or doesn't complete anything
+                if not comp.complete():
+                    raise RuntimeError(f"No completions for {shell} {args}")
+                timings = measure(comp.complete, repeat=repeat)
+            yield summarize(
+                "in-process", timings, shell=shell, case=case.value, size=size
+            )
+
+
+def bench_subprocess(*, size: int, repeat: int) -> Iterator[dict[str, Any]]:
+    code = (
+        f"import sys; sys.path.insert(0, {str(Path(__file__).parent)!r}); "
+        "from benchmark_completion import build_app; "
+        f"build_app({size})(prog_name={PROG_NAME!r})"
+    )
+    for shell in SHELLS:
+        for case in Case:
+            args, incomplete = get_case_words(case)
+            env = {
+                **os.environ,
+                **get_completion_env(shell, args, incomplete),
+                COMPLETE_VAR: f"complete_{shell}",
+            }
+
+            def complete(env: dict[str, str] = env) -> None:
+                result = subprocess.run(
+                    [sys.executable, "-c", code],
+                    env=env,
+                    capture_output=True,
+                    encoding="utf-8",
+                    check=True,
+                )
+                if not result.stdout:
+                    raise RuntimeError(f"No completions for {env[COMPLETE_VAR]}")
+
+            timings = measure(complete, repeat=repeat)
+            yield summarize(
+                "subprocess", timings, shell=shell, case=case.value, size=size
+            )
+
+
+def bench_formatting(*, size: int, repeat: int) -> Iterator[dict[str, Any]]:
+    items = [
+        CompletionItem(
+            f"value:{i}", help=f"The [bold]value[/bold] `{i}` costs $'{i}' \"units\""
+        )
+        for i in range(size)
+    ]
+    cli = click.Command(PROG_NAME)
+    timings = measure(
+        lambda: [_sanitize_help_text(item.help or "") for item in items],
+        repeat=repeat,
+    )
+    yield summarize("format", timings, shell="-", case="sanitize-help", size=size)
+    for shell, comp_cls in SHELLS.items():
+        comp = comp_cls(cli, {}, PROG_NAME, COMPLETE_VAR)
+        timings = measure(
+            lambda comp=comp: "\n".join(comp.format_completion(i) for i in items),
+            repeat=repeat,
+        )
+        yield summarize("format", timings, shell=shell, case="format-items", size=size)
+
+
+@app.command()
+def run(
+    size: Annotated[
+        list[int] | None,
+        typer.Option(help="Number of commands, options and choices in the app."),
+    ] = None,
+    repeat: Annotated[int, typer.Option(min=1)] = 20,
+    subprocess_repeat: Annotated[int, typer.Option(min=1)] = 5,
+    in_process: bool = True,
+    use_subprocess: Annotated[
+        bool, typer.Option("--subprocess/--no-subprocess")
+    ] = True,
+    formatting: bool = True,
+    json_output: Annotated[bool, typer.Option("--json")] = False,
+) -> None:
+    """
+    Measure the completion latency per shell, request type and app size.
+    """
+    completion_init()
+    results: list[dict[str, Any]] = []
+    for app_size in size or DEFAULT_SIZES:
+        cli = get_command(build_app(app_size))
+        if in_process:
+            results.extend(bench_in_process(cli, size=app_size, repeat=repeat))
+        if use_subprocess:
+            results.extend(bench_subprocess(size=app_size, repeat=subprocess_repeat))
+        if formatting:
+            results.extend(bench_formatting(size=app_size, repeat=repeat))
+    if json_output:
+        typer.echo(json.dumps(results, indent=2))
+        return
+    header = f"{'mode':<11} {'shell':<11} {'case':<14} {'size':>5} {'median ms':>10} {'p95 ms':>10}"
+    typer.echo(header)
+    typer.echo("-" * len(header))
+    for r in results:
+        typer.echo(
+            f"{r['name']:<11} {r['shell']:<11} {r['case']:<14} {r['size']:>5} "
+            f"{r['median_ms']:>10.3f} {r['p95_ms']:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    app()
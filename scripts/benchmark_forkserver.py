@@ -0,0 +1,199 @@
+"""
+Benchmark invocations served by a fork-server (`app.serve()`) against cold starts.
+
+A synthetic app with 10, 100 and 1000 commands is invoked:
+
+* cold: a new interpreter imports the app and builds the Click tree each time.
+* shim: the client script from `typer.get_client_shim()` sends the invocation to
+  a running server, which forks a child for it. This is what a user waits for.
+* client: `run_client()` is called in-process, only the request, the fork and the
+  command are measured.
+
+The server runs with and without prewarming (lazy imports and `gc.freeze()`). For
+the memory, the command reports its own RSS, PSS (the shared pages divided between
+the processes sharing them) and private memory from `/proc/self/smaps_rollup`,
+Linux only.
+
+Run it from the repository root:
+
+    python scripts/benchmark_forkserver.py
+    python scripts/benchmark_forkserver.py --size 1000 --repeat 50
+    python scripts/benchmark_forkserver.py --json > forkserver.json
+"""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Annotated, Any
+
+import typer
+from benchmark_utils import measure, summarize
+from typer._server import run_client
+
+PROG_NAME = "bench"
+DEFAULT_SIZES = [10, 100, 1000]
+SMAPS_FIELDS = {"Rss": "rss_kb", "Pss": "pss_kb", "Private_Dirty": "private_kb"}
+
+app = typer.Typer()
+
+
+def read_memory() -> dict[str, int]:
+    """Return the RSS, PSS and private dirty memory of the current process in kB."""
+    memory: dict[str, int] = {}
+    with open("/proc/self/smaps_rollup") as file:
+        for line in file:
+            field, _, value = line.partition(":")
+            if field in SMAPS_FIELDS:
+                memory[SMAPS_FIELDS[field]] = int(value.split()[0])
+    return memory
+
+
+def build_app(size: int) -> typer.Typer:
+    """
+    Build a synthetic app with `size` subcommands with a few parameters each, and
+    a `memory` command printing the memory used by its process.
+    """
+    bench_app = typer.Typer()
+
+    for i in range(size):
+
+        def command(
+            name: str = "world",
+            count: Annotated[int, typer.Option(min=1)] = 1,
+            verbose: bool = False,
+        ) -> None:
+            for _ in range(count):
+                print(f"Hello {name}")
+
+        command.__doc__ = f"Command number {i}."
+        bench_app.command(f"cmd-{i}")(command)
+
+    @bench_app.command("memory")
+    def memory() -> None:
+        print(json.dumps(read_memory()))
+
+    return bench_app
+
+
+def get_app_code(size: int, call: str) -> str:
+    return (
+        f"import sys; sys.path.insert(0, {str(Path(__file__).parent)!r}); "
+        "from benchmark_forkserver import build_app; "
+        f"build_app({size}){call}"
+    )
+
+
+@contextmanager
+def running_server(size: int, *, prewarm: bool) -> Iterator[Path]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        socket_path = Path(tmp_dir) / "bench.sock"
+        code = get_app_code(
+            size,
+            f".serve({str(socket_path)!r}, prog_name={PROG_NAME!r}, "
+            f"prewarm={prewarm!r})",
+        )
+        server = subprocess.Popen([sys.executable, "-c", code])
+        try:
+            # The socket file exists from bind(), before the server listens, wait
+            # until it accepts connections
+            while True:
+                if server.poll() is not None:
+                    raise RuntimeError("The server didn't start")
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                    try:
+                        client.connect(str(socket_path))
+                    except (FileNotFoundError, ConnectionRefusedError):
+                        time.sleep(0.01)
+                        continue
+                break
+            yield socket_path
+        finally:
+            server.terminate()
+            server.wait()
+
+
+def run_command(command: list[str]) -> str:
+    result = subprocess.run(command, capture_output=True, encoding="utf-8")
+    if result.returncode != 0:
+        raise RuntimeError(f"{command} failed:\n{result.stderr}")
+    return result.stdout
+
+
+def bench_cold(*, size: int, repeat: int) -> dict[str, Any]:
+    command = [sys.executable, "-c", get_app_code(size, f"(prog_name={PROG_NAME!r})")]
+    timings = measure(lambda: run_command([*command, "cmd-1"]), repeat=repeat)
+    memory = json.loads(run_command([*command, "memory"]))
+    return summarize("cold", timings, size=size, prewarm="-", **memory)
+
+
+def bench_served(
+    *, size: int, prewarm: bool, repeat: int, shim_repeat: int
+) -> Iterator[dict[str, Any]]:
+    with running_server(size, prewarm=prewarm) as socket_path:
+        shim = socket_path.parent / PROG_NAME
+        shim.write_text(typer.get_client_shim(socket_path, prog_name=PROG_NAME))
+        command = [sys.executable, "-S", str(shim)]
+        timings = measure(lambda: run_command([*command, "cmd-1"]), repeat=shim_repeat)
+        memory = json.loads(run_command([*command, "memory"]))
+        yield summarize("shim", timings, size=size, prewarm=prewarm, **memory)
+        with open(os.devnull, "r+b") as devnull:
+            fds = [devnull.fileno()] * 3
+            timings = measure(
+                lambda: run_client(str(socket_path), ["cmd-1"], fds=fds),
+                repeat=repeat,
+            )
+        yield summarize("client", timings, size=size, prewarm=prewarm, **memory)
+
+
+@app.command()
+def run(
+    size: Annotated[
+        list[int] | None,
+        typer.Option(help="Number of commands in the app."),
+    ] = None,
+    repeat: Annotated[int, typer.Option(min=1)] = 50,
+    subprocess_repeat: Annotated[int, typer.Option(min=1)] = 10,
+    json_output: Annotated[bool, typer.Option("--json")] = False,
+) -> None:
+    """
+    Measure the latency and the memory of an invocation, started cold or served by
+    a fork-server, per app size.
+    """
+    results: list[dict[str, Any]] = []
+    for app_size in size or DEFAULT_SIZES:
+        results.append(bench_cold(size=app_size, repeat=subprocess_repeat))
+        for prewarm in (False, True):
+            results.extend(
+                bench_served(
+                    size=app_size,
+                    prewarm=prewarm,
+                    repeat=repeat,
+                    shim_repeat=subprocess_repeat,
+                )
+            )
+    if json_output:
+        typer.echo(json.dumps(results, indent=2))
+        return
+    header = (
+        f"{'mode':<7} {'prewarm':<8} {'size':>5} {'median ms':>10} {'p95 ms':>10} "
+        f"{'RSS kB':>8} {'PSS kB':>8} {'private kB':>11}"
+    )
+    typer.echo(header)
+    typer.echo("-" * len(header))
+    for r in results:
+        typer.echo(
+            f"{r['name']:<7} {r['prewarm']!s:<8} {r['size']:>5} "
+            f"{r['median_ms']:>10.3f} {r['p95_ms']:>10.3f} "
+            f"{r['rss_kb']:>8} {r['pss_kb']:>8} {r['private_kb']:>11}"
+        )
+
+
+if __name__ == "__main__":
+    app()
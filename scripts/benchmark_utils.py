@@ -0,0 +1,32 @@
+"""
+Helpers shared by the benchmark scripts, to measure and summarize latencies the
+same way in all of them.
+"""
+
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any
+
+
+def measure(func: Callable[[], Any], *, repeat: int) -> list[float]:
+    """Call `func` `repeat` times, return the latencies in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def summarize(name: str, timings: list[float], **extra: Any) -> dict[str, Any]:
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))]
+    return {
+        "name": name,
+        **extra,
+        "min_ms": ordered[0],
+        "median_ms": statistics.median(ordered),
+        "p95_ms": p95,
+        "runs": len(ordered),
+    }
@@ -0,0 +1,187 @@
+import json
+from pathlib import Path
+
+import pytest
+import typer
+from typer import _answers
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+ANSWERS = """
+name = "Camila"
+force = true
+
+[deploy]
+region = "eu-west-1"
+name = "Rick"
+"""
+
+
+app = typer.Typer(answers_option=True, chain=True)
+
+
+@app.command()
+def hello(name: str = typer.Option(..., prompt=True)):
+    print(f"Hello {name}")
+
+
+@app.command()
+def deploy(
+    region: str = typer.Option(..., prompt=True),
+    name: str = typer.Option(..., prompt=True),
+    force: bool = typer.Option(False, prompt=True),
+    retries: int = typer.Option(..., prompt=True),
+):
+    print(f"Deploy {name} to {region}, force={force}, retries={retries}")
+
+
+@pytest.fixture
+def answers_file(tmp_path: Path) -> Path:
+    path = tmp_path / "answers.toml"
+    path.write_text(ANSWERS)
+    return path
+
+
+def test_answers_option(answers_file: Path):
+    result = runner.invoke(app, ["--answers", str(answers_file), "hello"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "Hello Camila\n"
+
+
+def test_answers_command_table(answers_file: Path):
+    # retries has no answer, it's still prompted
+    result = runner.invoke(app, ["--answers", str(answers_file), "deploy"], input="3\n")
+    assert result.exit_code == 0, result.output
+    assert "Retries: 3" in result.output
+    assert "Deploy Rick to eu-west-1, force=True, retries=3" in result.output
+
+
+def test_answers_parsed_once_per_invocation(
+    answers_file: Path, monkeypatch: pytest.MonkeyPatch
+):
+    loaded = []
+    load_answers = _answers.load_answers
+
+    def spy(path):
+        loaded.append(path)
+        return load_answers(path)
+
+    monkeypatch.setattr(_answers, "load_answers", spy)
+    result = runner.invoke(
+        app,
+        ["--answers", str(answers_file), "hello", "deploy", "--retries", "1"],
+    )
+    assert result.exit_code == 0, result.output
+    assert result.output == (
+        "Hello Camila\nDeploy Rick to eu-west-1, force=True, retries=1\n"
+    )
+    assert loaded == [str(answers_file)]
+
+
+def test_answers_shared_by_batch(answers_file: Path, monkeypatch: pytest.MonkeyPatch):
+    loaded = []
+    load_answers = _answers.load_answers
+
+    def spy(path):
+        loaded.append(path)
+        return load_answers(path)
+
+    monkeypatch.setattr(_answers, "load_answers", spy)
+    results = app.invoke_many(
+        [["--answers", str(answers_file), "hello"]] * 3, prog_name="app"
+    )
+    assert [result.output for result in results] == ["Hello Camila\n"] * 3
+    assert loaded == [str(answers_file)]
+
+
+def test_answers_envvar(answers_file: Path):
+    app = typer.Typer(answers_option=True)
+
+    @app.command()
+    def main(name: str = typer.Option(..., prompt=True)):
+        print(f"Hello {name}")
+
+    result = runner.invoke(app, [], env={"TYPER_ANSWERS": str(answers_file)})
+    assert result.exit_code == 0, result.output
+    assert result.output == "Hello Camila\n"
+
+
+def test_answers_envvar_without_option(answers_file: Path):
+    app = typer.Typer()
+
+    @app.command()
+    def main(force: bool = typer.Option(False, prompt="Really?")):
+        print(f"force={force}")
+
+    result = runner.invoke(
+        app, [], input="n\n", env={"TYPER_ANSWERS": str(answers_file)}
+    )
+    assert result.exit_code == 0, result.output
+    assert result.output == "Really? [y/N]: n\nforce=False\n"
+
+
+def test_answers_envvar_missing_file_without_option(tmp_path: Path):
+    app = typer.Typer()
+
+    @app.command()
+    def main(name: str = typer.Option(..., prompt=True)):
+        print(f"Hello {name}")
+
+    missing = str(tmp_path / "missing.toml")
+    result = runner.invoke(app, [], input="Rick\n", env={"TYPER_ANSWERS": missing})
+    assert result.exit_code == 0, result.output
+    assert result.output.endswith("Hello Rick\n")
+
+
+def test_answers_json(tmp_path: Path):
+    path = tmp_path / "answers.json"
+    path.write_text(json.dumps({"user-name": "Morty", "count": 2}))
+    app = typer.Typer(answers_option=True)
+
+    @app.command()
+    def main(
+        user_name: str = typer.Option(..., prompt=True),
+        count: int = typer.Option(..., prompt=True),
+    ):
+        print(f"{user_name} {count}")
+
+    result = runner.invoke(app, ["--answers", str(path)])
+    assert result.exit_code == 0, result.output
+    assert result.output == "Morty 2\n"
+
+
+def test_answers_invalid_value(tmp_path: Path):
+    path = tmp_path / "answers.toml"
+    path.write_text('count = "many"\n')
+    app = typer.Typer(answers_option=True)
+
+    @app.command()
+    def main(count: int = typer.Option(..., prompt=True)):
+        pass  # pragma: no cover
+
+    result = runner.invoke(app, ["--answers", str(path)])
+    assert result.exit_code == 2
+    assert "'many' is not a valid integer" in result.output
+
+
+def test_answers_invalid_file(tmp_path: Path):
+    path = tmp_path / "answers.toml"
+    path.write_text("name = \n")
+    result = runner.invoke(app, ["--answers", str(path), "hello"])
+    assert result.exit_code == 1
+    assert "Could not open file" in result.output
+
+
+def test_answers_command_line_wins(answers_file: Path):
+    result = runner.invoke(
+        app, ["--answers", str(answers_file), "hello", "--name", "Summer"]
+    )
+    assert result.exit_code == 0, result.output
+    assert result.output == "Hello Summer\n"
+
+
+def test_answers_help():
+    result = runner.invoke(app, ["--help"])
+    assert "--answers" in result.output
+    assert "TOML" in result.output
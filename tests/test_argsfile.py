@@ -0,0 +1,87 @@
+from pathlib import Path
+
+import pytest
+import typer
+import typer._argsfile
+from typer._argsfile import split_arguments
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+app = typer.Typer(expand_argsfiles=True)
+
+
+@app.command()
+def main(files: list[Path], verbose: bool = False):
+    print(f"verbose={verbose}")
+    for file in files:
+        print(f"file={file}")
+
+
+def test_newline_argsfile(tmp_path: Path):
+    argsfile = tmp_path / "args.txt"
+    argsfile.write_bytes(b"a.py\r\n\nb c.py\n--verbose\n")
+    result = runner.invoke(app, ["first.py", f"@{argsfile}", "last.py"])
+    assert result.exit_code == 0, result.output
+    assert result.output == (
+        "verbose=True\nfile=first.py\nfile=a.py\nfile=b c.py\nfile=last.py\n"
+    )
+
+
+def test_nul_argsfile(tmp_path: Path):
+    argsfile = tmp_path / "args.txt"
+    argsfile.write_bytes(b"a\nb.py\0c.py\0")
+    result = runner.invoke(app, [f"@{argsfile}"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "verbose=False\nfile=a\nb.py\nfile=c.py\n"
+
+
+def test_argsfile_stdin():
+    result = runner.invoke(app, ["@-"], input="a.py\nb.py\n")
+    assert result.exit_code == 0, result.output
+    assert result.output == "verbose=False\nfile=a.py\nfile=b.py\n"
+
+
+def test_argsfile_many_chunks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(typer._argsfile, "ARGSFILE_CHUNK_SIZE", 7)
+    names = [f"file{i}.py" for i in range(1000)]
+    argsfile = tmp_path / "args.txt"
+    argsfile.write_text("\0".join(names))
+    result = runner.invoke(app, [f"@{argsfile}"])
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines()[1:] == [f"file={name}" for name in names]
+
+
+def test_argsfile_after_double_dash(tmp_path: Path):
+    result = runner.invoke(app, ["--", "@a.txt"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "verbose=False\nfile=@a.txt\n"
+
+
+def test_argsfile_missing(tmp_path: Path):
+    result = runner.invoke(app, [f"@{tmp_path / 'missing.txt'}"])
+    assert result.exit_code == 1
+    assert "missing.txt" in result.output
+
+
+def test_argsfile_disabled(tmp_path: Path):
+    app = typer.Typer()
+
+    @app.command()
+    def main(files: list[Path]):
+        for file in files:
+            print(f"file={file}")
+
+    result = runner.invoke(app, ["@args.txt"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "file=@args.txt\n"
+
+
+def test_split_arguments():
+    assert list(split_arguments([b"a\n", b"b\r", b"\nc"])) == [b"a", b"b", b"c"]
+    assert list(split_arguments([b"a\0\0b", b"\0"])) == [b"a", b"", b"b"]
+    assert list(split_arguments([])) == []
+    # Arguments spanning several chunks, before and after the delimiter is known
+    chunks = [b"ab", b"cd", b"e\nf", b"gh", b"i\nj", b"k"]
+    assert list(split_arguments(chunks)) == [b"abcde", b"fghi", b"jk"]
@@ -0,0 +1,123 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+import typer
+import typer._argsfile
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+app = typer.Typer()
+
+
+@app.command()
+def main(files: list[Path] = typer.Argument(None, stdin=True)):
+    for file in files or []:
+        print(f"file={file}")
+
+
+def test_stdin_lines():
+    result = runner.invoke(app, [], input="a.py\n\nb c.py\n")
+    assert result.exit_code == 0, result.output
+    assert result.output == "file=a.py\nfile=b c.py\n"
+
+
+def test_stdin_nul():
+    app = typer.Typer()
+
+    @app.command()
+    def main(files: list[Path] = typer.Argument(stdin=True, delimiter="\0")):
+        for file in files:
+            print(f"file={file}")
+
+    result = runner.invoke(app, [], input="a\nb.py\0c.py\0")
+    assert result.exit_code == 0, result.output
+    assert result.output == "file=a\nb.py\nfile=c.py\n"
+
+
+def test_stdin_explicit_newline_delimiter():
+    app = typer.Typer()
+
+    @app.command()
+    def main(files: list[Path] = typer.Argument(stdin=True, delimiter="\n")):
+        for file in files:
+            print(f"file={file}")
+
+    result = runner.invoke(app, [], input="a.py\nb.py\n")
+    assert result.exit_code == 0, result.output
+    assert result.output == "file=a.py\nfile=b.py\n"
+
+
+def test_command_line_values_first():
+    result = runner.invoke(app, ["x.py"], input="a.py\n")
+    assert result.exit_code == 0, result.output
+    assert result.output == "file=x.py\n"
+
+
+def test_stdin_empty():
+    result = runner.invoke(app, [], input="")
+    assert result.exit_code == 0, result.output
+    assert result.output == ""
+
+
+def test_stdin_required_empty():
+    app = typer.Typer()
+
+    @app.command()
+    def main(files: list[Path] = typer.Argument(..., stdin=True)):
+        pass  # pragma: no cover
+
+    result = runner.invoke(app, [], input="")
+    assert result.exit_code == 2
+    assert "Missing argument" in result.output
+
+
+def test_stdin_streamed(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(typer._argsfile, "ARGSFILE_CHUNK_SIZE", 4)
+    app = typer.Typer()
+    reads: list[int] = []
+
+    @app.command()
+    def main(numbers: Iterator[int] = typer.Argument(..., stdin=True)):
+        for number in numbers:
+            reads.append(number)
+        print(sum(reads))
+
+    numbers = list(range(200))
+    result = runner.invoke(app, [], input="\n".join(map(str, numbers)))
+    assert result.exit_code == 0, result.output
+    assert reads == numbers
+
+
+def test_stdin_invalid_delimiter():
+    with pytest.raises(ValueError, match="single character"):
+        typer.Argument(stdin=True, delimiter="ab")
+
+
+def test_stdin_not_a_list():
+    app = typer.Typer()
+
+    @app.command()
+    def main(name: str = typer.Argument(stdin=True)):
+        pass  # pragma: no cover
+
+    with pytest.raises(ValueError, match="multiple values"):
+        runner.invoke(app, [], catch_exceptions=False)
+
+
+@pytest.mark.parametrize(
+    ("args", "source"),
+    [([], "PROMPT"), (["x.py"], "COMMANDLINE")],
+)
+def test_stdin_parameter_source(args: list[str], source: str):
+    app = typer.Typer()
+
+    @app.command()
+    def main(ctx: typer.Context, files: list[Path] = typer.Argument(stdin=True)):
+        print(ctx.get_parameter_source("files").name)
+
+    result = runner.invoke(app, args, input="a.py\n")
+    assert result.exit_code == 0, result.output
+    assert result.output == f"{source}\n"
@@ -0,0 +1,208 @@
+import asyncio
+import threading
+from typing import Any
+
+import typer
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+def test_async_command():
+    app = typer.Typer()
+
+    @app.command()
+    async def main(name: str):
+        await asyncio.sleep(0)
+        print(f"Hello {name}")
+
+    result = runner.invoke(app, ["Camila"])
+    assert result.exit_code == 0, result.output
+    assert "Hello Camila" in result.output
+
+
+def test_async_shared_loop_chain():
+    loops: list[asyncio.AbstractEventLoop] = []
+    app = typer.Typer(chain=True)
+
+    @app.callback()
+    async def callback():
+        loops.append(asyncio.get_running_loop())
+
+    @app.command()
+    async def first():
+        loops.append(asyncio.get_running_loop())
+
+    @app.command()
+    def second():
+        loops.append(asyncio.get_event_loop())
+
+    @app.command()
+    async def third():
+        loops.append(asyncio.get_running_loop())
+
+    result = runner.invoke(app, ["first", "second", "third"])
+    assert result.exit_code == 0, result.output
+    assert len(loops) == 4
+    assert len(set(map(id, loops))) == 1
+    assert loops[0].is_closed()
+
+
+def test_async_param_callback():
+    loops: list[asyncio.AbstractEventLoop] = []
+    app = typer.Typer()
+
+    async def name_callback(value: str) -> str:
+        loops.append(asyncio.get_running_loop())
+        return value.upper()
+
+    @app.command()
+    async def main(name: str = typer.Option(..., callback=name_callback)):
+        loops.append(asyncio.get_running_loop())
+        print(f"Hello {name}")
+
+    result = runner.invoke(app, ["--name", "camila"])
+    assert result.exit_code == 0, result.output
+    assert "Hello CAMILA" in result.output
+    assert loops[0] is loops[1]
+
+
+def test_async_result_callback():
+    async def process(results: list[int]):
+        await asyncio.sleep(0)
+        print(f"Total {sum(results)}")
+
+    app = typer.Typer(chain=True, result_callback=process)
+
+    @app.command()
+    async def one() -> int:
+        return 1
+
+    @app.command()
+    async def two() -> int:
+        return 2
+
+    result = runner.invoke(app, ["one", "two"])
+    assert result.exit_code == 0, result.output
+    assert "Total 3" in result.output
+
+
+def test_async_loop_factory():
+    created: list[asyncio.AbstractEventLoop] = []
+
+    def loop_factory() -> asyncio.AbstractEventLoop:
+        loop = asyncio.new_event_loop()
+        created.append(loop)
+        return loop
+
+    app = typer.Typer(loop_factory=loop_factory)
+    sub_app = typer.Typer()
+    app.add_typer(sub_app, name="sub")
+
+    @sub_app.command()
+    async def run():
+        assert asyncio.get_running_loop() is created[0]
+
+    result = runner.invoke(app, ["sub", "run"])
+    assert result.exit_code == 0, result.output
+    assert len(created) == 1
+    assert created[0].is_closed()
+
+
+def test_async_no_loop_for_sync_commands():
+    created: list[asyncio.AbstractEventLoop] = []
+
+    def loop_factory() -> asyncio.AbstractEventLoop:  # pragma: no cover
+        loop = asyncio.new_event_loop()
+        created.append(loop)
+        return loop
+
+    app = typer.Typer(loop_factory=loop_factory)
+
+    @app.command()
+    def main():
+        print("sync")
+
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0, result.output
+    assert created == []
+
+
+def test_async_pending_tasks_cancelled():
+    cancelled: list[bool] = []
+    app = typer.Typer()
+
+    async def background():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    @app.command()
+    async def main():
+        asyncio.get_running_loop().create_task(background())
+        await asyncio.sleep(0)
+
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0, result.output
+    assert cancelled == [True]
+
+
+def test_async_previous_loop_restored():
+    app = typer.Typer()
+
+    @app.command()
+    async def main():
+        await asyncio.sleep(0)
+
+    previous = asyncio.new_event_loop()
+    asyncio.set_event_loop(previous)
+    try:
+        result = runner.invoke(app, [])
+        assert result.exit_code == 0, result.output
+        assert asyncio.get_event_loop() is previous
+    finally:
+        asyncio.set_event_loop(None)
+        previous.close()
+
+
+def test_async_no_previous_loop():
+    app = typer.Typer()
+
+    @app.command()
+    async def main():
+        await asyncio.sleep(0)
+
+    results: list[Any] = []
+
+    def run() -> None:
+        results.append(runner.invoke(app, []))
+        # No loop is left (or created) in a thread that had none
+        try:
+            asyncio.get_event_loop()
+        except RuntimeError as e:
+            results.append(e)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+    assert results[0].exit_code == 0, results[0].output
+    assert isinstance(results[1], RuntimeError)
+
+
+def test_async_sub_app_loop_factory_ignored():
+    def loop_factory() -> asyncio.AbstractEventLoop:  # pragma: no cover
+        raise AssertionError("Only the loop_factory of the app being run is used")
+
+    app = typer.Typer()
+    sub_app = typer.Typer(loop_factory=loop_factory)
+    app.add_typer(sub_app, name="sub")
+
+    @sub_app.command()
+    async def run():
+        print("run")
+
+    result = runner.invoke(app, ["sub", "run"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "run\n"
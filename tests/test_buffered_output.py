@@ -0,0 +1,102 @@
+import errno
+import io
+import sys
+import time
+
+import pytest
+import typer
+from typer._output import _OutputBuffer
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+def test_buffered_output():
+    app = typer.Typer()
+
+    @app.command()
+    def main():
+        output = sys.stdout.buffer
+        with typer.buffered_output():
+            for number in range(1000):
+                typer.echo(number)
+            typer.echo(b"bytes")
+            typer.secho("styled", bold=True)
+            # Nothing was written yet
+            assert output.getvalue() == b""
+        assert output.getvalue() != b""
+
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0, result.output
+    assert result.output == "".join(f"{n}\n" for n in range(1000)) + "bytes\nstyled\n"
+
+
+def test_buffer_size():
+    app = typer.Typer()
+
+    @app.command()
+    def main():
+        output = sys.stdout.buffer
+        with typer.buffered_output(buffer_size=10):
+            typer.echo("12345")
+            assert output.getvalue() == b""
+            typer.echo("67890")
+            assert output.getvalue() == b"12345\n67890\n"
+
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0, result.output
+
+
+def test_flush_interval():
+    app = typer.Typer()
+
+    @app.command()
+    def main():
+        output = sys.stdout.buffer
+        with typer.buffered_output(flush_interval=0.01):
+            typer.echo("periodic")
+            for _ in range(200):  # pragma: no branch
+                if output.getvalue():
+                    break
+                time.sleep(0.01)
+            assert output.getvalue() == b"periodic\n"
+
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0, result.output
+
+
+def test_app_setting():
+    app = typer.Typer(buffered_output=True)
+
+    @app.command()
+    def main():
+        assert isinstance(sys.stdout.buffer, _OutputBuffer)
+        # Nested blocks reuse the same buffer
+        with typer.buffered_output():
+            assert isinstance(sys.stdout.buffer, _OutputBuffer)
+        typer.echo("Hello")
+
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0, result.output
+    assert result.output == "Hello\n"
+
+
+class BrokenPipe(io.RawIOBase):
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data):
+        raise BrokenPipeError(errno.EPIPE, "Broken pipe")
+
+
+def test_broken_pipe(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(sys, "stdout", io.TextIOWrapper(BrokenPipe()))
+    app = typer.Typer(buffered_output=True)
+
+    @app.command()
+    def main():
+        typer.echo("Hello")
+
+    with pytest.raises(SystemExit) as exc_info:
+        typer.main.get_command(app).main([], prog_name="main")
+    assert exc_info.value.code == 1
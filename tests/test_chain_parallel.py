@@ -0,0 +1,245 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import typer
+from typer._chain import ChainedCommandsError
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_results_in_command_line_order(mode: str):
+    results: list = []
+    app = typer.Typer(
+        chain=True,
+        chain_parallel=mode,
+        chain_max_workers=4,
+        result_callback=results.extend,
+    )
+
+    @app.command()
+    def slow(value: int = 1):
+        time.sleep(0.1)
+        return ("slow", value, os.getpid())
+
+    @app.command()
+    def fast(value: int = 2):
+        return ("fast", value, os.getpid())
+
+    result = runner.invoke(app, ["slow", "--value", "3", "fast", "slow"])
+    assert result.exit_code == 0, result.output
+    assert [r[:2] for r in results] == [("slow", 3), ("fast", 2), ("slow", 1)]
+    if mode == "process":
+        assert all(r[2] != os.getpid() for r in results)
+
+
+def test_thread_commands_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+    app = typer.Typer(chain=True, chain_parallel="thread")
+
+    @app.command()
+    def first():
+        barrier.wait()
+
+    @app.command()
+    def second():
+        barrier.wait()
+
+    result = runner.invoke(app, ["first", "second"])
+    assert result.exit_code == 0, result.output
+
+
+def test_single_error_reraised():
+    results: list = []
+    app = typer.Typer(
+        chain=True, chain_parallel="thread", result_callback=results.extend
+    )
+
+    @app.command()
+    def fast():
+        return "fast"
+
+    @app.command()
+    def fail(code: int = 1):
+        raise typer.Exit(code=code)
+
+    result = runner.invoke(app, ["fast", "fail", "--code", "3"])
+    assert result.exit_code == 3
+    assert results == []
+
+
+def test_errors_aggregated():
+    results: list = []
+    app = typer.Typer(
+        chain=True, chain_parallel="thread", result_callback=results.extend
+    )
+
+    @app.command()
+    def fast():
+        return "fast"
+
+    @app.command()
+    def crash():
+        raise ValueError("broken")
+
+    result = runner.invoke(app, ["crash", "fast", "crash"])
+    assert result.exit_code == 1
+    assert "2 chained commands failed:" in result.output
+    assert "crash: ValueError: broken" in result.output
+    assert results == []
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_exit_not_aggregated(mode: str):
+    results: list = []
+    app = typer.Typer(chain=True, chain_parallel=mode, result_callback=results.extend)
+
+    @app.command()
+    def fast():
+        return "fast"
+
+    @app.command()
+    def fail(code: int = 1):
+        raise typer.Exit(code=code)
+
+    @app.command()
+    def crash():
+        raise ValueError("broken")
+
+    result = runner.invoke(app, ["crash", "fast", "fail", "--code", "3"])
+    assert result.exit_code == 3
+    assert "chained commands failed" not in result.output
+    assert results == []
+
+
+def test_process_close_callbacks_run_once(tmp_path):
+    log = tmp_path / "closed.log"
+    app = typer.Typer(chain=True, chain_parallel="process")
+
+    def register(ctx: typer.Context, value: str):
+        def closed():
+            with log.open("a") as f:
+                f.write(f"{value}\n")
+
+        ctx.call_on_close(closed)
+        return value
+
+    @app.command()
+    def first(name: str = typer.Option("first", callback=register)):
+        pass
+
+    @app.command()
+    def second(name: str = typer.Option("second", callback=register)):
+        pass
+
+    result = runner.invoke(app, ["first", "second"])
+    assert result.exit_code == 0, result.output
+    assert sorted(log.read_text().splitlines()) == ["first", "second"]
+
+
+def test_async_commands_in_threads():
+    loops: list[asyncio.AbstractEventLoop] = []
+    app = typer.Typer(chain=True, chain_parallel="thread")
+
+    @app.command()
+    async def first():
+        loops.append(asyncio.get_running_loop())
+        await asyncio.sleep(0.05)
+
+    @app.command()
+    async def second():
+        loops.append(asyncio.get_running_loop())
+        await asyncio.sleep(0.05)
+
+    result = runner.invoke(app, ["first", "second"])
+    assert result.exit_code == 0, result.output
+    assert len(loops) == 2
+    assert all(loop.is_closed() for loop in loops)
+
+
+def test_sequential_without_parallel():
+    order: list[str] = []
+    app = typer.Typer(chain=True)
+
+    @app.command()
+    def first():
+        order.append("first")
+
+    @app.command()
+    def second():
+        order.append("second")
+
+    result = runner.invoke(app, ["second", "first"])
+    assert result.exit_code == 0, result.output
+    assert order == ["second", "first"]
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_usage_error(mode: str):
+    app = typer.Typer(chain=True, chain_parallel=mode)
+
+    @app.command()
+    def first():
+        pass
+
+    @app.command()
+    def second():
+        raise typer.BadParameter("not today")
+
+    result = runner.invoke(app, ["first", "second"])
+    assert result.exit_code == 2
+    assert "Usage: root second" in result.output
+    assert "Invalid value: not today" in result.output
+
+
+def test_errors_keep_tracebacks():
+    app = typer.Typer(chain=True, chain_parallel="process")
+
+    @app.command()
+    def first():
+        raise ValueError("first broken")
+
+    @app.command()
+    def second():
+        raise KeyError("second")
+
+    result = runner.invoke(app, ["first", "second"], standalone_mode=False)
+    error = result.exception
+    assert isinstance(error, ChainedCommandsError)
+    assert isinstance(error.__cause__, ValueError)
+    message = error.format_message()
+    assert "first: ValueError: first broken" in message
+    assert "Traceback (most recent call last):" in message
+    assert 'raise ValueError("first broken")' in message
+
+
+def test_process_concurrent_invocations():
+    app = typer.Typer(chain=True, chain_parallel="process", result_callback=list)
+
+    @app.callback()
+    def main():
+        pass
+
+    @app.command()
+    def echo(value: str):
+        return value
+
+    command = typer.main.get_command(app)
+
+    def run(name: str) -> list:
+        return [
+            command.main(
+                ["echo", f"{name}1", "echo", f"{name}2"], standalone_mode=False
+            )
+            for _ in range(10)
+        ]
+
+    with ThreadPoolExecutor(2) as executor:
+        first, second = executor.map(run, ["Rick", "Morty"])
+    assert first == [["Rick1", "Rick2"]] * 10
+    assert second == [["Morty1", "Morty2"]] * 10
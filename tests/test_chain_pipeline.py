@@ -0,0 +1,212 @@
+import itertools
+from pathlib import Path
+
+import pytest
+import typer
+import typer._chain
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+def test_sequential_pipeline_streams():
+    events: list = []
+    app = typer.Typer(chain=True)
+
+    @app.command()
+    def count(total: int = 5):
+        for i in range(total):
+            events.append(("produce", i))
+            yield i
+
+    @app.command()
+    def double(numbers: typer.PipelineInput[int]):
+        for number in numbers:
+            yield number * 2
+
+    @app.command()
+    def collect(numbers: typer.PipelineInput[int]):
+        for number in numbers:
+            events.append(("consume", number))
+
+    result = runner.invoke(app, ["count", "--total", "3", "double", "collect"])
+    assert result.exit_code == 0, result.output
+    assert events == [
+        ("produce", 0),
+        ("consume", 0),
+        ("produce", 1),
+        ("consume", 2),
+        ("produce", 2),
+        ("consume", 4),
+    ]
+
+
+def test_sequential_pipeline_keeps_file_open(tmp_path: Path):
+    path = tmp_path / "lines.txt"
+    path.write_text("a\nb\n")
+    lines: list[str] = []
+    app = typer.Typer(chain=True)
+
+    @app.command()
+    def read(file: typer.FileText):
+        yield from file
+
+    @app.command()
+    def collect(items: typer.PipelineInput[str]):
+        lines.extend(items)
+
+    result = runner.invoke(app, ["read", str(path), "collect"])
+    assert result.exit_code == 0, result.output
+    assert lines == ["a\n", "b\n"]
+
+
+def test_pipeline_input_needs_previous_command():
+    app = typer.Typer(chain=True)
+
+    @app.command()
+    def double(numbers: typer.PipelineInput[int]):
+        yield from numbers  # pragma: no cover
+
+    @app.command()
+    def collect(numbers: typer.PipelineInput[int]):
+        pass  # pragma: no cover
+
+    result = runner.invoke(app, ["double", "collect"])
+    assert result.exit_code == 2
+    assert "reads the output of a previous chained command" in result.output
+
+
+def test_pipeline_input_not_a_cli_parameter():
+    app = typer.Typer(chain=True)
+
+    @app.command()
+    def count():
+        yield 1  # pragma: no cover
+
+    @app.command()
+    def double(numbers: typer.PipelineInput[int]):
+        yield from numbers  # pragma: no cover
+
+    result = runner.invoke(app, ["double", "--help"])
+    assert result.exit_code == 0, result.output
+    assert "numbers" not in result.output.lower()
+
+
+def test_thread_pipeline(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(typer._chain, "PIPELINE_QUEUE_SIZE", 2)
+    events: list = []
+    results: list = []
+    app = typer.Typer(
+        chain=True, chain_parallel="thread", result_callback=results.extend
+    )
+
+    @app.command()
+    def count(total: int = 5):
+        for i in range(total):
+            events.append(("produce", i))
+            yield i
+
+    @app.command()
+    def double(numbers: typer.PipelineInput[int]):
+        for number in numbers:
+            yield number * 2
+
+    @app.command()
+    def collect(numbers: typer.PipelineInput[int]):
+        for number in numbers:
+            events.append(("consume", number))
+
+    result = runner.invoke(app, ["count", "--total", "50", "double", "collect"])
+    assert result.exit_code == 0, result.output
+    consumed = [number for kind, number in events if kind == "consume"]
+    assert consumed == [i * 2 for i in range(50)]
+    # Bounded by the queues between the 3 commands
+    lag = 0
+    max_lag = 0
+    for kind, _ in events:
+        lag += 1 if kind == "produce" else -1
+        max_lag = max(max_lag, lag)
+    assert max_lag <= 8
+    assert len(results) == 3
+
+
+def test_thread_pipeline_consumer_stops_early():
+    received: list[int] = []
+    app = typer.Typer(chain=True, chain_parallel="thread")
+
+    @app.command()
+    def forever():
+        yield from itertools.count()
+
+    @app.command()
+    def head(numbers: typer.PipelineInput[int], size: int = 3):
+        received.extend(itertools.islice(numbers, size))
+
+    result = runner.invoke(app, ["forever", "head", "--size", "4"])
+    assert result.exit_code == 0, result.output
+    assert received == [0, 1, 2, 3]
+
+
+def test_thread_pipeline_producer_error():
+    app = typer.Typer(chain=True, chain_parallel="thread")
+    received: list[int] = []
+
+    @app.command()
+    def produce():
+        yield 1
+        raise ValueError("broken")
+
+    @app.command()
+    def consume(numbers: typer.PipelineInput[int]):
+        received.extend(numbers)
+
+    result = runner.invoke(app, ["produce", "consume"])
+    assert isinstance(result.exception, ValueError)
+    assert received == [1]
+
+
+def test_pipeline_input_without_chain():
+    app = typer.Typer()
+
+    @app.command()
+    def first():
+        pass  # pragma: no cover
+
+    @app.command()
+    def second(numbers: typer.PipelineInput[int]):
+        pass  # pragma: no cover
+
+    result = runner.invoke(app, ["second"])
+    assert result.exit_code == 2
+    assert "reads the output of a previous chained command" in result.output
+
+
+def test_process_pipeline_runs_in_threads():
+    received: list[int] = []
+    app = typer.Typer(chain=True, chain_parallel="process")
+
+    @app.command()
+    def count(total: int = 5):
+        yield from range(total)
+
+    @app.command()
+    def collect(numbers: typer.PipelineInput[int]):
+        received.extend(numbers)
+
+    with pytest.warns(UserWarning, match="are run in threads"):
+        result = runner.invoke(app, ["count", "--total", "3", "collect"])
+    assert result.exit_code == 0, result.output
+    # Run in this process
+    assert received == [0, 1, 2]
+
+
+def test_pipeline_input_not_truth_tested():
+    class Items:
+        def __bool__(self):
+            raise ValueError("ambiguous")
+
+        def __iter__(self):
+            return iter([1, 2])
+
+    assert list(typer.PipelineInput(Items())) == [1, 2]
+    assert list(typer.PipelineInput()) == []
@@ -0,0 +1,67 @@
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "fork"), reason="Serving an app requires fork()"
+)
+
+
+def _accepts_connections(path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(path))
+        except (FileNotFoundError, ConnectionRefusedError):
+            return False
+    return True
+
+
+def test_serve_shim(tmp_path: Path):
+    socket_path = tmp_path / "app.sock"
+    shim = tmp_path / "app"
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "coverage",
+            "run",
+            "-m",
+            "doctyper",
+            "tests/assets/cli/app_other_name.py",
+            "utils",
+            "serve",
+            "--socket",
+            str(socket_path),
+            "--shim",
+            str(shim),
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        encoding="utf-8",
+    )
+    try:
+        deadline = time.monotonic() + 10
+        while not (shim.exists() and _accepts_connections(socket_path)):
+            assert server.poll() is None, server.communicate()
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        served = subprocess.run(
+            [str(shim), "--name", "Camila"], capture_output=True, encoding="utf-8"
+        )
+    finally:
+        server.terminate()
+        server.communicate()
+    assert served.returncode == 0, served.stderr
+    assert served.stdout == "Hello Camila\n"
+    # Without the server, the shim runs the app itself, with this package
+    assert "'-m', 'doctyper'" in shim.read_text()
+    result = subprocess.run(
+        [str(shim), "--name", "Rick"], capture_output=True, encoding="utf-8"
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == "Hello Rick\n"
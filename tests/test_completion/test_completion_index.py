@@ -0,0 +1,148 @@
+import click
+import typer
+import typer.core
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+def complete(app: typer.Typer, words: str) -> str:
+    result = runner.invoke(
+        app,
+        [],
+        prog_name="index",
+        env={
+            "_INDEX_COMPLETE": "complete_bash",
+            "COMP_WORDS": words,
+            "COMP_CWORD": str(len(words.split(" ")) - 1),
+        },
+    )
+    return result.output
+
+
+app = typer.Typer()
+
+
+@app.command()
+def zeta(
+    name: str = typer.Option("", "--name", "-n"),
+    secret: str = typer.Option("", hidden=True),
+    force: bool = False,
+):
+    pass  # pragma: no cover
+
+
+@app.command()
+def delete():
+    pass  # pragma: no cover
+
+
+@app.command()
+def delete_all():
+    pass  # pragma: no cover
+
+
+@app.command()
+def alpha():
+    pass  # pragma: no cover
+
+
+@app.command(hidden=True)
+def delete_hidden():
+    pass  # pragma: no cover
+
+
+def test_commands_keep_declaration_order():
+    assert complete(app, "index ") == "zeta\ndelete\ndelete-all\nalpha\n"
+
+
+def test_commands_prefix():
+    assert complete(app, "index del") == "delete\ndelete-all\n"
+
+
+def test_commands_no_match():
+    assert complete(app, "index x") == "\n"
+
+
+def test_options_prefix():
+    assert complete(app, "index zeta --") == "--name\n--force\n--no-force\n--help\n"
+    assert complete(app, "index zeta --n") == "--name\n--no-force\n"
+    assert complete(app, "index zeta -") == (
+        "--name\n-n\n--force\n--no-force\n--help\n"
+    )
+
+
+def test_options_already_used():
+    assert complete(app, "index zeta --name x --") == "--force\n--no-force\n--help\n"
+
+
+def test_index_updated_on_add_command():
+    group = typer.main.get_group(app)
+    ctx = click.Context(group)
+    assert [name for name, _ in group._complete_visible_commands(ctx, "b")] == []
+    group.add_command(click.Command("beta"))
+    assert [name for name, _ in group._complete_visible_commands(ctx, "b")] == ["beta"]
+    group.commands["bravo"] = click.Command("bravo")
+    assert [name for name, _ in group._complete_visible_commands(ctx, "b")] == [
+        "beta",
+        "bravo",
+    ]
+
+
+def test_dynamic_group_not_indexed():
+    class DynamicGroup(typer.core.TyperGroup):
+        def list_commands(self, ctx: click.Context) -> list[str]:
+            return ["dynamic"]
+
+        def get_command(self, ctx: click.Context, name: str) -> click.Command | None:
+            return click.Command(name) if name == "dynamic" else None
+
+    app = typer.Typer(cls=DynamicGroup)
+
+    @app.callback()
+    def callback():
+        pass  # pragma: no cover
+
+    @app.command()
+    def static():
+        pass  # pragma: no cover
+
+    assert complete(app, "index ") == "dynamic\n"
+
+
+def test_index_updated_on_replaced_command():
+    group = typer.main.get_group(app)
+    ctx = click.Context(group)
+    assert [name for name, _ in group._complete_visible_commands(ctx, "b")] == []
+    # Same number of commands, but a different one
+    del group.commands["alpha"]
+    group.commands["beta"] = click.Command("beta")
+    assert [name for name, _ in group._complete_visible_commands(ctx, "b")] == ["beta"]
+    beta = click.Command("beta", hidden=True)
+    group.commands["beta"] = beta
+    assert [name for name, _ in group._complete_visible_commands(ctx, "b")] == []
+
+
+def test_index_reused_until_commands_change():
+    group = typer.main.get_group(app)
+    index = group._get_command_index()
+    assert group._get_command_index() is index
+    group.commands = {"beta": click.Command("beta")}
+    assert group._get_command_index() is not index
+    assert [name for name, _ in group._get_command_index().prefix("")] == ["beta"]
+
+
+def test_index_updated_on_replaced_param():
+    command = typer.main.get_command(app).commands["zeta"]  # type: ignore[attr-defined]
+    ctx = click.Context(command)
+    names = [
+        name for name, _ in typer.core._get_option_index(command, ctx=ctx).prefix("--f")
+    ]
+    assert names == ["--force"]
+    # Same number of params, but a different one
+    position = next(i for i, p in enumerate(command.params) if p.name == "force")
+    command.params[position] = click.Option(["--fast"])
+    names = [
+        name for name, _ in typer.core._get_option_index(command, ctx=ctx).prefix("--f")
+    ]
+    assert names == ["--fast"]
@@ -1,6 +1,12 @@
 import os
 import subprocess
 import sys
+from pathlib import Path
+
+import click
+import pytest
+from typer._completion_classes import COMPLETE_TYPES_ENV_VAR, BashComplete
+from typer.models import TyperPath
 
 from . import path_example as mod
 
@@ -28,3 +34,118 @@ def test_completion_path_bash():
         },
     )
     assert result.returncode == 0
+
+
+def _complete(path_type: TyperPath, incomplete: str) -> list[str]:
+    ctx = click.Context(click.Command("main"))
+    param = click.Argument(["p"], type=path_type)
+    return [item.value for item in path_type.shell_complete(ctx, param, incomplete)]
+
+
+def _make_tree(tmp_path: Path) -> None:
+    (tmp_path / "alpha.txt").touch()
+    (tmp_path / "alpine").mkdir()
+    (tmp_path / "alpine" / "inner.txt").touch()
+    (tmp_path / "beta.txt").touch()
+    (tmp_path / ".hidden").touch()
+
+
+def test_completion_path_entries(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    _make_tree(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    alpine = f"alpine{os.sep}"
+    assert _complete(TyperPath(), "") == ["alpha.txt", alpine, "beta.txt"]
+    assert _complete(TyperPath(), "al") == ["alpha.txt", alpine]
+    assert _complete(TyperPath(), ".") == [".hidden"]
+    assert _complete(TyperPath(), "alpine/") == [os.path.join("alpine", "inner.txt")]
+    assert _complete(TyperPath(), "missing/") == []
+
+
+def test_completion_path_absolute(tmp_path: Path):
+    _make_tree(tmp_path)
+    assert _complete(TyperPath(), f"{tmp_path}{os.sep}b") == [
+        str(tmp_path / "beta.txt")
+    ]
+
+
+def test_completion_path_dirs_only(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    _make_tree(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    assert _complete(TyperPath(file_okay=False), "al") == [f"alpine{os.sep}"]
+
+
+def test_completion_path_limit(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    for i in range(20):
+        (tmp_path / f"file{i}").touch()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(TyperPath, "completion_limit", 5)
+    # The first entries in sorted order, not the first ones listed
+    assert _complete(TyperPath(), "file") == sorted(f"file{i}" for i in range(20))[:5]
+
+
+def test_completion_path_types(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    _make_tree(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    ctx = click.Context(click.Command("main"))
+    param = click.Argument(["p"], type=TyperPath())
+    items = TyperPath().shell_complete(ctx, param, "al")
+    assert [item.type for item in items] == ["file", "dir"]
+
+
+def _complete_script(shell: str, incomplete: str, **env: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-m", "coverage", "run", mod.__file__, " "],
+        capture_output=True,
+        encoding="utf-8",
+        env={
+            **os.environ,
+            "_PATH_EXAMPLE.PY_COMPLETE": f"complete_{shell}",
+            "COMP_WORDS": f"path_example.py {incomplete}",
+            "COMP_CWORD": "1",
+            "_TYPER_COMPLETE_ARGS": f"path_example.py {incomplete}",
+            **env,
+        },
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+def test_completion_path_bash_types(tmp_path: Path):
+    _make_tree(tmp_path)
+    prefix = f"{tmp_path}{os.sep}al"
+    assert _complete_script("bash", prefix, _TYPER_COMPLETE_TYPES="1") == (
+        f"file,{tmp_path / 'alpha.txt'}\ndir,{tmp_path / 'alpine'}{os.sep}\n"
+    )
+    # Scripts installed by older versions only read the values
+    assert _complete_script("bash", prefix) == (
+        f"{tmp_path / 'alpha.txt'}\n{tmp_path / 'alpine'}{os.sep}\n"
+    )
+
+
+def test_completion_path_zsh_files(tmp_path: Path):
+    _make_tree(tmp_path)
+    assert _complete_script("zsh", f"{tmp_path}{os.sep}al") == "_files\n"
+    assert _complete_script("zsh", f"{tmp_path}{os.sep}alpi") == "_files -/\n"
+
+
+def test_completion_path_bash_types_read_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    for i in range(20):
+        (tmp_path / f"file{i}").touch()
+    command = click.Command("main", params=[click.Argument(["p"], type=TyperPath())])
+    monkeypatch.setenv("COMP_WORDS", f"main {tmp_path}{os.sep}file")
+    monkeypatch.setenv("COMP_CWORD", "1")
+    monkeypatch.setenv(COMPLETE_TYPES_ENV_VAR, "1")
+    reads: list[str] = []
+    getenv = os.getenv
+
+    def counting_getenv(key: str, default: str | None = None) -> str | None:
+        if key == COMPLETE_TYPES_ENV_VAR:
+            reads.append(key)
+        return getenv(key, default)
+
+    monkeypatch.setattr(os, "getenv", counting_getenv)
+    output = BashComplete(command, {}, "main", "_MAIN_COMPLETE").complete()
+    assert output.count("file,") == 20
+    assert len(reads) == 1
@@ -0,0 +1,81 @@
+import pytest
+import typer
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+# The names produced by complete_name() in the last completion
+produced: list[str] = []
+
+
+def complete_name(incomplete: str):
+    for i in range(1000):
+        name = f"name{i}"
+        produced.append(name)
+        yield name, f"Name {i}"
+
+
+app = typer.Typer()
+
+
+@app.command()
+def main(name: str = typer.Option("", autocompletion=complete_name)):
+    pass  # pragma: no cover
+
+
+def complete(shell: str, max_items: str = "") -> str:
+    produced.clear()
+    result = runner.invoke(
+        app,
+        [],
+        prog_name="stream",
+        env={
+            "_STREAM_COMPLETE": f"complete_{shell}",
+            "COMP_WORDS": "stream --name name",
+            "COMP_CWORD": "2",
+            "_TYPER_COMPLETE_ARGS": "stream --name name",
+            "_TYPER_COMPLETE_FISH_ACTION": "get-args",
+            "_TYPER_COMPLETE_WORD_TO_COMPLETE": "name",
+            "TYPER_COMPLETE_MAX_ITEMS": max_items,
+        },
+    )
+    return result.output
+
+
+@pytest.mark.parametrize("shell", ["bash", "zsh", "fish", "powershell"])
+def test_completion_stream_all(shell: str):
+    output = complete(shell)
+    assert len(produced) == 1000
+    assert "name999" in output
+
+
+def test_completion_stream_max_items_bash():
+    output = complete("bash", max_items="3")
+    assert output == "name0\nname1\nname2\n"
+    # The generator is not consumed after the limit
+    assert len(produced) == 4
+
+
+def test_completion_stream_max_items_zsh():
+    output = complete("zsh", max_items="2")
+    assert output == (
+        """_arguments '*: :(("name0":"Name 0"\n"name1":"Name 1"))'"""
+        "; _message -r 'Showing only the first 2 completions'\n"
+    )
+
+
+def test_completion_stream_max_items_fish():
+    output = complete("fish", max_items="2")
+    assert output == "name0\tName 0\nname1\tName 1\n"
+
+
+def test_completion_stream_max_items_powershell():
+    output = complete("powershell", max_items="1")
+    assert output == "name0:::Name 0\n"
+
+
+@pytest.mark.parametrize("max_items", ["0", "-1", "invalid"])
+def test_completion_stream_max_items_ignored(max_items: str):
+    output = complete("bash", max_items=max_items)
+    assert output.count("\n") == 1000
@@ -0,0 +1,203 @@
+import bz2
+import gzip
+import lzma
+import typing
+from pathlib import Path
+from typing import Annotated
+
+import pytest
+import typer
+from typer._compression import Compression
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+COMPRESSORS = {"gz": gzip.compress, "bz2": bz2.compress, "xz": lzma.compress}
+DECOMPRESSORS = {"gz": gzip.decompress, "bz2": bz2.decompress, "xz": lzma.decompress}
+
+
+@pytest.mark.parametrize("extension", ["gz", "bz2", "xz"])
+def test_read_auto(tmp_path: Path, extension: str):
+    # The extension doesn't matter when reading, only the content
+    path = tmp_path / "records.dat"
+    path.write_bytes(COMPRESSORS[extension](b"first\nsecond\n"))
+    app = typer.Typer()
+
+    @app.command()
+    def main(records: Annotated[typer.FileText, typer.Argument(compression="auto")]):
+        for line in records:
+            print(line.rstrip().upper())
+
+    result = runner.invoke(app, [str(path)])
+    assert result.exit_code == 0, result.output
+    assert result.output == "FIRST\nSECOND\n"
+
+
+def test_read_auto_plain(tmp_path: Path):
+    path = tmp_path / "records.txt.gz"
+    path.write_text("plain\n")
+    app = typer.Typer()
+
+    @app.command()
+    def main(records: Annotated[typer.FileText, typer.Argument(compression="auto")]):
+        print(records.read().rstrip())
+
+    result = runner.invoke(app, [str(path)])
+    assert result.exit_code == 0, result.output
+    assert result.output == "plain\n"
+
+
+def test_read_stdin():
+    app = typer.Typer()
+
+    @app.command()
+    def main(
+        data: Annotated[typer.FileBinaryRead, typer.Option(compression="auto")] = "-",
+    ):
+        return data.read()
+
+    result = runner.invoke(
+        app, [], input=gzip.compress(b"from stdin"), standalone_mode=False
+    )
+    assert result.exit_code == 0, result.output
+    assert result.return_value == b"from stdin"
+    result = runner.invoke(app, [], input=b"plain stdin", standalone_mode=False)
+    assert result.exit_code == 0, result.output
+    assert result.return_value == b"plain stdin"
+
+
+@pytest.mark.parametrize("extension", ["gz", "bz2", "xz"])
+def test_write_auto(tmp_path: Path, extension: str):
+    path = tmp_path / f"out.txt.{extension}"
+    app = typer.Typer()
+
+    @app.command()
+    def main(
+        out: Annotated[
+            typer.FileTextWrite,
+            typer.Option(compression="auto", compresslevel=1, buffer_size=4),
+        ],
+    ):
+        for number in range(3):
+            out.write(f"line {number}\n")
+
+    result = runner.invoke(app, ["--out", str(path)])
+    assert result.exit_code == 0, result.output
+    assert DECOMPRESSORS[extension](path.read_bytes()) == b"line 0\nline 1\nline 2\n"
+
+
+def test_write_auto_plain(tmp_path: Path):
+    path = tmp_path / "out.txt"
+    app = typer.Typer()
+
+    @app.command()
+    def main(
+        out: Annotated[typer.FileBinaryWrite, typer.Argument(compression="auto")],
+    ):
+        out.write(b"plain")
+
+    result = runner.invoke(app, [str(path)])
+    assert result.exit_code == 0, result.output
+    assert path.read_bytes() == b"plain"
+
+
+def test_write_explicit_atomic(tmp_path: Path):
+    path = tmp_path / "out"
+    app = typer.Typer()
+
+    @app.command()
+    def main(
+        out: Annotated[
+            typer.FileBinaryWrite, typer.Argument(compression="xz", atomic=True)
+        ],
+    ):
+        out.write(b"data")
+        assert not path.exists()
+
+    result = runner.invoke(app, [str(path)])
+    assert result.exit_code == 0, result.output
+    assert lzma.decompress(path.read_bytes()) == b"data"
+
+
+def test_append_gzip_member(tmp_path: Path):
+    path = tmp_path / "log.gz"
+    path.write_bytes(gzip.compress(b"first\n"))
+    app = typer.Typer()
+
+    @app.command()
+    def main(
+        log: Annotated[
+            typer.FileTextWrite, typer.Argument(mode="a", compression="auto")
+        ],
+    ):
+        log.write("second\n")
+
+    result = runner.invoke(app, [str(path)])
+    assert result.exit_code == 0, result.output
+    assert gzip.decompress(path.read_bytes()) == b"first\nsecond\n"
+
+
+def test_write_stdout():
+    app = typer.Typer()
+
+    @app.command()
+    def main(
+        out: Annotated[typer.FileBinaryWrite, typer.Argument(compression="gzip")],
+    ):
+        out.write(b"to stdout")
+
+    result = runner.invoke(app, ["-"])
+    assert result.exit_code == 0, result.output
+    assert gzip.decompress(result.stdout_bytes) == b"to stdout"
+
+
+def test_missing_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.chdir(tmp_path)
+    app = typer.Typer()
+
+    @app.command()
+    def main(data: Annotated[typer.FileText, typer.Argument(compression="auto")]):
+        pass  # pragma: no cover
+
+    result = runner.invoke(app, ["missing.gz"])
+    assert result.exit_code == 2
+    assert "'missing.gz': No such file or directory" in result.output
+
+
+def test_unsupported_compression():
+    with pytest.raises(ValueError, match="Unsupported compression: 'zip'"):
+        typer.Option(compression="zip")  # type: ignore[arg-type]
+
+
+def test_compression_type_hints():
+    # The Literal of the compressions is available at runtime
+    assert typing.get_type_hints(typer.Option)["compression"] == (Compression | None)
+    assert typing.get_type_hints(typer.Argument)["compression"] == (Compression | None)
+
+
+@pytest.mark.parametrize(
+    ("compression", "compresslevel"), [("gzip", 10), ("xz", -1), ("bz2", 0)]
+)
+def test_invalid_compresslevel(compression: str, compresslevel: int):
+    with pytest.raises(ValueError, match="Unsupported compression level"):
+        typer.Option(compression=compression, compresslevel=compresslevel)
+
+
+def test_invalid_compresslevel_auto(tmp_path: Path):
+    app = typer.Typer()
+
+    @app.command()
+    def main(
+        output: Annotated[
+            typer.FileTextWrite, typer.Argument(compression="auto", compresslevel=0)
+        ],
+    ):
+        output.write("data\n")
+
+    result = runner.invoke(app, [str(tmp_path / "out.gz")])
+    assert result.exit_code == 0, result.output
+    assert gzip.decompress((tmp_path / "out.gz").read_bytes()) == b"data\n"
+    result = runner.invoke(app, [str(tmp_path / "out.bz2")])
+    assert result.exit_code == 2
+    assert "Unsupported compression level for bz2: 0" in result.output
+    assert not (tmp_path / "out.bz2").exists()
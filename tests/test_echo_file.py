@@ -0,0 +1,129 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+CONTENT = b"".join(f"line {n}\n".encode() for n in range(10_000))
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    path = tmp_path / "source.txt"
+    path.write_bytes(CONTENT)
+    return path
+
+
+def test_echo_file_cli_runner(source: Path):
+    app = typer.Typer()
+
+    @app.command()
+    def main(path: Path):
+        typer.echo("before")
+        assert typer.echo_file(path) == len(CONTENT)
+        typer.echo("after")
+
+    result = runner.invoke(app, [str(source)])
+    assert result.exit_code == 0, result.output
+    assert result.stdout == "before\n" + CONTENT.decode() + "after\n"
+
+
+def test_echo_file_to_file(
+    source: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    calls = []
+    sendfile = os.sendfile
+
+    def spy(*args):
+        calls.append(args)
+        return sendfile(*args)
+
+    monkeypatch.setattr(os, "sendfile", spy)
+    target = tmp_path / "target.txt"
+    with target.open("w") as stdout:
+        monkeypatch.setattr(sys, "stdout", stdout)
+        print("before")
+        assert typer.echo_file(str(source)) == len(CONTENT)
+        print("after")
+    assert calls
+    assert target.read_bytes() == b"before\n" + CONTENT + b"after\n"
+
+
+def test_echo_file_descriptor_position(
+    source: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    target = tmp_path / "target.txt"
+    fd = os.open(source, os.O_RDONLY)
+    try:
+        os.lseek(fd, 5, os.SEEK_SET)
+        with target.open("w") as stdout:
+            monkeypatch.setattr(sys, "stdout", stdout)
+            assert typer.echo_file(fd) == len(CONTENT) - 5
+        # The file descriptor is left open, at the end of the file
+        assert os.lseek(fd, 0, os.SEEK_CUR) == len(CONTENT)
+    finally:
+        os.close(fd)
+    assert target.read_bytes() == CONTENT[5:]
+
+
+def test_echo_file_buffered_output(
+    source: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    target = tmp_path / "target.txt"
+    with target.open("w") as stdout:
+        monkeypatch.setattr(sys, "stdout", stdout)
+        with typer.buffered_output():
+            typer.echo("before")
+            typer.echo_file(source)
+            typer.echo("after")
+    assert target.read_bytes() == b"before\n" + CONTENT + b"after\n"
+
+
+def test_echo_file_from_pipe(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"piped data\n")
+    os.close(write_fd)
+    target = tmp_path / "target.txt"
+    try:
+        with target.open("w") as stdout:
+            monkeypatch.setattr(sys, "stdout", stdout)
+            assert typer.echo_file(read_fd) == 11
+    finally:
+        os.close(read_fd)
+    assert target.read_bytes() == b"piped data\n"
+
+
+def test_echo_file_unsupported_fallback(
+    source: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    def unsupported(*args):
+        raise OSError(22, "Invalid argument")
+
+    monkeypatch.setattr(os, "sendfile", unsupported)
+    target = tmp_path / "target.txt"
+    with target.open("w") as stdout:
+        monkeypatch.setattr(sys, "stdout", stdout)
+        assert typer.echo_file(source) == len(CONTENT)
+    assert target.read_bytes() == CONTENT
+
+
+def test_echo_file_broken_pipe(source: Path, monkeypatch: pytest.MonkeyPatch):
+    read_fd, write_fd = os.pipe()
+    os.close(read_fd)
+    with os.fdopen(write_fd, "w") as stdout:
+        monkeypatch.setattr(sys, "stdout", stdout)
+        with pytest.raises(BrokenPipeError):
+            typer.echo_file(source)
+        monkeypatch.undo()
+
+
+def test_echo_file_err(source: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    target = tmp_path / "target.txt"
+    with target.open("w") as stderr:
+        monkeypatch.setattr(sys, "stderr", stderr)
+        typer.echo_file(source, err=True)
+    assert target.read_bytes() == CONTENT
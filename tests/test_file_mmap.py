@@ -0,0 +1,101 @@
+from pathlib import Path
+from typing import Annotated
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+def test_file_mmap(tmp_path: Path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"\x00\x01header and some records")
+    views: list[memoryview] = []
+    app = typer.Typer()
+
+    @app.command()
+    def main(data: typer.FileMmap):
+        assert isinstance(data, memoryview)
+        assert data.readonly
+        views.append(data)
+        print(data.nbytes, bytes(data[2:8]))
+
+    result = runner.invoke(app, [str(path)])
+    assert result.exit_code == 0, result.output
+    assert result.output == "25 b'header'\n"
+    # The view is released when the command finishes
+    with pytest.raises(ValueError):
+        views[0].tobytes()
+
+
+def test_file_mmap_slices_outlive_command(tmp_path: Path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"abcdef")
+    slices: list[memoryview] = []
+    app = typer.Typer()
+
+    @app.command()
+    def main(data: typer.FileMmap):
+        slices.append(data[1:3])
+
+    result = runner.invoke(app, [str(path)])
+    assert result.exit_code == 0, result.output
+    assert slices[0].tobytes() == b"bc"
+    slices[0].release()
+
+
+def test_file_mmap_empty_file(tmp_path: Path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    app = typer.Typer()
+
+    @app.command()
+    def main(data: Annotated[typer.FileMmap, typer.Option()]):
+        print(data.nbytes)
+
+    result = runner.invoke(app, ["--data", str(path)])
+    assert result.exit_code == 0, result.output
+    assert result.output == "0\n"
+
+
+def test_file_mmap_stdin():
+    app = typer.Typer()
+
+    @app.command()
+    def main(data: typer.FileMmap):
+        print(bytes(data))
+
+    result = runner.invoke(app, ["-"], input=b"from stdin")
+    assert result.exit_code == 0, result.output
+    assert result.output == "b'from stdin'\n"
+
+
+def test_file_mmap_redirected_stdin(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"skipped:mapped")
+    app = typer.Typer()
+
+    @app.command()
+    def main(data: typer.FileMmap):
+        return bytes(data)
+
+    with path.open("rb") as file:
+        file.read(len("skipped:"))
+        monkeypatch.setattr("click.get_binary_stream", lambda name: file)
+        result = runner.invoke(app, ["-"], standalone_mode=False)
+    assert result.exit_code == 0, result.output
+    assert result.return_value == b"mapped"
+
+
+def test_file_mmap_missing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.chdir(tmp_path)
+    app = typer.Typer()
+
+    @app.command()
+    def main(data: typer.FileMmap):
+        pass  # pragma: no cover
+
+    result = runner.invoke(app, ["missing.bin"])
+    assert result.exit_code == 2
+    assert "'missing.bin': No such file or directory" in result.output
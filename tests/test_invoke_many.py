@@ -0,0 +1,105 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import typer
+
+app = typer.Typer()
+
+
+@app.command()
+def hello(name: str, count: int = 1):
+    for _ in range(count):
+        print(f"Hello {name}")
+    return name.upper()
+
+
+@app.command()
+def fail(code: int):
+    typer.echo("failing", err=True)
+    raise typer.Exit(code=code)
+
+
+@app.command()
+def crash():
+    raise ValueError("broken")
+
+
+@app.command()
+def pid():
+    return os.getpid()
+
+
+def test_invoke_many_sequential():
+    results = app.invoke_many(
+        [["hello", "Camila"], ["fail", "3"], ["crash"], ["hello", "--count", "x"]],
+        prog_name="app",
+    )
+    hello, fail, crash, usage = results
+    assert hello.args == ["hello", "Camila"]
+    assert hello.exit_code == 0
+    assert hello.output == "Hello Camila\n"
+    assert hello.return_value == "CAMILA"
+    assert hello.exception is None
+    assert fail.exit_code == 3
+    assert fail.output == ""
+    assert fail.stderr == "failing\n"
+    assert crash.exit_code == 1
+    assert isinstance(crash.exception, ValueError)
+    assert usage.exit_code == 2
+    assert "Usage: app hello" in usage.stderr
+    assert "Invalid value" in usage.stderr
+
+
+def test_invoke_many_help():
+    (result,) = app.invoke_many([["hello", "--help"]], prog_name="app")
+    assert result.exit_code == 0
+    assert "Usage: app hello" in result.output
+
+
+def test_invoke_many_threads():
+    names = [f"name{i}" for i in range(50)]
+    results = app.invoke_many(
+        [["hello", name, "--count", "20"] for name in names], workers=8
+    )
+    assert [result.return_value for result in results] == [n.upper() for n in names]
+    for name, result in zip(names, results, strict=True):
+        assert result.output == f"Hello {name}\n" * 20
+
+
+def test_invoke_many_processes():
+    results = app.invoke_many(
+        [["pid"], ["hello", "Rick"], ["pid"], ["fail", "4"]], workers=2, mode="process"
+    )
+    assert [result.exit_code for result in results] == [0, 0, 0, 4]
+    assert results[0].return_value != os.getpid()
+    assert results[1].output == "Hello Rick\n"
+    assert results[3].stderr == "failing\n"
+
+
+def test_invoke_many_raise_exceptions():
+    with pytest.raises(ValueError, match="broken"):
+        app.invoke_many([["crash"]], catch_exceptions=False)
+
+
+def test_invoke_many_restores_streams(capsys: pytest.CaptureFixture[str]):
+    app.invoke_many([["hello", "Camila"]])
+    print("after")
+    assert capsys.readouterr().out == "after\n"
+
+
+def test_invoke_many_processes_concurrent_batches():
+
+    def run_batches(name: str) -> list[str]:
+        outputs = []
+        for _ in range(5):
+            results = app.invoke_many(
+                [["hello", f"{name}{i}"] for i in range(8)], workers=2, mode="process"
+            )
+            outputs.extend(result.output for result in results)
+        return outputs
+
+    with ThreadPoolExecutor(2) as executor:
+        first, second = executor.map(run_batches, ["Rick", "Morty"])
+    assert first == [f"Hello Rick{i}\n" for i in range(8)] * 5
+    assert second == [f"Hello Morty{i}\n" for i in range(8)] * 5
@@ -0,0 +1,84 @@
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import typer
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+def test_lazy_argument():
+    app = typer.Typer()
+    events: list[str] = []
+
+    class Number(int):
+        def __new__(cls, value: str) -> "Number":
+            events.append(f"convert {value}")
+            return super().__new__(cls, int(value))
+
+    @app.command()
+    def main(numbers: Iterator[Number] = typer.Argument(parser=Number)):
+        assert not isinstance(numbers, (list, tuple))
+        events.append("start")
+        for number in numbers:
+            events.append(f"use {number}")
+
+    result = runner.invoke(app, ["1", "2"])
+    assert result.exit_code == 0, result.output
+    assert events == ["start", "convert 1", "use 1", "convert 2", "use 2"]
+
+
+def test_lazy_argument_invalid_value():
+    app = typer.Typer()
+    used: list[int] = []
+
+    @app.command()
+    def main(numbers: Iterable[int]):
+        used.extend(numbers)
+
+    result = runner.invoke(app, ["1", "x"])
+    assert result.exit_code == 2
+    assert "'x' is not a valid integer" in result.output
+    assert used == [1]
+
+
+def test_lazy_argument_required():
+    app = typer.Typer()
+
+    @app.command()
+    def main(numbers: Iterable[int]):
+        pass  # pragma: no cover
+
+    result = runner.invoke(app, [])
+    assert result.exit_code == 2
+    assert "Missing argument 'NUMBERS...'" in result.output
+
+
+def test_lazy_option_with_convertor():
+    app = typer.Typer()
+
+    @app.command()
+    def main(paths: Iterable[Path] = typer.Option(None, "--path")):
+        if paths is None:
+            print("no paths")
+            return
+        print([str(path) for path in paths if isinstance(path, Path)])
+
+    result = runner.invoke(app, ["--path", "a", "--path", "b"])
+    assert result.exit_code == 0, result.output
+    assert "['a', 'b']" in result.output
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0, result.output
+    assert "no paths" in result.output
+
+
+def test_lazy_option_default():
+    app = typer.Typer()
+
+    @app.command()
+    def main(numbers: Iterator[int] = typer.Option([1, 2], "--number")):
+        print(sum(numbers))
+
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0, result.output
+    assert result.output == "3\n"
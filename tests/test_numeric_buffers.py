@@ -0,0 +1,150 @@
+import array
+from typing import Annotated
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+def test_array_argument():
+    app = typer.Typer()
+
+    @app.command()
+    def main(ids: Annotated[array.array, typer.Argument(typecode="q")]):
+        assert isinstance(ids, array.array)
+        print(ids.typecode, ids.tolist(), sum(ids))
+
+    result = runner.invoke(app, ["--", "1", "2", "-3", "4_000"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "q [1, 2, -3, 4000] 4000\n"
+
+
+def test_array_option_default_typecode():
+    app = typer.Typer()
+
+    @app.command()
+    def main(coords: Annotated[array.array | None, typer.Option("--coord")] = None):
+        print(coords)
+
+    result = runner.invoke(app, ["--coord", "1.5", "--coord", "-2"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "array('d', [1.5, -2.0])\n"
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0, result.output
+    assert result.output == "None\n"
+
+
+def test_array_option_envvar():
+    app = typer.Typer()
+
+    @app.command()
+    def main(
+        ids: Annotated[array.array, typer.Option(typecode="i", envvar="IDS")] = (),  # type: ignore[assignment]
+    ):
+        print(ids.tolist())
+
+    result = runner.invoke(app, [], env={"IDS": "3 4 5"})
+    assert result.exit_code == 0, result.output
+    assert result.output == "[3, 4, 5]\n"
+
+
+def test_memoryview():
+    app = typer.Typer()
+
+    @app.command()
+    def main(values: Annotated[memoryview, typer.Argument(typecode="f")]):
+        print(values.format, values.itemsize, values.tolist())
+
+    result = runner.invoke(app, ["0.5", "2"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "f 4 [0.5, 2.0]\n"
+
+
+def test_invalid_integer():
+    app = typer.Typer()
+
+    @app.command()
+    def main(ids: Annotated[array.array, typer.Argument(typecode="q")]):
+        pass  # pragma: no cover
+
+    result = runner.invoke(app, ["1", "1.5", "x"])
+    assert result.exit_code == 2
+    assert "'1.5' is not a valid integer." in result.output
+
+
+def test_invalid_float():
+    app = typer.Typer()
+
+    @app.command()
+    def main(values: array.array):
+        pass  # pragma: no cover
+
+    result = runner.invoke(app, ["1", "nope"])
+    assert result.exit_code == 2
+    assert "'nope' is not a valid float." in result.output
+
+
+def test_out_of_range():
+    app = typer.Typer()
+
+    @app.command()
+    def main(values: Annotated[array.array, typer.Argument(typecode="B")]):
+        pass  # pragma: no cover
+
+    result = runner.invoke(app, ["255", "256"])
+    assert result.exit_code == 2
+    assert "'256' is out of range for the type code 'B'." in result.output
+
+
+def test_missing_argument():
+    app = typer.Typer()
+
+    @app.command()
+    def main(values: array.array):
+        pass  # pragma: no cover
+
+    result = runner.invoke(app, [])
+    assert result.exit_code == 2
+    assert "Missing argument 'VALUES...'" in result.output
+
+
+@pytest.mark.parametrize("typecode", ["u", "qQ", "lL", ""])
+def test_unsupported_typecode(typecode: str):
+    with pytest.raises(ValueError, match="Unsupported numeric array type code"):
+        typer.Argument(typecode=typecode)
+
+
+def test_help():
+    app = typer.Typer()
+
+    @app.command()
+    def main(ids: Annotated[array.array, typer.Argument(typecode="q")]):
+        pass  # pragma: no cover
+
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    assert "IDS..." in result.output
+
+
+def test_ndarray():
+    numpy = pytest.importorskip("numpy")
+    import numpy.typing as npt
+
+    app = typer.Typer()
+
+    @app.command()
+    def main(
+        values: numpy.ndarray,
+        ids: Annotated[npt.NDArray[numpy.int32] | None, typer.Option("--id")] = None,
+    ):
+        print(values.dtype, values.tolist())
+        print(
+            ids.dtype if ids is not None else None,
+            ids.tolist() if ids is not None else None,
+        )
+
+    result = runner.invoke(app, ["1.5", "2", "--id", "3", "--id", "4"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "float64 [1.5, 2.0]\nint32 [3, 4]\n"
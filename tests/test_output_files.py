@@ -0,0 +1,186 @@
+import os
+import threading
+from pathlib import Path
+from typing import Annotated
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+def test_buffer_size(tmp_path: Path):
+    path = tmp_path / "out.txt"
+    app = typer.Typer()
+
+    @app.command()
+    def main(
+        out: Annotated[typer.FileTextWrite, typer.Argument(buffer_size=1024 * 1024)],
+    ):
+        for number in range(1000):
+            out.write(f"{number}\n")
+        # Everything is still in the buffer
+        assert path.read_text() == ""
+
+    result = runner.invoke(app, [str(path)])
+    assert result.exit_code == 0, result.output
+    assert path.read_text() == "".join(f"{number}\n" for number in range(1000))
+
+
+def test_buffer_size_stdout():
+    app = typer.Typer()
+
+    @app.command()
+    def main(out: Annotated[typer.FileBinaryWrite, typer.Option(buffer_size=16)] = "-"):
+        out.write(b"to stdout " * 10)
+
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0, result.output
+    assert result.stdout == "to stdout " * 10
+
+
+def test_write_behind(tmp_path: Path):
+    path = tmp_path / "out.bin"
+    threads: list[threading.Thread] = []
+    app = typer.Typer()
+
+    @app.command()
+    def main(
+        out: Annotated[
+            typer.FileBinaryWrite,
+            typer.Option(buffer_size=64, write_behind=True, mode="ab"),
+        ],
+    ):
+        threads.extend(
+            thread
+            for thread in threading.enumerate()
+            if thread.name == "typer-write-behind"
+        )
+        for number in range(1000):
+            out.write(b"%d\n" % number)
+
+    path.write_bytes(b"start\n")
+    result = runner.invoke(app, ["--out", str(path)])
+    assert result.exit_code == 0, result.output
+    assert path.read_bytes() == b"start\n" + b"".join(
+        b"%d\n" % number for number in range(1000)
+    )
+    assert len(threads) == 1
+    assert not threads[0].is_alive()
+
+
+@pytest.mark.skipif(not os.path.exists("/dev/full"), reason="Requires /dev/full")
+def test_write_behind_error():
+    app = typer.Typer()
+
+    @app.command()
+    def main(
+        out: Annotated[typer.FileBinaryWrite, typer.Argument(write_behind=True)],
+    ):
+        out.write(b"no space left")
+
+    result = runner.invoke(app, ["/dev/full"])
+    assert isinstance(result.exception, OSError)
+
+
+def test_fsync_atomic(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    path = tmp_path / "out.txt"
+    synced: list[int] = []
+    original_fsync = os.fsync
+
+    def fsync(fd: int) -> None:
+        synced.append(fd)
+        original_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", fsync)
+    app = typer.Typer()
+
+    @app.command()
+    def main(
+        out: Annotated[typer.FileTextWrite, typer.Argument(fsync=True, atomic=True)],
+    ):
+        out.write("durable")
+        assert not path.exists()
+
+    result = runner.invoke(app, [str(path)])
+    assert result.exit_code == 0, result.output
+    assert path.read_text() == "durable"
+    assert len(synced) == 1
+
+
+def test_atomic_directory(tmp_path: Path):
+    target = tmp_path / "site"
+    target.mkdir()
+    (target / "old.html").write_text("old")
+    app = typer.Typer()
+
+    @app.command()
+    def main(output: Annotated[Path, typer.Argument(atomic=True, file_okay=False)]):
+        assert output.parent == tmp_path
+        assert output != target
+        assert list(output.iterdir()) == []
+        (output / "index.html").write_text("new")
+        assert (target / "old.html").exists()
+
+    result = runner.invoke(app, [str(target)])
+    assert result.exit_code == 0, result.output
+    assert [path.name for path in target.iterdir()] == ["index.html"]
+    assert [path.name for path in tmp_path.iterdir()] == ["site"]
+
+
+def test_atomic_directory_new(tmp_path: Path):
+    target = tmp_path / "site"
+    app = typer.Typer()
+
+    @app.command()
+    def main(output: Annotated[Path, typer.Option(atomic=True, file_okay=False)]):
+        (output / "index.html").write_text("new")
+        raise typer.Exit()
+
+    result = runner.invoke(app, ["--output", str(target)])
+    assert result.exit_code == 0, result.output
+    assert (target / "index.html").read_text() == "new"
+
+
+def test_atomic_directory_failure(tmp_path: Path):
+    target = tmp_path / "site"
+    target.mkdir()
+    (target / "old.html").write_text("old")
+    app = typer.Typer()
+
+    @app.command()
+    def main(output: Annotated[Path, typer.Argument(atomic=True, file_okay=False)]):
+        (output / "index.html").write_text("new")
+        raise typer.Exit(code=1)
+
+    result = runner.invoke(app, [str(target)])
+    assert result.exit_code == 1
+    assert [path.name for path in target.iterdir()] == ["old.html"]
+    assert [path.name for path in tmp_path.iterdir()] == ["site"]
+
+
+def test_atomic_path_requires_directory():
+    app = typer.Typer()
+
+    @app.command()
+    def main(output: Annotated[Path, typer.Argument(atomic=True)]):
+        pass  # pragma: no cover
+
+    with pytest.raises(ValueError, match="file_okay=False"):
+        runner.invoke(app, ["out"], catch_exceptions=False)
+
+
+def test_read_write_plain_file(tmp_path: Path):
+    path = tmp_path / "log.txt"
+    path.write_text("first\n")
+    app = typer.Typer()
+
+    @app.command()
+    def main(log: Annotated[typer.FileText, typer.Argument(mode="r+")]):
+        assert log.read() == "first\n"
+        log.write("second\n")
+
+    result = runner.invoke(app, [str(path)])
+    assert result.exit_code == 0, result.output
+    assert path.read_text() == "first\nsecond\n"
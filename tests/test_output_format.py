@@ -0,0 +1,160 @@
+import asyncio
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+def get_app() -> typer.Typer:
+    app = typer.Typer()
+
+    @app.command(output_format="table")
+    def users(count: int = 3) -> Iterator[dict[str, Any]]:
+        for index in range(count):
+            yield {"name": f"user{index}", "age": 20 + index, "admin": index == 0}
+
+    return app
+
+
+def test_table():
+    result = runner.invoke(get_app(), [])
+    assert result.exit_code == 0, result.output
+    assert result.output == (
+        "name   age  admin\n"
+        "-----  ---  -----\n"
+        "user0   20  True\n"
+        "user1   21  False\n"
+        "user2   22  False\n"
+    )
+
+
+def test_table_sample(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("typer._records.TABLE_SAMPLE_SIZE", 1)
+    app = typer.Typer()
+
+    @app.command(output_format="table")
+    def main():
+        yield {"name": "Rick", "note": None}
+        # The widths come from the first record only
+        yield {"name": "Morty Smith", "note": "late"}
+
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0, result.output
+    assert result.output == "name  note\n----  ----\nRick\nMor…  late\n"
+
+
+def test_json():
+    result = runner.invoke(get_app(), ["--output", "json", "--count", "2"])
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output) == [
+        {"name": "user0", "age": 20, "admin": True},
+        {"name": "user1", "age": 21, "admin": False},
+    ]
+    result = runner.invoke(get_app(), ["--output", "json", "--count", "0"])
+    assert result.output == "[]\n"
+
+
+def test_jsonl():
+    result = runner.invoke(get_app(), ["--output", "JSONL", "--count", "2"])
+    assert result.exit_code == 0, result.output
+    assert result.output == (
+        '{"name": "user0", "age": 20, "admin": true}\n'
+        '{"name": "user1", "age": 21, "admin": false}\n'
+    )
+
+
+@pytest.mark.parametrize(("output_format", "separator"), [("csv", ","), ("tsv", "\t")])
+def test_delimited(output_format: str, separator: str):
+    result = runner.invoke(get_app(), ["--output", output_format, "--count", "2"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "\n".join(
+        separator.join(row)
+        for row in [
+            ["name", "age", "admin"],
+            ["user0", "20", "True"],
+            ["user1", "21", "False"],
+            [],
+        ]
+    )
+
+
+def test_records_types():
+    @dataclass
+    class User:
+        name: str
+
+    class Point(NamedTuple):
+        x: int
+        y: int
+
+    app = typer.Typer()
+
+    @app.command(output_format="jsonl")
+    def main(kind: str):
+        if kind == "dataclass":
+            return [User("Camila")]
+        if kind == "namedtuple":
+            return (Point(1, 2) for _ in range(2))
+        if kind == "single":
+            return {"path": typer.Typer}
+        return None
+
+    result = runner.invoke(app, ["dataclass"])
+    assert result.output == '{"name": "Camila"}\n'
+    result = runner.invoke(app, ["namedtuple"])
+    assert result.output == '{"x": 1, "y": 2}\n{"x": 1, "y": 2}\n'
+    result = runner.invoke(app, ["single"])
+    assert result.output == '{"path": "<class \'typer.main.Typer\'>"}\n'
+    result = runner.invoke(app, ["none"])
+    assert result.output == ""
+
+
+def test_parallel_over():
+    app = typer.Typer()
+
+    @app.command(output_format="jsonl", parallel_over="names", workers=2)
+    def main(names: list[str]):
+        for name in names:
+            yield {"name": name}
+
+    result = runner.invoke(app, ["a", "b", "c"])
+    assert result.exit_code == 0, result.output
+    assert result.output == '{"name": "a"}\n{"name": "b"}\n{"name": "c"}\n'
+
+
+def test_help():
+    result = runner.invoke(get_app(), ["--help"])
+    assert result.exit_code == 0, result.output
+    assert "--output" in result.output
+    assert "jsonl" in result.output
+
+
+def test_async_generator():
+    app = typer.Typer()
+
+    @app.command(output_format="jsonl")
+    async def main():
+        for index in range(2):
+            await asyncio.sleep(0)
+            yield {"index": index}
+
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0, result.output
+    assert result.output == '{"index": 0}\n{"index": 1}\n'
+
+
+def test_output_option_collision():
+    app = typer.Typer()
+
+    @app.command(output_format="json")
+    def main(output: str = typer.Option("out.txt")):
+        pass  # pragma: no cover
+
+    with pytest.raises(ValueError, match="output_format adds the option --output"):
+        runner.invoke(app, [], catch_exceptions=False)
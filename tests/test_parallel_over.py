@@ -0,0 +1,166 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import click
+import pytest
+import typer
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+def test_parallel_over_threads():
+    app = typer.Typer()
+    threads = set()
+
+    @app.command(parallel_over="files", workers=3)
+    def main(files: list[Path], suffix: str = "!"):
+        threads.add(threading.get_ident())
+        # The first chunk finishes last
+        time.sleep(0.05 * len(files))
+        for file in files:
+            print(f"{file}{suffix}")
+        return [file.name for file in files]
+
+    result = runner.invoke(
+        app, ["a", "b", "c", "d", "e", "f", "g", "--suffix", "?"], standalone_mode=False
+    )
+    assert result.exit_code == 0, result.output
+    assert result.output == "a?\nb?\nc?\nd?\ne?\nf?\ng?\n"
+    assert result.return_value == [["a", "b", "c"], ["d", "e"], ["f", "g"]]
+    assert len(threads) == 3
+
+
+def test_parallel_over_jobs():
+    app = typer.Typer()
+
+    @app.command(parallel_over="names")
+    def main(names: list[str]):
+        return names
+
+    result = runner.invoke(app, ["-j", "2", "a", "b", "c"], standalone_mode=False)
+    assert result.exit_code == 0, result.output
+    assert result.return_value == [["a", "b"], ["c"]]
+    result = runner.invoke(app, ["--jobs", "1", "a", "b", "c"], standalone_mode=False)
+    assert result.exit_code == 0, result.output
+    assert result.return_value == [["a", "b", "c"]]
+    result = runner.invoke(app, ["-j", "0", "a"])
+    assert result.exit_code == 2
+    assert "Invalid value for '--jobs'" in result.output
+
+
+def test_parallel_over_option_without_values():
+    app = typer.Typer()
+
+    @app.command(parallel_over="name")
+    def main(name: list[str] | None = typer.Option(None)):
+        print(name)
+
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0, result.output
+    assert result.output == "None\n"
+
+
+def test_parallel_over_context():
+    app = typer.Typer()
+
+    @app.command(parallel_over="names", workers=2)
+    def main(ctx: typer.Context, names: list[str]):
+        assert click.get_current_context() is ctx
+        print(ctx.info_name, names)
+
+    result = runner.invoke(app, ["a", "b"], prog_name="prog")
+    assert result.exit_code == 0, result.output
+    assert result.output == "prog ['a']\nprog ['b']\n"
+
+
+def test_parallel_over_error():
+    app = typer.Typer()
+
+    @app.command(parallel_over="numbers", workers=3)
+    def main(numbers: list[int]):
+        print(numbers)
+        if 2 in numbers:
+            typer.echo("Two is not allowed", err=True)
+            raise typer.Exit(code=3)
+
+    result = runner.invoke(app, ["1", "2", "3"])
+    assert result.exit_code == 3
+    assert result.stdout == "[1]\n[2]\n"
+    assert result.stderr == "Two is not allowed\n"
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires fork()")
+def test_parallel_over_processes():
+    app = typer.Typer()
+
+    @app.command(parallel_over="names", parallel_mode="process", workers=2)
+    def main(names: list[str]):
+        print(names)
+        return os.getpid()
+
+    result = runner.invoke(app, ["a", "b", "c"], standalone_mode=False)
+    assert result.exit_code == 0, result.output
+    assert result.output == "['a', 'b']\n['c']\n"
+    assert os.getpid() not in result.return_value
+
+
+def test_parallel_over_help():
+    app = typer.Typer()
+
+    @app.command(parallel_over="names")
+    def main(names: list[str]):
+        pass  # pragma: no cover
+
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    assert "--jobs" in result.output
+    assert "-j" in result.output
+    assert "The number of parallel" in result.output
+    assert "(one per CPU)" in result.output
+
+
+def test_parallel_over_not_a_list():
+    app = typer.Typer()
+
+    @app.command(parallel_over="name")
+    def main(name: str):
+        pass  # pragma: no cover
+
+    with pytest.raises(ValueError, match="must have multiple values: name"):
+        runner.invoke(app, ["Camila"], catch_exceptions=False)
+
+
+def test_parallel_over_missing_parameter():
+    app = typer.Typer()
+
+    @app.command(parallel_over="files")
+    def main(names: list[str]):
+        pass  # pragma: no cover
+
+    with pytest.raises(ValueError, match="parameter not found: files"):
+        runner.invoke(app, ["Camila"], catch_exceptions=False)
+
+
+def test_parallel_over_processes_concurrent_invocations():
+    app = typer.Typer()
+
+    @app.command(parallel_over="names", workers=2, parallel_mode="process")
+    def main(names: list[str]):
+        return names
+
+    command = typer.main.get_command(app)
+
+    def run(name: str) -> list:
+        return [
+            command.main([f"{name}1", f"{name}2"], standalone_mode=False)
+            for _ in range(10)
+        ]
+
+    with ThreadPoolExecutor(2) as executor:
+        first, second = executor.map(run, ["Rick", "Morty"])
+    assert first == [[["Rick1"], ["Rick2"]]] * 10
+    assert second == [[["Morty1"], ["Morty2"]]] * 10
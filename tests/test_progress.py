@@ -0,0 +1,117 @@
+import sys
+import threading
+import time
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+def test_no_op_off_terminal():
+    app = typer.Typer()
+
+    @app.command()
+    def main():
+        with typer.progress() as progress:
+            assert not any(
+                thread.name == "typer-progress" for thread in threading.enumerate()
+            )
+            task = progress.add_task("Counting", total=10)
+            for _ in range(10):
+                task.advance()
+            assert list(progress.track(range(3))) == [0, 1, 2]
+        print(task.completed, progress.tasks[1].completed, progress.tasks[1].total)
+
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0, result.output
+    assert result.stdout == "10 3 3\n"
+    assert result.stderr == ""
+
+
+def test_log_interval():
+    app = typer.Typer()
+
+    @app.command()
+    def main():
+        with typer.progress(log_interval=0.01) as progress:
+            task = progress.add_task("Downloading", total=4)
+            task.advance(2)
+            time.sleep(0.1)
+            task.advance(2)
+            unknown = progress.add_task("Scanning")
+            unknown.update(completed=7, description="Scanned")
+
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0, result.output
+    lines = result.stderr.splitlines()
+    assert "Downloading: 2/4 (50%)" in lines
+    assert lines[-2:] == ["Downloading: 4/4 (100%)", "Scanned: 7"]
+
+
+def test_threads():
+    app = typer.Typer()
+
+    @app.command()
+    def main():
+        with typer.progress() as progress:
+            task = progress.add_task("Counting")
+
+            def work():
+                for _ in range(10_000):
+                    task.advance()
+
+            threads = [threading.Thread(target=work) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        print(task.completed)
+
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0, result.output
+    assert result.stdout == "40000\n"
+
+
+def test_rich_terminal(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("typer.rich_utils.FORCE_TERMINAL", True)
+    app = typer.Typer()
+
+    @app.command()
+    def main():
+        with typer.progress(refresh_per_second=100) as progress:
+            for _ in progress.track(range(1000), "Processing"):
+                pass
+            time.sleep(0.05)
+        assert not any(
+            thread.name == "typer-progress" for thread in threading.enumerate()
+        )
+
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0, result.output
+    assert "Processing" in result.stderr
+    assert "100%" in result.stderr
+
+
+def test_rich_progress_not_imported_off_terminal(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delitem(sys.modules, "rich.progress", raising=False)
+    app = typer.Typer()
+
+    @app.command()
+    def main():
+        with typer.progress() as progress:
+            progress.add_task("Counting").advance()
+
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0, result.output
+    assert "rich.progress" not in sys.modules
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"refresh_per_second": 0}, {"refresh_per_second": -1}, {"log_interval": 0}],
+)
+def test_invalid_rates(kwargs: dict):
+    with pytest.raises(ValueError, match="must be positive"):
+        typer.progress(**kwargs)
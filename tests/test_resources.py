@@ -0,0 +1,285 @@
+import threading
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated
+
+import click
+import pytest
+import typer
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+class Database:
+    def __init__(self, events: list[str]) -> None:
+        self.events = events
+        self.events.append("open")
+
+    def close(self) -> None:
+        self.events.append("close")
+
+
+def test_context_class():
+    app = typer.Typer()
+
+    @app.command()
+    def main(ctx: typer.Context):
+        assert isinstance(ctx, typer.Context)
+
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0, result.output
+
+
+def test_depends_shared_by_chained_commands():
+    events: list[str] = []
+
+    def get_db():
+        db = Database(events)
+        yield db
+        db.close()
+
+    app = typer.Typer(chain=True)
+
+    @app.callback()
+    def callback(db: Annotated[Database, typer.Depends(get_db)]):
+        events.append(f"callback {id(db)}")
+
+    @app.command()
+    def first(db: Database = typer.Depends(get_db)):
+        events.append(f"first {id(db)}")
+
+    @app.command()
+    def second(ctx: typer.Context, db: Annotated[Database, typer.Depends(get_db)]):
+        assert ctx.get_resource(get_db) is db
+        events.append(f"second {id(db)}")
+
+    result = runner.invoke(app, ["first", "second"])
+    assert result.exit_code == 0, result.output
+    assert events[0] == "open"
+    assert events[-1] == "close"
+    assert len(set(events[1:-1])) == 3
+    assert len({event.split()[1] for event in events[1:-1]}) == 1
+
+
+def test_depends_per_invocation():
+    events: list[str] = []
+
+    def get_db():
+        db = Database(events)
+        yield db
+        db.close()
+
+    app = typer.Typer()
+
+    @app.command()
+    def main(db: Annotated[Database, typer.Depends(get_db)]):
+        pass
+
+    runner.invoke(app, [])
+    runner.invoke(app, [])
+    assert events == ["open", "close", "open", "close"]
+
+
+def test_depends_nested_and_context():
+    events: list[str] = []
+
+    def get_db(ctx: typer.Context):
+        events.append(f"db {ctx.info_name}")
+        return Database(events)
+
+    def get_repository(db: Annotated[Database, typer.Depends(get_db)]):
+        return ("repository", db)
+
+    app = typer.Typer()
+
+    @app.command()
+    def main(
+        repository: tuple[str, Database] = typer.Depends(get_repository),
+        db: Database = typer.Depends(get_db),
+    ):
+        assert repository[1] is db
+        print("done")
+
+    result = runner.invoke(app, [], prog_name="prog")
+    assert result.exit_code == 0, result.output
+    assert result.output == "done\n"
+    assert events == ["db prog", "open"]
+
+
+def test_depends_in_param_callback():
+    events: list[str] = []
+
+    def get_db():
+        db = Database(events)
+        yield db
+        db.close()
+
+    def check_name(ctx: typer.Context, value: str):
+        ctx.get_resource(get_db).events.append(f"check {value}")
+        return value
+
+    app = typer.Typer()
+
+    @app.command()
+    def main(
+        name: Annotated[str, typer.Argument(callback=check_name)],
+        db: Annotated[Database, typer.Depends(get_db)],
+    ):
+        db.events.append(f"hello {name}")
+
+    result = runner.invoke(app, ["Camila"])
+    assert result.exit_code == 0, result.output
+    assert events == ["open", "check Camila", "hello Camila", "close"]
+
+
+def test_depends_process_scope_in_batch():
+    events: list[str] = []
+
+    def get_db():
+        db = Database(events)
+        yield db
+        db.close()
+
+    app = typer.Typer()
+
+    @app.command()
+    def main(
+        name: str, db: Annotated[Database, typer.Depends(get_db, scope="process")]
+    ):
+        return id(db)
+
+    results = app.invoke_many([["Camila"], ["Rick"], ["Morty"]], workers=2)
+    assert [result.exit_code for result in results] == [0, 0, 0]
+    assert len({result.return_value for result in results}) == 1
+    assert events == ["open", "close"]
+
+
+def test_provider_yielding_twice():
+    def get_db():
+        yield 1
+        yield 2
+
+    app = typer.Typer()
+
+    @app.command()
+    def main(db: Annotated[int, typer.Depends(get_db)]):
+        pass
+
+    with pytest.raises(RuntimeError, match="didn't stop after yielding"):
+        runner.invoke(app, [], catch_exceptions=False)
+
+
+def test_executor():
+    executors: list[ThreadPoolExecutor] = []
+    app = typer.Typer(chain=True)
+
+    @app.callback()
+    def callback(ctx: typer.Context):
+        executors.append(ctx.executor)
+
+    @app.command()
+    def first(ctx: typer.Context):
+        executors.append(ctx.executor)
+        print(
+            ctx.executor.submit(threading.get_ident).result() != threading.get_ident()
+        )
+
+    @app.command()
+    def second():
+        executors.append(click.get_current_context().executor)
+
+    result = runner.invoke(app, ["first", "second"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "True\n"
+    assert len(executors) == 3
+    assert len(set(executors)) == 1
+    with pytest.raises(RuntimeError):
+        executors[0].submit(print)
+
+
+def test_executor_shared_in_batch():
+    app = typer.Typer()
+
+    @app.command()
+    def main(name: str, ctx: typer.Context):
+        return ctx.executor
+
+    results = app.invoke_many([["Camila"], ["Rick"]], workers=2)
+    executors = {result.return_value for result in results}
+    assert len(executors) == 1
+    with pytest.raises(RuntimeError):
+        executors.pop().submit(print)
+
+
+def test_concurrent_batches():
+    events: list[str] = []
+    started = threading.Barrier(2, timeout=5)
+    closed: list[Database] = []
+
+    def get_db():
+        db = Database(events)
+        yield db
+        closed.append(db)
+        db.close()
+
+    app = typer.Typer()
+
+    @app.command()
+    def main(
+        name: str, db: Annotated[Database, typer.Depends(get_db, scope="process")]
+    ):
+        if name == "wait":
+            started.wait()
+        elif name == "slow":
+            started.wait()
+            # The other batch finished in the meantime
+            time.sleep(0.1)
+        assert db not in closed
+        print(name)
+        return id(db)
+
+    with ThreadPoolExecutor(2) as executor:
+        quick = executor.submit(app.invoke_many, [["wait"]])
+        slow = executor.submit(app.invoke_many, [["slow"], ["after"]], workers=2)
+        quick_results, slow_results = quick.result(), slow.result()
+    assert [result.output for result in quick_results] == ["wait\n"]
+    assert [result.output for result in slow_results] == ["slow\n", "after\n"]
+    # One resource per batch, each closed by its own batch
+    assert quick_results[0].return_value != slow_results[0].return_value
+    assert slow_results[0].return_value == slow_results[1].return_value
+    assert events == ["open", "open", "close", "close"]
+
+
+def test_providers_created_concurrently():
+    # Each provider waits for the other one, they would deadlock if providers
+    # were called while holding the lock of the store
+    barrier = threading.Barrier(2, timeout=5)
+
+    def get_first():
+        barrier.wait()
+        return "first"
+
+    def get_second():
+        barrier.wait()
+        return "second"
+
+    app = typer.Typer()
+
+    @app.command()
+    def main(ctx: typer.Context):
+        futures = [
+            ctx.executor.submit(ctx.get_resource, provider)
+            for provider in (get_first, get_second)
+        ]
+        print([future.result() for future in futures])
+
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0, result.output
+    assert result.output == "['first', 'second']\n"
+
+
+def test_depends_type_hints():
+    hints = typing.get_type_hints(typer.Depends)
+    assert hints["scope"] == typing.Literal["invocation", "process"]
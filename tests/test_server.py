@@ -0,0 +1,223 @@
+import gc
+import multiprocessing
+import os
+import signal
+import socket
+import stat
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+import typer
+from typer import _server
+from typer._server import run_client
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "fork"), reason="Serving an app requires fork()"
+)
+
+
+app = typer.Typer()
+
+
+@app.command()
+def hello(name: str):
+    print(f"Hello {name} from {os.getcwd()} {os.environ.get('GREETING', '')}")
+
+
+@app.command()
+def fail(code: int):
+    typer.echo("failing", err=True)
+    raise typer.Exit(code=code)
+
+
+@app.command()
+def read():
+    print(sys.stdin.read().upper())
+
+
+@app.command()
+def frozen():
+    print(gc.get_freeze_count() > 0)
+
+
+@app.command()
+def wait():
+    print("ready", flush=True)
+    time.sleep(30)
+
+
+def _accepts_connections(path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(path))
+        except ConnectionRefusedError:  # pragma: no cover
+            return False
+    return True
+
+
+@contextmanager
+def serving(socket_path: Path) -> Iterator[Path]:
+    process = multiprocessing.get_context("fork").Process(
+        target=app.serve, args=(socket_path,), kwargs={"prog_name": "greeter"}
+    )
+    process.start()
+    try:
+        for _ in range(200):
+            # The socket file exists after bind(), connections work after listen()
+            if socket_path.exists() and _accepts_connections(socket_path):
+                break
+            time.sleep(0.05)
+        else:  # pragma: no cover
+            pytest.fail("The server didn't start")
+        yield socket_path
+    finally:
+        process.terminate()
+        process.join(timeout=10)
+    assert process.exitcode == 0
+    assert not socket_path.exists()
+
+
+@pytest.fixture
+def server(tmp_path: Path):
+    with serving(tmp_path / "app.sock") as socket_path:
+        yield socket_path
+
+
+def run(socket_path: Path, tmp_path: Path, argv, stdin: bytes = b""):
+    stdin_path = tmp_path / "stdin"
+    stdin_path.write_bytes(stdin)
+    with (
+        open(stdin_path, "rb") as stdin_file,
+        open(tmp_path / "stdout", "wb+") as stdout_file,
+        open(tmp_path / "stderr", "wb+") as stderr_file,
+    ):
+        exit_code = run_client(
+            str(socket_path),
+            argv,
+            fds=[stdin_file.fileno(), stdout_file.fileno(), stderr_file.fileno()],
+        )
+    output = (tmp_path / "stdout").read_text()
+    stderr = (tmp_path / "stderr").read_text()
+    return exit_code, output, stderr
+
+
+def test_serve(server: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GREETING", "hi")
+    exit_code, output, _ = run(server, tmp_path, ["hello", "Camila"])
+    assert exit_code == 0
+    assert output == f"Hello Camila from {os.getcwd()} hi\n"
+    exit_code, output, _ = run(server, tmp_path, ["hello", "Rick"])
+    assert exit_code == 0
+    assert "Hello Rick" in output
+
+
+def test_serve_exit_code(server: Path, tmp_path: Path):
+    exit_code, _, stderr = run(server, tmp_path, ["fail", "3"])
+    assert exit_code == 3
+    assert stderr == "failing\n"
+
+
+def test_serve_usage_error(server: Path, tmp_path: Path):
+    exit_code, _, stderr = run(server, tmp_path, ["hello"])
+    assert exit_code == 2
+    assert "Usage: greeter hello" in stderr
+    assert "Missing argument 'NAME'" in stderr
+
+
+def test_serve_stdin(server: Path, tmp_path: Path):
+    exit_code, output, _ = run(server, tmp_path, ["read"], stdin=b"some input")
+    assert exit_code == 0
+    assert output == "SOME INPUT\n"
+
+
+def test_serve_prewarm(server: Path, tmp_path: Path):
+    exit_code, output, _ = run(server, tmp_path, ["frozen"])
+    assert exit_code == 0
+    assert output == "True\n"
+
+
+def test_client_shim(server: Path, tmp_path: Path):
+    shim = tmp_path / "greeter"
+    shim.write_text(typer.get_client_shim(server))
+    result = subprocess.run(
+        [sys.executable, str(shim), "fail", "4"], capture_output=True
+    )
+    assert result.returncode == 4
+    assert result.stderr == b"failing\n"
+
+
+def test_client_shim_fallback(tmp_path: Path):
+    shim = tmp_path / "greeter"
+    shim.write_text(
+        typer.get_client_shim(
+            tmp_path / "missing.sock",
+            fallback=[sys.executable, "-c", "import sys; print(sys.argv[1:])"],
+        )
+    )
+    result = subprocess.run(
+        [sys.executable, str(shim), "hello", "Camila"],
+        capture_output=True,
+        encoding="utf-8",
+    )
+    assert result.returncode == 0
+    assert result.stdout == "['hello', 'Camila']\n"
+
+
+def test_client_without_server(tmp_path: Path):
+    with pytest.raises(FileNotFoundError):
+        run_client(str(tmp_path / "missing.sock"), ["hello"])
+
+
+def test_serve_socket_permissions(server: Path):
+    assert stat.S_IMODE(server.stat().st_mode) == 0o600
+
+
+def test_serve_existing_file(tmp_path: Path):
+    path = tmp_path / "important.txt"
+    path.write_text("keep me")
+    with pytest.raises(FileExistsError):
+        app.serve(path)
+    assert path.read_text() == "keep me"
+
+
+def test_serve_other_user(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    uid = os.getuid()
+    # The forked server believes it runs as another user
+    monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+    with serving(tmp_path / "app.sock") as socket_path:
+        monkeypatch.undo()
+        with pytest.raises(ConnectionError):
+            run(socket_path, tmp_path, ["hello", "Camila"])
+    assert (tmp_path / "stdout").read_text() == ""
+
+
+def test_serve_stalled_client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(_server, "REQUEST_TIMEOUT", 0.2)
+    with serving(tmp_path / "app.sock") as socket_path:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stalled:
+            stalled.connect(str(socket_path))
+            exit_code, output, _ = run(socket_path, tmp_path, ["hello", "Camila"])
+    assert exit_code == 0
+    assert "Hello Camila" in output
+
+
+def test_client_forwards_sigint(server: Path, tmp_path: Path):
+    shim = tmp_path / "greeter"
+    shim.write_text(typer.get_client_shim(server))
+    process = subprocess.Popen(
+        [sys.executable, str(shim), "wait"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert process.stdout is not None
+    assert process.stdout.readline() == b"ready\n"
+    process.send_signal(signal.SIGINT)
+    process.communicate(timeout=10)
+    # The exit code of a Typer command interrupted by Ctrl-C
+    assert process.returncode == 130
@@ -1,4 +1,7 @@
+import click
+import pytest
 import typer
+import typer.core
 from typer.testing import CliRunner
 
 runner = CliRunner()
@@ -96,3 +99,88 @@ def test_typo_suggestion_disabled():
     assert result.exit_code != 0
     assert "No such command" in result.output
     assert "Did you mean" not in result.output
+
+
+def test_typo_suggestion_many_commands():
+    """Test that suggestions work with a command set large enough to be indexed"""
+    app = typer.Typer()
+
+    for i in range(500):
+        app.command(f"resource-{i}-list")(lambda: None)
+
+    @app.command()
+    def create():  # pragma: no cover
+        typer.echo("Creating...")
+
+    result = runner.invoke(app, ["crate"])
+    assert result.exit_code != 0
+    assert "Did you mean 'create'?" in result.output
+
+    result = runner.invoke(app, ["resource-42-lst"])
+    assert result.exit_code != 0
+    assert "'resource-42-list'" in result.output
+
+
+def test_typo_suggestion_option():
+    """Test that unknown options suggest the close option names"""
+    app = typer.Typer()
+
+    @app.command()
+    def create(name: str = "", force: bool = False):  # pragma: no cover
+        typer.echo("Creating...")
+
+    result = runner.invoke(app, ["--nme", "x"])
+    assert result.exit_code != 0
+    assert "No such option: --nme" in result.output
+    assert "Did you mean --name?" in result.output
+
+
+def test_typo_suggestion_many_options():
+    """Test that option suggestions work with many options"""
+    cmd = typer.core.TyperCommand(
+        "main",
+        params=[click.Option([f"--option-{i}"]) for i in range(500)],
+        callback=lambda **kwargs: None,
+    )
+
+    with pytest.raises(click.NoSuchOption) as exc_info:
+        cmd.main(["--option-42x"], standalone_mode=False)
+    assert "--option-42" in exc_info.value.possibilities
+
+
+def test_typo_suggestion_option_renamed():
+    """Test that option suggestions follow options replaced in place"""
+    cmd = typer.core.TyperCommand(
+        "main", params=[click.Option(["--name"])], callback=lambda **kwargs: None
+    )
+    with pytest.raises(click.NoSuchOption) as exc_info:
+        cmd.main(["--nmae"], standalone_mode=False)
+    assert exc_info.value.possibilities == ["--name"]
+    cmd.params[0] = click.Option(["--mane"])
+    with pytest.raises(click.NoSuchOption) as exc_info:
+        cmd.main(["--nmae"], standalone_mode=False)
+    assert exc_info.value.possibilities == ["--mane"]
+
+
+def test_typo_suggestion_command_renamed():
+    """Test that command suggestions follow commands renamed in place"""
+    group = typer.core.TyperGroup(name="main", commands=[click.Command("list")])
+    with pytest.raises(click.UsageError, match="'list'"):
+        group.main(["lst"], standalone_mode=False)
+    group.commands = {"last": click.Command("last")}
+    with pytest.raises(click.UsageError, match="'last'"):
+        group.main(["lst"], standalone_mode=False)
+
+
+def test_typo_suggestion_option_click_parser(monkeypatch: pytest.MonkeyPatch):
+    """Test that Click's own parser is used when its internals aren't supported"""
+    monkeypatch.setattr(typer.core, "_USE_TYPER_OPTION_PARSER", False)
+    cmd = typer.core.TyperCommand(
+        "main", params=[click.Option(["--name"])], callback=lambda **kwargs: None
+    )
+    assert not isinstance(
+        cmd.make_parser(cmd.make_context("main", [])), typer.core._TyperOptionParser
+    )
+    with pytest.raises(click.NoSuchOption) as exc_info:
+        cmd.main(["--nmae"], standalone_mode=False)
+    assert exc_info.value.possibilities == ["--name"]
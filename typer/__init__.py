@@ -26,6 +26,10 @@ from click.utils import get_text_stream as get_text_stream
 from click.utils import open_file as open_file
 
 from . import colors as colors
+from ._output import buffered_output as buffered_output
+from ._output import echo_file as echo_file
+from ._progress import progress as progress
+from ._server import get_client_shim as get_client_shim
 from ._typing import get_type_hints as get_type_hints
 from .main import DocTyper as DocTyper
 from .main import Typer as Typer
@@ -35,9 +39,13 @@ from .models import CallbackParam as CallbackParam
 from .models import Context as Context
 from .models import FileBinaryRead as FileBinaryRead
 from .models import FileBinaryWrite as FileBinaryWrite
+from .models import FileMmap as FileMmap
 from .models import FileText as FileText
 from .models import FileTextWrite as FileTextWrite
+from .models import InvocationResult as InvocationResult
+from .models import PipelineInput as PipelineInput
 from .params import Argument as Argument
+from .params import Depends as Depends
 from .params import Ignore as Ignore
 from .params import Option as Option
 
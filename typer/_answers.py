@@ -0,0 +1,135 @@
+import json
+import sys
+import threading
+from collections.abc import Mapping
+from typing import Any
+
+import click
+
+from ._resources import get_resource, in_batch
+from .models import ParamMeta
+from .params import Option
+
+ANSWERS_ENVVAR = "TYPER_ANSWERS"
+ANSWERS_PARAM_NAME = "typer_answers"
+ANSWERS_META_KEY = "typer.answers"
+
+_cache_lock = threading.Lock()
+
+
+def _store_answers_path(ctx: click.Context, value: str | None) -> None:
+    if value:
+        # ctx.meta is shared by all the contexts of the invocation
+        ctx.meta[ANSWERS_META_KEY] = value
+
+
+def get_answers_param() -> ParamMeta:
+    return ParamMeta(
+        name=ANSWERS_PARAM_NAME,
+        default=Option(
+            None,
+            "--answers",
+            metavar="FILE",
+            envvar=ANSWERS_ENVVAR,
+            is_eager=True,
+            expose_value=False,
+            callback=_store_answers_path,
+            help="Read the answers to the prompts from this TOML (or JSON) file.",
+        ),
+        annotation=str | None,
+    )
+
+
+def _normalize(key: str) -> str:
+    return key.replace("-", "_")
+
+
+def _normalize_keys(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {
+            _normalize(str(key)): _normalize_keys(item) for key, item in value.items()
+        }
+    return value
+
+
+def _parse_toml(data: bytes) -> Any:
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        try:
+            import tomli as tomllib
+        except ImportError as e:
+            raise ValueError(
+                "reading TOML requires Python 3.11+ or the tomli package"
+            ) from e
+    return tomllib.loads(data.decode("utf-8"))
+
+
+def load_answers(path: str) -> dict[str, Any]:
+    """
+    Parse an answers file: TOML, or JSON for `.json` files. Keys are normalized,
+    so both `user-name` and `user_name` answer the `--user-name` prompt.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        if path.lower().endswith(".json"):
+            answers = json.loads(data)
+        else:
+            answers = _parse_toml(data)
+    except (OSError, ValueError) as e:
+        # json.JSONDecodeError and tomllib.TOMLDecodeError are ValueErrors
+        raise click.FileError(path, hint=str(e)) from e
+    if not isinstance(answers, Mapping):
+        raise click.FileError(path, hint="the answers must be a table")
+    normalized: dict[str, Any] = _normalize_keys(answers)
+    return normalized
+
+
+def _create_answers_cache() -> dict[str, dict[str, Any]]:
+    return {}
+
+
+def _get_answers(ctx: click.Context, path: str) -> dict[str, Any]:
+    # Parsed once per invocation, or once for all the invocations of a batch
+    cache: dict[str, dict[str, Any]] = get_resource(
+        ctx, _create_answers_cache, scope="process" if in_batch() else "invocation"
+    )
+    with _cache_lock:
+        answers = cache.get(path)
+        if answers is None:
+            answers = cache[path] = load_answers(path)
+    return answers
+
+
+def get_answer(ctx: click.Context, name: str) -> tuple[bool, Any]:
+    """
+    Look up the answer to the prompt of the parameter `name` in the answers file
+    given with `--answers` or `TYPER_ANSWERS`. Return whether there is one, and its
+    value.
+
+    Answers can be in a table per subcommand, e.g. `[deploy]` for `app deploy`,
+    which takes precedence over the top-level answers.
+    """
+    # Only set by the --answers option, apps without it never read answers
+    path = ctx.meta.get(ANSWERS_META_KEY)
+    if not path:
+        return False, None
+    answers = _get_answers(ctx, path)
+    command_names: list[str] = []
+    current = ctx
+    while current.parent is not None:
+        command_names.append(_normalize(current.info_name or ""))
+        current = current.parent
+    tables: list[Mapping[str, Any]] = [answers]
+    for command_name in reversed(command_names):
+        table = tables[-1].get(command_name)
+        if not isinstance(table, Mapping):
+            break
+        tables.append(table)
+    key = _normalize(name)
+    for table in reversed(tables):
+        value = table.get(key)
+        if value is not None and not isinstance(value, Mapping):
+            return True, value
+    return False, None
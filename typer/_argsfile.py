@@ -0,0 +1,105 @@
+import os
+from collections.abc import Iterable, Iterator, Sequence
+from typing import BinaryIO
+
+import click
+
+ARGSFILE_PREFIX = "@"
+
+# Size of the blocks read from argument files
+ARGSFILE_CHUNK_SIZE = 1024 * 1024
+
+
+def _read_chunks(file: BinaryIO) -> Iterator[bytes]:
+    while chunk := file.read(ARGSFILE_CHUNK_SIZE):
+        yield chunk
+
+
+def split_arguments(
+    chunks: Iterable[bytes], delimiter: bytes | None = None
+) -> Iterator[bytes]:
+    """
+    Split the content of an argument file, given in chunks, in arguments.
+
+    Without an explicit `delimiter`, the arguments are delimited by NUL characters if
+    there is one in the first chunk containing a delimiter (e.g. the output of
+    `find -print0`), otherwise by lines. Empty lines are skipped.
+    """
+    # The pieces of the argument not delimited yet, joined once it is, so a long
+    # argument spanning many chunks isn't copied again for each of them
+    pending: list[bytes] = []
+    for chunk in chunks:
+        if delimiter is None:
+            if b"\0" in chunk:
+                delimiter = b"\0"
+            elif b"\n" in chunk:
+                delimiter = b"\n"
+            else:
+                pending.append(chunk)
+                continue
+        parts = chunk.split(delimiter)
+        if len(parts) == 1:
+            pending.append(chunk)
+            continue
+        pending.append(parts[0])
+        parts[0] = b"".join(pending)
+        pending = [parts.pop()]
+        for part in parts:
+            if delimiter == b"\n":
+                part = part.rstrip(b"\r")
+                if not part:
+                    continue
+            yield part
+    rest = b"".join(pending)
+    if delimiter != b"\0":
+        rest = rest.rstrip(b"\r")
+    if rest:
+        yield rest
+
+
+def iter_argsfile(path: str) -> Iterator[str]:
+    """
+    Read the arguments in an argument file, block by block, decoded like `sys.argv`.
+    `-` reads them from stdin.
+    """
+    if path == "-":
+        stdin = click.get_binary_stream("stdin")
+        for argument in split_arguments(_read_chunks(stdin)):
+            yield os.fsdecode(argument)
+        return
+    with open(path, "rb") as file:
+        for argument in split_arguments(_read_chunks(file)):
+            yield os.fsdecode(argument)
+
+
+def iter_stdin_arguments(delimiter: str | None = None) -> Iterator[str]:
+    """
+    Read arguments from stdin, block by block, decoded like `sys.argv`.
+    """
+    stdin = click.get_binary_stream("stdin")
+    use_delimiter = os.fsencode(delimiter) if delimiter is not None else None
+    for argument in split_arguments(_read_chunks(stdin), use_delimiter):
+        yield os.fsdecode(argument)
+
+
+def expand_argsfiles(args: Sequence[str]) -> list[str]:
+    """
+    Replace each `@path` argument with the arguments read from that file.
+
+    Arguments after `--` are not expanded, and argument files are not expanded
+    recursively.
+    """
+    expanded: list[str] = []
+    for index, arg in enumerate(args):
+        if arg == "--":
+            expanded.extend(args[index:])
+            break
+        if not arg.startswith(ARGSFILE_PREFIX) or len(arg) == 1:
+            expanded.append(arg)
+            continue
+        path = arg[len(ARGSFILE_PREFIX) :]
+        try:
+            expanded.extend(iter_argsfile(path))
+        except OSError as e:
+            raise click.FileError(path, hint=e.strerror) from e
+    return expanded
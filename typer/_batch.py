@@ -0,0 +1,190 @@
+import contextvars
+import io
+import sys
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import TextIO
+
+import click
+
+from ._argsfile import expand_argsfiles
+from ._forking import ExecutorMode, get_executor, get_worker_state
+from ._resources import batch_resources
+from .core import DEFAULT_MARKUP_MODE, _show_abort, _show_click_exception
+from .models import InvocationResult
+
+BatchMode = ExecutorMode
+
+# Capture buffers of the invocation running in the current thread
+_local = threading.local()
+_redirect_lock = threading.Lock()
+_redirect_count = 0
+_original_streams: tuple[TextIO, TextIO] | None = None
+
+
+class _ThreadLocalStream(io.TextIOBase):
+    """
+    Replacement for `sys.stdout` or `sys.stderr` writing to the capture buffer of
+    the invocation running in the current thread, or to the original stream.
+    """
+
+    def __init__(self, name: str, original: TextIO) -> None:
+        self._name = name
+        self._original = original
+
+    def _get_stream(self) -> TextIO:
+        stream: TextIO | None = getattr(_local, self._name, None)
+        return stream or self._original
+
+    @property
+    def encoding(self) -> str:  # type: ignore[override]
+        return getattr(self._get_stream(), "encoding", None) or "utf-8"
+
+    @property
+    def errors(self) -> str | None:  # type: ignore[override]
+        return getattr(self._get_stream(), "errors", None)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        return self._get_stream().write(s)
+
+    def flush(self) -> None:
+        self._get_stream().flush()
+
+    def isatty(self) -> bool:
+        return self._get_stream().isatty()
+
+    def fileno(self) -> int:
+        return self._get_stream().fileno()
+
+
+@contextmanager
+def _redirect_std_streams() -> Iterator[None]:
+    global _redirect_count, _original_streams
+    # Installed once for the batches running at the same time in several threads,
+    # and restored when the last one finishes
+    with _redirect_lock:
+        if _redirect_count == 0:
+            _original_streams = (sys.stdout, sys.stderr)
+            sys.stdout = _ThreadLocalStream("stdout", sys.stdout)
+            sys.stderr = _ThreadLocalStream("stderr", sys.stderr)
+        _redirect_count += 1
+    try:
+        yield
+    finally:
+        with _redirect_lock:
+            _redirect_count -= 1
+            if _redirect_count == 0 and _original_streams is not None:
+                sys.stdout, sys.stderr = _original_streams
+                _original_streams = None
+
+
+def invoke_one(
+    command: click.Command,
+    args: Sequence[str],
+    *,
+    prog_name: str,
+    catch_exceptions: bool = True,
+) -> InvocationResult:
+    """
+    Invoke a command like `command.main()` in standalone mode would, but capturing
+    the output, the exit code and the return value instead of exiting.
+
+    The standard streams have to be redirected with `_redirect_std_streams()`.
+    """
+    result = InvocationResult(args=list(args))
+    output, stderr = io.StringIO(), io.StringIO()
+    _local.stdout, _local.stderr = output, stderr
+    rich_markup_mode = getattr(command, "rich_markup_mode", DEFAULT_MARKUP_MODE)
+    try:
+        use_args = list(args)
+        if getattr(command, "expand_argsfiles", False):
+            use_args = expand_argsfiles(use_args)
+        with command.make_context(prog_name, use_args) as ctx:
+            result.return_value = command.invoke(ctx)
+    except click.ClickException as e:
+        _show_click_exception(e, rich_markup_mode=rich_markup_mode)
+        result.exit_code = e.exit_code
+    except click.exceptions.Exit as e:
+        result.exit_code = e.exit_code
+    except click.Abort:
+        _show_abort(rich_markup_mode=rich_markup_mode)
+        result.exit_code = 1
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            result.exit_code = e.code or 0
+        else:
+            stderr.write(f"{e.code}\n")
+            result.exit_code = 1
+    except Exception as e:
+        if not catch_exceptions:
+            raise
+        result.exception = e
+        result.exit_code = 1
+    finally:
+        _local.stdout = _local.stderr = None
+        result.output = output.getvalue()
+        result.stderr = stderr.getvalue()
+    return result
+
+
+def _invoke_forked(index: int) -> InvocationResult:
+    command, argvs, prog_name, catch_exceptions = get_worker_state()
+    return invoke_one(
+        command, argvs[index], prog_name=prog_name, catch_exceptions=catch_exceptions
+    )
+
+
+def invoke_many(
+    command: click.Command,
+    argvs: Iterable[Sequence[str]],
+    *,
+    prog_name: str,
+    workers: int = 1,
+    mode: BatchMode = "thread",
+    catch_exceptions: bool = True,
+) -> list[InvocationResult]:
+    """
+    Invoke the same command with each list of arguments, sequentially or in a pool
+    of threads or (forked) processes, returning the results in order.
+    """
+    use_argvs = [list(argv) for argv in argvs]
+    with _redirect_std_streams(), batch_resources():
+        if workers <= 1 or len(use_argvs) <= 1:
+            return [
+                invoke_one(
+                    command,
+                    argv,
+                    prog_name=prog_name,
+                    catch_exceptions=catch_exceptions,
+                )
+                for argv in use_argvs
+            ]
+        state = (command, use_argvs, prog_name, catch_exceptions)
+        with get_executor(mode, workers, state=state) as executor:
+            if isinstance(executor, ProcessPoolExecutor):
+                return list(
+                    executor.map(
+                        _invoke_forked,
+                        range(len(use_argvs)),
+                        chunksize=max(len(use_argvs) // (workers * 4), 1),
+                    )
+                )
+            # The threads run in copies of this context, to use the resources of
+            # this batch
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    invoke_one,
+                    command,
+                    argv,
+                    prog_name=prog_name,
+                    catch_exceptions=catch_exceptions,
+                )
+                for argv in use_argvs
+            ]
+            return [future.result() for future in futures]
@@ -0,0 +1,89 @@
+import array
+from collections.abc import Callable, Sequence
+from typing import Any, get_args, get_origin
+
+# Tuples, not strings, so "in" doesn't accept substrings like "qQ"
+INTEGER_TYPECODES = ("b", "B", "h", "H", "i", "I", "l", "L", "q", "Q")
+FLOAT_TYPECODES = ("f", "d")
+DEFAULT_TYPECODE = "d"
+
+BufferFactory = Callable[[Sequence[Any]], Any]
+
+
+def _is_ndarray(annotation: Any) -> bool:
+    # Without importing NumPy, it's only used when the annotation comes from it
+    origin = get_origin(annotation) or annotation
+    return (
+        getattr(origin, "__module__", None) == "numpy"
+        and getattr(origin, "__name__", None) == "ndarray"
+    )
+
+
+def is_buffer_type(annotation: Any) -> bool:
+    return annotation in (array.array, memoryview) or _is_ndarray(annotation)
+
+
+def get_ndarray_typecode(annotation: Any) -> str | None:
+    """
+    Return the type code of an annotation like `numpy.typing.NDArray[numpy.int64]`,
+    if it has a concrete dtype.
+    """
+    if not _is_ndarray(annotation):
+        return None
+    args = get_args(annotation)
+    if len(args) != 2:
+        return None
+    dtype_args = get_args(args[1])
+    if len(dtype_args) != 1:
+        return None
+    import numpy
+
+    try:
+        typecode: str = numpy.dtype(dtype_args[0]).char
+    except TypeError:
+        # A TypeVar or Any
+        return None
+    if typecode not in INTEGER_TYPECODES + FLOAT_TYPECODES:
+        return None
+    return typecode
+
+
+def _describe_invalid_value(values: Sequence[Any], typecode: str) -> str:
+    is_integer = typecode in INTEGER_TYPECODES
+    parse = int if is_integer else float
+    for value in values:
+        try:
+            array.array(typecode, [parse(value)])
+        except OverflowError:
+            return f"{value!r} is out of range for the type code {typecode!r}."
+        except (TypeError, ValueError):
+            kind = "integer" if is_integer else "float"
+            return f"{value!r} is not a valid {kind}."
+    return f"Invalid values for the type code {typecode!r}."  # pragma: no cover
+
+
+def parse_array(values: Sequence[Any], typecode: str) -> array.array:  # type: ignore[type-arg]
+    """
+    Parse all the values in one pass into a typed array, without keeping a Python
+    object per value.
+    """
+    parse = int if typecode in INTEGER_TYPECODES else float
+    try:
+        return array.array(typecode, map(parse, values))
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(_describe_invalid_value(values, typecode)) from None
+
+
+def get_buffer_factory(annotation: Any, typecode: str) -> BufferFactory:
+    if annotation is memoryview:
+        return lambda values: memoryview(parse_array(values, typecode))
+    if _is_ndarray(annotation):
+
+        def to_ndarray(values: Sequence[Any]) -> Any:
+            import numpy
+
+            # Shares the memory of the array, without copying it
+            return numpy.frombuffer(parse_array(values, typecode), dtype=typecode)
+
+        return to_ndarray
+    return lambda values: parse_array(values, typecode)
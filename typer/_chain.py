@@ -0,0 +1,274 @@
+import contextvars
+import queue
+import threading
+import traceback
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack
+from typing import Any
+
+import click
+
+from ._forking import ExecutorMode, get_executor, get_worker_state
+from ._loop import close_event_loops
+from ._resources import close_resources
+from .models import PipelineInput
+
+ChainParallelMode = ExecutorMode
+
+# Maximum number of items buffered between two chained commands running in threads
+PIPELINE_QUEUE_SIZE = 1024
+
+_END = object()
+
+
+class ChainedCommandsError(click.ClickException):
+    """
+    Raised when several chained subcommands run in parallel failed.
+
+    The tracebacks of the errors that aren't Click errors are kept in the message,
+    and the first of them is the `__cause__`.
+    """
+
+    def __init__(self, errors: Sequence[tuple[str, BaseException]]) -> None:
+        self.errors = list(errors)
+        lines = [f"{len(self.errors)} chained commands failed:"]
+        for name, error in self.errors:
+            lines.append(f"  {name}: {_format_error(error)}")
+            if not isinstance(error, click.ClickException):
+                lines.extend(
+                    f"    {line}"
+                    for line in "".join(traceback.format_exception(error)).splitlines()
+                )
+        super().__init__("\n".join(lines))
+        self.__cause__ = next(
+            (e for _, e in self.errors if not isinstance(e, click.ClickException)),
+            None,
+        )
+
+
+def _format_error(error: BaseException) -> str:
+    if isinstance(error, click.ClickException):
+        return error.format_message()
+    return f"{type(error).__name__}: {error}"
+
+
+def _detach_click_exception(error: click.ClickException) -> click.ClickException:
+    # The context and the parameter of a Click error can't always be pickled (e.g.
+    # the callbacks of the completion options), send the formatted message back
+    # from the worker process instead. The parent restores the context
+    detached = (
+        click.UsageError(error.format_message())
+        if isinstance(error, click.UsageError)
+        else click.ClickException(error.format_message())
+    )
+    detached.exit_code = error.exit_code
+    return detached
+
+
+class _Pipe:
+    """
+    Bounded queue streaming the items returned by a chained command to the next
+    one, when they run in different threads.
+
+    The producer blocks while the queue is full, and stops when the consumer is
+    done, even if it didn't read all the items.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize)
+        self._closed = threading.Event()
+
+    def _put(self, item: Any) -> bool:
+        while not self._closed.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def feed(self, value: Any) -> None:
+        if value is None:
+            return
+        for item in value:
+            if not self._put(item):
+                break
+
+    def end(self) -> None:
+        self._put(_END)
+
+    def close(self) -> None:
+        self._closed.set()
+
+    def __iter__(self) -> Iterator[Any]:
+        while True:
+            item = self._queue.get()
+            if item is _END:
+                return
+            yield item
+
+
+def _get_pipeline_input_names(contexts: Sequence[click.Context]) -> list[str | None]:
+    names: list[str | None] = []
+    for index, sub_ctx in enumerate(contexts):
+        name: str | None = getattr(sub_ctx.command, "pipeline_input_name", None)
+        if name and index == 0:
+            raise click.UsageError(
+                "This command reads the output of a previous chained command.",
+                ctx=sub_ctx,
+            )
+        names.append(name)
+    return names
+
+
+def _invoke(sub_ctx: click.Context) -> Any:
+    with sub_ctx:
+        return sub_ctx.command.invoke(sub_ctx)
+
+
+def _invoke_forked(index: int) -> Any:
+    sub_ctx: click.Context = get_worker_state()[index]
+    try:
+        return _invoke(sub_ctx)
+    except click.exceptions.Exit as e:
+        # Exit doesn't keep its code in args, the only state pickle sends back
+        e.args = (e.exit_code,)
+        raise
+    except click.ClickException as e:
+        raise _detach_click_exception(e) from None
+    finally:
+        close_resources(sub_ctx.meta)
+        close_event_loops(sub_ctx.meta)
+
+
+def _invoke_stage(
+    sub_ctx: click.Context, input_pipe: _Pipe | None, output_pipe: _Pipe | None
+) -> Any:
+    try:
+        with sub_ctx:
+            rv = sub_ctx.command.invoke(sub_ctx)
+            if output_pipe is not None:
+                output_pipe.feed(rv)
+            return rv
+    finally:
+        if input_pipe is not None:
+            input_pipe.close()
+        if output_pipe is not None:
+            output_pipe.end()
+
+
+def invoke_sequential(contexts: Sequence[click.Context]) -> list[Any]:
+    """
+    Invoke the already created contexts of chained subcommands one after the other,
+    like Click does, passing the result of each command to the next one when it
+    declares a `PipelineInput` parameter.
+    """
+    input_names = _get_pipeline_input_names(contexts)
+    rv: list[Any] = []
+    # The contexts of the commands streaming their result are kept open until the
+    # end, their result is consumed lazily by the next commands
+    with ExitStack() as stack:
+        for index, sub_ctx in enumerate(contexts):
+            input_name = input_names[index]
+            if input_name:
+                sub_ctx.params[input_name] = PipelineInput(rv[-1])
+            if index + 1 < len(contexts) and input_names[index + 1]:
+                stack.enter_context(sub_ctx)
+                rv.append(sub_ctx.command.invoke(sub_ctx))
+            else:
+                rv.append(_invoke(sub_ctx))
+    return rv
+
+
+def invoke_parallel(
+    contexts: Sequence[click.Context],
+    *,
+    mode: ChainParallelMode,
+    max_workers: int | None = None,
+) -> list[Any]:
+    """
+    Invoke the already created contexts of chained subcommands in a pool of
+    threads or processes, returning their results in command line order.
+
+    Commands with a `PipelineInput` parameter and the commands before them run in
+    threads, one per command, with their results streamed through bounded queues.
+    In process mode, a warning is shown as they still run in threads.
+
+    All the subcommands are run to completion even if some of them fail. A single
+    error is re-raised as is, several errors are aggregated in a
+    `ChainedCommandsError`. `typer.Exit` and `typer.Abort` are always re-raised as
+    is, and `KeyboardInterrupt` and `SystemExit` aren't caught.
+    """
+    input_names = _get_pipeline_input_names(contexts)
+    pipes: list[_Pipe | None] = [None]
+    for sub_ctx, input_name in zip(contexts[1:], input_names[1:], strict=True):
+        pipe = _Pipe(PIPELINE_QUEUE_SIZE) if input_name else None
+        if input_name:
+            sub_ctx.params[input_name] = PipelineInput(pipe)
+        pipes.append(pipe)
+    pipes.append(None)
+    if any(pipes):
+        if mode == "process":
+            import warnings
+
+            warnings.warn(
+                "Chained commands reading the output of the previous ones "
+                "(PipelineInput) are run in threads, not in processes",
+                stacklevel=2,
+            )
+        # All the stages of a pipeline have to run at the same time
+        executor: Executor = ThreadPoolExecutor(len(contexts))
+    else:
+        executor = get_executor(mode, max_workers, state=contexts)
+    forked = isinstance(executor, ProcessPoolExecutor)
+    results: list[Any] = []
+    errors: list[tuple[str, Exception]] = []
+    # In process mode, the contexts closed by the workers, their close callbacks
+    # must not run a second time in this process
+    closed_by_workers: list[click.Context] = []
+    try:
+        with executor:
+            if forked:
+                futures = [
+                    executor.submit(_invoke_forked, index)
+                    for index in range(len(contexts))
+                ]
+            else:
+                # In copies of this context, e.g. to share the batch resources
+                futures = [
+                    executor.submit(
+                        contextvars.copy_context().run,
+                        _invoke_stage,
+                        sub_ctx,
+                        pipes[index],
+                        pipes[index + 1],
+                    )
+                    for index, sub_ctx in enumerate(contexts)
+                ]
+            for sub_ctx, future in zip(contexts, futures, strict=True):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    if isinstance(e, click.UsageError) and e.ctx is None:
+                        e.ctx = sub_ctx
+                    errors.append((sub_ctx.info_name or "", e))
+                    if isinstance(e, BrokenProcessPool):
+                        # The worker died, it didn't close the context
+                        continue
+                closed_by_workers.append(sub_ctx)
+    finally:
+        if forked:
+            for sub_ctx in contexts:
+                if not any(sub_ctx is closed for closed in closed_by_workers):
+                    sub_ctx.close()
+    for _, error in errors:
+        # Exiting or aborting isn't a failure to aggregate
+        if isinstance(error, (click.exceptions.Exit, click.exceptions.Abort)):
+            raise error
+    if len(errors) == 1:
+        raise errors[0][1]
+    if errors:
+        raise ChainedCommandsError(errors)
+    return results
@@ -2,6 +2,7 @@ import importlib.util
 import os
 import re
 import sys
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 import click
@@ -17,6 +18,10 @@ from ._completion_shared import (
     Shells,
 )
 
+COMPLETE_MAX_ITEMS_ENV_VAR = "TYPER_COMPLETE_MAX_ITEMS"
+# Set by the Bash script to receive the type of each item, e.g. "file,README.md"
+COMPLETE_TYPES_ENV_VAR = "_TYPER_COMPLETE_TYPES"
+
 
 def _sanitize_help_text(text: str) -> str:
     """Sanitizes the help text by removing rich tags"""
@@ -27,9 +32,50 @@ def _sanitize_help_text(text: str) -> str:
     return rich_utils.rich_render_text(text)
 
 
+def _get_complete_max_items() -> int | None:
+    value = os.getenv(COMPLETE_MAX_ITEMS_ENV_VAR, "")
+    try:
+        max_items = int(value)
+    except ValueError:
+        return None
+    return max_items if max_items > 0 else None
+
+
+class _CompletionStream:
+    """Iterate over the completion items lazily, stopping after the maximum
+    number of items set with `TYPER_COMPLETE_MAX_ITEMS`, if any."""
+
+    def __init__(self, completions: Iterable[click.shell_completion.CompletionItem]):
+        self.completions = completions
+        self.max_items = _get_complete_max_items()
+        self.truncated = False
+
+    def __iter__(self) -> Iterator[click.shell_completion.CompletionItem]:
+        for count, item in enumerate(self.completions):
+            if self.max_items is not None and count >= self.max_items:
+                self.truncated = True
+                return
+            yield item
+
+
+def _stream_lines(
+    comp: click.shell_completion.ShellComplete,
+) -> Iterator[str]:
+    args, incomplete = comp.get_completion_args()
+    completions = _CompletionStream(comp.get_completions(args, incomplete))
+    for count, item in enumerate(completions):
+        yield (
+            f"\n{comp.format_completion(item)}"
+            if count
+            else (comp.format_completion(item))
+        )
+
+
 class BashComplete(click.shell_completion.BashComplete):
     name = Shells.bash.value
     source_template = COMPLETION_SCRIPT_BASH
+    # Read once per completion instead of once per item, see stream_complete()
+    _complete_types: bool | None = None
 
     def source_vars(self) -> dict[str, Any]:
         return {
@@ -51,16 +97,23 @@ class BashComplete(click.shell_completion.BashComplete):
         return args, incomplete
 
     def format_completion(self, item: click.shell_completion.CompletionItem) -> str:
-        # TODO: Explore replicating the new behavior from Click, with item types and
-        # triggering completion for files and directories
-        # return f"{item.type},{item.value}"
+        # Scripts installed by older versions only read the values
+        complete_types = self._complete_types
+        if complete_types is None:
+            complete_types = bool(os.getenv(COMPLETE_TYPES_ENV_VAR))
+        if complete_types:
+            return f"{item.type},{item.value}"
         return f"{item.value}"
 
+    def stream_complete(self) -> Iterator[str]:
+        self._complete_types = bool(os.getenv(COMPLETE_TYPES_ENV_VAR))
+        try:
+            yield from _stream_lines(self)
+        finally:
+            self._complete_types = None
+
     def complete(self) -> str:
-        args, incomplete = self.get_completion_args()
-        completions = self.get_completions(args, incomplete)
-        out = [self.format_completion(item) for item in completions]
-        return "\n".join(out)
+        return "".join(self.stream_complete())
 
 
 class ZshComplete(click.shell_completion.ZshComplete):
@@ -103,15 +156,34 @@ class ZshComplete(click.shell_completion.ZshComplete):
         else:
             return f'"{escape(item.value)}"'
 
-    def complete(self) -> str:
+    def stream_complete(self) -> Iterator[str]:
         args, incomplete = self.get_completion_args()
-        completions = self.get_completions(args, incomplete)
-        res = [self.format_completion(item) for item in completions]
-        if res:
-            args_str = "\n".join(res)
-            return f"_arguments '*: :(({args_str}))'"
-        else:
-            return "_files"
+        completions = _CompletionStream(self.get_completions(args, incomplete))
+        items = iter(completions)
+        first = next(items, None)
+        if first is None:
+            yield "_files"
+            return
+        if first.type in ("dir", "file"):
+            # Let zsh complete paths itself, with its own quoting and suffixes
+            rest = list(items)
+            only_dirs = all(item.type == "dir" for item in [first, *rest])
+            yield "_files -/" if only_dirs else "_files"
+            return
+        yield f"_arguments '*: :(({self.format_completion(first)}"
+        for item in items:
+            yield f"\n{self.format_completion(item)}"
+        yield "))'"
+        # Only zsh can show a message next to the completions, the other shells
+        # would take it as one more completion
+        if completions.truncated:
+            yield (
+                f"; _message -r 'Showing only the first {completions.max_items} "
+                "completions'"
+            )
+
+    def complete(self) -> str:
+        return "".join(self.stream_complete())
 
 
 class FishComplete(click.shell_completion.FishComplete):
@@ -149,22 +221,22 @@ class FishComplete(click.shell_completion.FishComplete):
         else:
             return f"{item.value}"
 
-    def complete(self) -> str:
+    def stream_complete(self) -> Iterator[str]:
         complete_action = os.getenv("_TYPER_COMPLETE_FISH_ACTION", "")
-        args, incomplete = self.get_completion_args()
-        completions = self.get_completions(args, incomplete)
-        show_args = [self.format_completion(item) for item in completions]
         if complete_action == "get-args":
-            if show_args:
-                return "\n".join(show_args)
+            yield from _stream_lines(self)
         elif complete_action == "is-args":
-            if show_args:
+            args, incomplete = self.get_completion_args()
+            completions = self.get_completions(args, incomplete)
+            if next(iter(completions), None) is not None:
                 # Activate complete args (no files)
                 sys.exit(0)
             else:
                 # Deactivate complete args (allow files)
                 sys.exit(1)
-        return ""  # pragma: no cover
+
+    def complete(self) -> str:
+        return "".join(self.stream_complete())
 
 
 class PowerShellComplete(click.shell_completion.ShellComplete):
@@ -188,6 +260,12 @@ class PowerShellComplete(click.shell_completion.ShellComplete):
     def format_completion(self, item: click.shell_completion.CompletionItem) -> str:
         return f"{item.value}:::{_sanitize_help_text(item.help) if item.help else ' '}"
 
+    def stream_complete(self) -> Iterator[str]:
+        yield from _stream_lines(self)
+
+    def complete(self) -> str:
+        return "".join(self.stream_complete())
+
 
 def completion_init() -> None:
     click.shell_completion.add_completion_class(BashComplete, Shells.bash.value)
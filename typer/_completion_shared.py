@@ -19,9 +19,18 @@ class Shells(str, Enum):
 COMPLETION_SCRIPT_BASH = """
 %(complete_func)s() {
     local IFS=$'\n'
-    COMPREPLY=( $( env COMP_WORDS="${COMP_WORDS[*]}" \\
+    local completion
+    local response=( $( env COMP_WORDS="${COMP_WORDS[*]}" \\
                    COMP_CWORD=$COMP_CWORD \\
+                   _TYPER_COMPLETE_TYPES=1 \\
                    %(autocomplete_var)s=complete_bash $1 ) )
+    COMPREPLY=()
+    for completion in "${response[@]}"; do
+        case ${completion%%%%,*} in
+            dir|file) compopt -o filenames ;;
+        esac
+        COMPREPLY+=( "${completion#*,}" )
+    done
     return 0
 }
 
@@ -0,0 +1,109 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+from typing import IO, Any, Literal
+
+Compression = Literal["auto", "gzip", "bz2", "xz"]
+COMPRESSIONS = ("auto", "gzip", "bz2", "xz")
+
+# Bytes passed at once between the command and the (de)compressor
+DEFAULT_BUFFER_SIZE = 128 * 1024
+
+_EXTENSIONS = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz"}
+_MAGIC_NUMBERS = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+)
+_MAGIC_SIZE = max(len(magic) for magic, _ in _MAGIC_NUMBERS)
+
+
+def check_compresslevel(compression: str | None, compresslevel: int | None) -> None:
+    """Raise a `ValueError` if `compression` doesn't support `compresslevel`."""
+    # bz2 has no level 0
+    minimum = 1 if compression == "bz2" else 0
+    if compresslevel is not None and not minimum <= compresslevel <= 9:
+        raise ValueError(
+            f"Unsupported compression level for {compression or 'files'}: "
+            f"{compresslevel!r}, it must be between {minimum} and 9"
+        )
+
+
+def get_extension_compression(filename: str | os.PathLike[str]) -> str | None:
+    _, extension = os.path.splitext(os.fspath(filename))
+    return _EXTENSIONS.get(extension.lower())
+
+
+def _peek(stream: IO[bytes]) -> bytes:
+    # Read the magic number without consuming it, streams like stdin can't be reopened
+    peek = getattr(stream, "peek", None)
+    if peek is not None:
+        data: bytes = peek(_MAGIC_SIZE)
+        return data[:_MAGIC_SIZE]
+    if stream.seekable():
+        position = stream.tell()
+        data = stream.read(_MAGIC_SIZE)
+        stream.seek(position)
+        return data
+    return b""  # pragma: no cover
+
+
+def detect_compression(stream: IO[bytes]) -> str | None:
+    magic = _peek(stream)
+    for prefix, compression in _MAGIC_NUMBERS:
+        if magic.startswith(prefix):
+            return compression
+    return None
+
+
+def open_compressed(
+    stream: IO[bytes],
+    compression: str,
+    *,
+    mode: str,
+    compresslevel: int | None = None,
+    buffer_size: int | None = None,
+    encoding: str | None = None,
+    errors: str | None = None,
+) -> IO[Any]:
+    """
+    Wrap the binary `stream` with a (de)compressor, buffered with `buffer_size`
+    bytes, and decoded as text unless `mode` is binary.
+
+    Closing the returned file finishes the compressed stream but doesn't close
+    `stream`.
+    """
+    reading = "r" in mode
+    # The stream is already open, appending is writing a new compressed member
+    binary_mode: Literal["rb", "wb"] = "rb" if reading else "wb"
+    codec: Any
+    if compression == "gzip":
+        codec = gzip.GzipFile(
+            fileobj=stream,
+            mode=binary_mode,
+            compresslevel=9 if compresslevel is None else compresslevel,
+        )
+    elif compression == "bz2":
+        codec = bz2.BZ2File(
+            stream,
+            binary_mode,
+            compresslevel=9 if compresslevel is None else compresslevel,
+        )
+    elif compression == "xz":
+        codec = lzma.LZMAFile(
+            stream, binary_mode, preset=None if reading else compresslevel
+        )
+    else:  # pragma: no cover
+        raise ValueError(f"Unsupported compression: {compression!r}")
+
+    size = buffer_size or DEFAULT_BUFFER_SIZE
+    buffered: io.BufferedIOBase
+    if reading:
+        buffered = io.BufferedReader(codec, size)
+    else:
+        buffered = io.BufferedWriter(codec, size)
+    if "b" in mode:
+        return buffered
+    return io.TextIOWrapper(buffered, encoding=encoding, errors=errors)
@@ -0,0 +1,44 @@
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+from ._typing import Literal
+
+ExecutorMode = Literal["thread", "process"]
+
+# State of the pool the current worker process belongs to, set by its initializer
+_worker_state: Any = None
+
+
+def _set_worker_state(state: Any) -> None:
+    global _worker_state
+    _worker_state = state
+
+
+def get_worker_state() -> Any:
+    """Return the `state` given to `get_executor()`, in a forked worker process."""
+    return _worker_state
+
+
+def get_executor(
+    mode: ExecutorMode, max_workers: int | None, *, state: Any = None
+) -> Executor:
+    """
+    Return a pool of forked worker processes in process mode, or a pool of threads.
+
+    The worker processes get `state` with `get_worker_state()`. It's passed to their
+    initializer, which is inherited through fork() instead of being pickled, so it
+    can hold e.g. commands and contexts, and each pool gets its own even when several
+    are used at the same time from different threads.
+
+    Without fork() (e.g. on Windows) the state couldn't be sent to other processes,
+    threads are used.
+    """
+    if mode == "process" and "fork" in multiprocessing.get_all_start_methods():
+        return ProcessPoolExecutor(
+            max_workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_set_worker_state,
+            initargs=(state,),
+        )
+    return ThreadPoolExecutor(max_workers)
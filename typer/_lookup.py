@@ -0,0 +1,205 @@
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from difflib import get_close_matches
+from itertools import count
+from typing import Any, Generic, SupportsIndex, TypeVar
+
+_T = TypeVar("_T")
+_K = TypeVar("_K")
+
+# Shared by all the tracked collections, so a version is never reused, even by a
+# new collection replacing an old one
+_versions = count()
+
+# Up to this many keys, scoring all of them with difflib is cheap enough
+FUZZY_LINEAR_SCAN_MAX = 200
+
+
+class PrefixIndex(Generic[_T]):
+    """
+    Sorted index of string keys, answering prefix queries with a binary search
+    instead of scanning every key.
+
+    Matches are returned in insertion order (not in sorted order), so callers keep
+    e.g. the order in which commands and options were declared.
+    """
+
+    def __init__(self, items: Iterable[tuple[str, _T]]) -> None:
+        entries = sorted(
+            ((key, position, value) for position, (key, value) in enumerate(items)),
+            key=lambda entry: (entry[0], entry[1]),
+        )
+        self._keys = [key for key, _, _ in entries]
+        self._positions = [position for _, position, _ in entries]
+        self._values = [value for _, _, value in entries]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        index = bisect_left(self._keys, key)
+        return index < len(self._keys) and self._keys[index] == key
+
+    def prefix(self, prefix: str) -> list[tuple[str, _T]]:
+        """Return the `(key, value)` pairs whose key starts with `prefix`."""
+        matches = []
+        for index in range(bisect_left(self._keys, prefix), len(self._keys)):
+            if not self._keys[index].startswith(prefix):
+                break
+            matches.append(index)
+        matches.sort(key=self._positions.__getitem__)
+        return [(self._keys[index], self._values[index]) for index in matches]
+
+
+def _ngrams(word: str, n: int = 3) -> set[str]:
+    padded = f" {word} "
+    return {padded[i : i + n] for i in range(max(len(padded) - n + 1, 1))}
+
+
+class FuzzyIndex:
+    """
+    Trigram index of string keys to find close matches (for "did you mean"
+    suggestions) without scoring every key.
+
+    Only the keys sharing the most trigrams with the word are scored with
+    `difflib.get_close_matches()`, so the results are the same as calling it with
+    all the keys, except for pathological cases with almost no common substrings.
+    Small indexes are always scanned linearly.
+    """
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        self._keys = list(dict.fromkeys(keys))
+        self._grams: defaultdict[str, list[int]] = defaultdict(list)
+        if len(self._keys) > FUZZY_LINEAR_SCAN_MAX:
+            for position, key in enumerate(self._keys):
+                for gram in _ngrams(key):
+                    self._grams[gram].append(position)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def get_close_matches(
+        self, word: str, n: int = 3, cutoff: float = 0.6
+    ) -> list[str]:
+        if len(self._keys) <= FUZZY_LINEAR_SCAN_MAX:
+            return get_close_matches(word, self._keys, n=n, cutoff=cutoff)
+        counts: Counter[int] = Counter()
+        for gram in _ngrams(word):
+            counts.update(self._grams.get(gram, ()))
+        candidates = [
+            self._keys[position] for position, _ in counts.most_common(max(n * 10, 50))
+        ]
+        return get_close_matches(word, candidates, n=n, cutoff=cutoff)
+
+
+class TrackedDict(dict[_K, _T]):
+    """
+    Dict that takes a new `version` on every change, so indexes built from it can
+    check they are up to date without comparing all its items.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.version = next(_versions)
+
+    def _changed(self) -> None:
+        self.version = next(_versions)
+
+    def __setitem__(self, key: _K, value: _T) -> None:
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key: _K) -> None:
+        super().__delitem__(key)
+        self._changed()
+
+    def __ior__(self, other: Any) -> "TrackedDict[_K, _T]":  # type: ignore[override,misc]
+        super().__ior__(other)
+        self._changed()
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def pop(self, *args: Any) -> Any:
+        self._changed()
+        return super().pop(*args)
+
+    def popitem(self) -> tuple[_K, _T]:
+        self._changed()
+        return super().popitem()
+
+    def setdefault(self, *args: Any) -> Any:
+        self._changed()
+        return super().setdefault(*args)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._changed()
+
+
+class TrackedList(list[_T]):
+    """
+    List that takes a new `version` on every change, like `TrackedDict`.
+    """
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self.version = next(_versions)
+
+    def _changed(self) -> None:
+        self.version = next(_versions)
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, other: Iterable[_T]) -> "TrackedList[_T]":  # type: ignore[override,misc]
+        super().__iadd__(other)
+        self._changed()
+        return self
+
+    def __imul__(self, other: SupportsIndex) -> "TrackedList[_T]":
+        super().__imul__(other)
+        self._changed()
+        return self
+
+    def append(self, value: _T) -> None:
+        super().append(value)
+        self._changed()
+
+    def extend(self, values: Iterable[_T]) -> None:
+        super().extend(values)
+        self._changed()
+
+    def insert(self, index: Any, value: _T) -> None:
+        super().insert(index, value)
+        self._changed()
+
+    def pop(self, *args: Any) -> _T:
+        self._changed()
+        return super().pop(*args)
+
+    def remove(self, value: _T) -> None:
+        super().remove(value)
+        self._changed()
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._changed()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._changed()
@@ -0,0 +1,130 @@
+import asyncio
+import os
+import sys
+import threading
+import warnings
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterator
+from typing import Any, TypeVar
+
+import click
+
+EVENT_LOOP_META_KEY = "typer.event_loop"
+
+LoopFactory = Callable[[], asyncio.AbstractEventLoop]
+
+_T = TypeVar("_T")
+# Loops are per process and per thread, for commands run in parallel (chain_parallel)
+_LoopKey = tuple[int, int]
+# The loop, and the loop that was current in its thread before it
+_LoopEntry = tuple[asyncio.AbstractEventLoop, asyncio.AbstractEventLoop | None]
+
+
+def _get_loop_key() -> _LoopKey:
+    return os.getpid(), threading.get_ident()
+
+
+def get_event_loop(ctx: click.Context) -> asyncio.AbstractEventLoop:
+    """
+    Return the event loop of the current invocation, creating it on first use with
+    the `loop_factory` of the root command (or `asyncio.new_event_loop()`).
+
+    The loop is stored in `ctx.meta`, shared by all the contexts of the invocation
+    (group callbacks, chained subcommands, parameter callbacks), and closed when the
+    root context is closed, restoring the thread's previous current loop. Commands
+    running in other threads or processes get their own loop.
+
+    As the loop is shared, the `loop_factory` of sub-Typers is not used, only the
+    one of the app being run.
+    """
+    loops: dict[_LoopKey, _LoopEntry] | None = ctx.meta.get(EVENT_LOOP_META_KEY)
+    root = ctx.find_root()
+    if loops is None:
+        loops = ctx.meta[EVENT_LOOP_META_KEY] = {}
+        root.call_on_close(lambda: close_event_loops(ctx.meta))
+    key = _get_loop_key()
+    entry = loops.get(key)
+    if entry is None:
+        loop_factory: LoopFactory | None = getattr(root.command, "loop_factory", None)
+        previous = _get_current_loop()
+        entry = loops[key] = ((loop_factory or asyncio.new_event_loop)(), previous)
+        asyncio.set_event_loop(entry[0])
+    return entry[0]
+
+
+def _get_current_loop() -> asyncio.AbstractEventLoop | None:
+    # The loop an application or a test set for this thread, if any
+    if sys.version_info < (3, 12):
+        # asyncio.get_event_loop() would silently create (and leak) a loop in the
+        # main thread if it has none, read the loop set in the policy instead
+        local = getattr(asyncio.get_event_loop_policy(), "_local", None)
+        loop: asyncio.AbstractEventLoop | None = getattr(local, "_loop", None)
+        return loop
+    # Python 3.12 and 3.13 warn before creating a loop (raised as an error here so
+    # they don't), and Python 3.14 raises RuntimeError instead
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            return asyncio.get_event_loop()
+        except (DeprecationWarning, RuntimeError):
+            return None
+
+
+def close_event_loops(meta: dict[str, Any]) -> None:
+    """Close the event loops created by the current process for an invocation."""
+    loops: dict[_LoopKey, _LoopEntry] = meta.get(EVENT_LOOP_META_KEY, {})
+    pid, thread_id = _get_loop_key()
+    for key in [key for key in loops if key[0] == pid]:
+        loop, previous = loops.pop(key)
+        _close_event_loop(loop, previous=previous, current=key[1] == thread_id)
+
+
+def _close_event_loop(
+    loop: asyncio.AbstractEventLoop,
+    *,
+    previous: asyncio.AbstractEventLoop | None,
+    current: bool,
+) -> None:
+    # Same clean up as asyncio.run()
+    try:
+        tasks = asyncio.all_tasks(loop)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        if current:
+            # Restore the loop that was current before the invocation, e.g. when
+            # invoked from an application or a test that has its own loop
+            if previous is not None and previous.is_closed():
+                previous = None
+            asyncio.set_event_loop(previous)
+        loop.close()
+
+
+def run_coroutine(ctx: click.Context, coroutine: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine to completion in the event loop of the current invocation."""
+    return get_event_loop(ctx).run_until_complete(coroutine)
+
+
+def iter_async(ctx: click.Context, iterator: AsyncIterator[_T]) -> Iterator[_T]:
+    """
+    Iterate over an async iterator (e.g. an async generator) in the event loop of
+    the current invocation, one item at a time.
+    """
+    loop = get_event_loop(ctx)
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(_anext(iterator))
+            except StopAsyncIteration:
+                return
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None and not loop.is_closed():
+            loop.run_until_complete(aclose())
+
+
+async def _anext(iterator: AsyncIterator[_T]) -> _T:
+    return await iterator.__anext__()
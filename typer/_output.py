@@ -0,0 +1,286 @@
+import errno
+import io
+import os
+import stat
+import sys
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import IO, Any
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+# Bytes copied per system call by echo_file()
+COPY_BLOCK_SIZE = 1024 * 1024
+# Linux transfers at most 0x7ffff000 bytes per sendfile() call
+_SENDFILE_BLOCK_SIZE = 0x7FFFF000
+# Errors meaning that the zero-copy system call doesn't support these files
+_UNSUPPORTED_ERRNOS = {errno.EINVAL, errno.ENOSYS, errno.ENOTSOCK, errno.EOPNOTSUPP}
+
+
+class _OutputBuffer(io.BufferedIOBase):
+    """Accumulate the output in memory and write it to `stream` when there are
+    `buffer_size` bytes, every `flush_interval` seconds (from a background thread)
+    and when closed. Flushing it doesn't write anything, unless `stream` is a
+    terminal, so a flush after each line (like `echo()` does) costs nothing.
+
+    Errors of the background thread, like `EPIPE`, are raised by the next write or
+    when closing.
+    """
+
+    def __init__(
+        self, stream: IO[bytes], *, buffer_size: int, flush_interval: float
+    ) -> None:
+        self._stream = stream
+        self._buffer_size = buffer_size
+        self._interactive = stream.isatty()
+        self._data = bytearray()
+        self._lock = threading.Lock()
+        self._error: BaseException | None = None
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        if flush_interval > 0 and not self._interactive:
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(flush_interval,),
+                name="typer-buffered-output",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self, flush_interval: float) -> None:
+        while not self._stopped.wait(flush_interval):
+            with self._lock:
+                if self._error is not None:
+                    continue
+                try:
+                    self._write_data()
+                except BaseException as e:
+                    self._error = e
+
+    def _raise_error(self) -> None:
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _write_data(self) -> None:
+        if not self._data:
+            return
+        # Discard the data even if it can't be written, e.g. with a broken pipe
+        data = bytes(self._data)
+        self._data.clear()
+        self._stream.write(data)
+        self._stream.flush()
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self._interactive
+
+    def fileno(self) -> int:
+        return self._stream.fileno()
+
+    def write(self, data: Any) -> int:
+        with self._lock:
+            self._raise_error()
+            self._data += data
+            if len(self._data) >= self._buffer_size:
+                self._write_data()
+        return len(data)
+
+    def flush(self) -> None:
+        if self._interactive:
+            self.drain()
+
+    def drain(self) -> None:
+        with self._lock:
+            self._raise_error()
+            self._write_data()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+        try:
+            self.drain()
+        finally:
+            super().close()
+
+
+@contextmanager
+def buffered_output(
+    *,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+) -> Iterator[None]:
+    """
+    Accumulate everything written to standard output, e.g. with `typer.echo()`, in
+    a buffer of `buffer_size` bytes, instead of flushing it after each call.
+
+    The buffer is written when it's full, every `flush_interval` seconds and at the
+    end of the block. Output to a terminal is still flushed on every call, so
+    that prompts and progress show up. Standard error isn't buffered.
+
+    A broken pipe (`EPIPE`) is raised as an `OSError`, by the next write or at the
+    end of the block, and a Typer app exits with code 1, as it does without
+    buffering.
+
+    **Example**
+
+    ```python
+    @app.command()
+    def main():
+        with typer.buffered_output():
+            for number in range(10_000_000):
+                typer.echo(number)
+    ```
+    """
+    original = sys.stdout
+    binary = getattr(original, "buffer", None)
+    if binary is None or isinstance(binary, _OutputBuffer):
+        # Already buffered, or not a stream with an underlying binary buffer
+        yield
+        return
+    original.flush()
+    stream = io.TextIOWrapper(
+        _OutputBuffer(binary, buffer_size=buffer_size, flush_interval=flush_interval),  # type: ignore[type-var]
+        encoding=original.encoding,
+        errors=original.errors,
+        write_through=True,
+    )
+    sys.stdout = stream
+    try:
+        yield
+    finally:
+        if sys.stdout is stream:
+            sys.stdout = original
+        stream.close()
+
+
+def _flush_stream(stream: IO[str]) -> None:
+    stream.flush()
+    buffer = getattr(stream, "buffer", None)
+    if isinstance(buffer, _OutputBuffer):
+        buffer.drain()
+
+
+def _get_fileno(stream: IO[Any]) -> int | None:
+    try:
+        return stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        # E.g. io.StringIO or the streams of CliRunner
+        return None
+
+
+def _copy_to_stream(in_fd: int, stream: IO[str]) -> int:
+    binary: IO[bytes] | None = getattr(stream, "buffer", None)
+    total = 0
+    while chunk := os.read(in_fd, COPY_BLOCK_SIZE):
+        if binary is not None:
+            binary.write(chunk)
+        else:
+            encoding = getattr(stream, "encoding", None) or "utf-8"
+            stream.write(chunk.decode(encoding, "replace"))
+        total += len(chunk)
+    stream.flush()
+    return total
+
+
+def _write_all(out_fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(out_fd, view) :]
+
+
+def _copy_fds(in_fd: int, out_fd: int) -> int:
+    total = 0
+    while chunk := os.read(in_fd, COPY_BLOCK_SIZE):
+        _write_all(out_fd, chunk)
+        total += len(chunk)
+    return total
+
+
+def _sendfile(in_fd: int, out_fd: int) -> int | None:
+    """Copy a regular file with `os.sendfile()`, from its current position. Return
+    `None` if it's not supported for these files and nothing was copied.
+    """
+    start = offset = os.lseek(in_fd, 0, os.SEEK_CUR)
+    try:
+        while sent := os.sendfile(out_fd, in_fd, offset, _SENDFILE_BLOCK_SIZE):
+            offset += sent
+    except OSError as e:
+        if e.errno not in _UNSUPPORTED_ERRNOS or offset != start:
+            raise
+        return None
+    finally:
+        # sendfile() with an offset doesn't move the file position
+        os.lseek(in_fd, offset, os.SEEK_SET)
+    return offset - start
+
+
+def _splice(in_fd: int, out_fd: int) -> int | None:
+    """Move the data of a pipe with `os.splice()`. Return `None` if it's not
+    supported for these files and nothing was moved.
+    """
+    total = 0
+    try:
+        while moved := os.splice(in_fd, out_fd, COPY_BLOCK_SIZE):
+            total += moved
+    except OSError as e:
+        if e.errno not in _UNSUPPORTED_ERRNOS or total:
+            raise
+        return None
+    return total
+
+
+def _echo_fd(in_fd: int, stream: IO[str]) -> int:
+    out_fd = _get_fileno(stream)
+    if out_fd is None:
+        return _copy_to_stream(in_fd, stream)
+    copied: int | None = None
+    in_mode = os.fstat(in_fd).st_mode
+    if stat.S_ISREG(in_mode) and hasattr(os, "sendfile"):
+        copied = _sendfile(in_fd, out_fd)
+    elif stat.S_ISFIFO(in_mode) and hasattr(os, "splice"):
+        copied = _splice(in_fd, out_fd)
+    if copied is None:
+        copied = _copy_fds(in_fd, out_fd)
+    return copied
+
+
+def echo_file(file: str | os.PathLike[str] | int, *, err: bool = False) -> int:
+    """
+    Write the contents of a file, given by its path or an open file descriptor, to
+    standard output (or standard error with `err=True`) and return the number of
+    bytes written.
+
+    When possible, the data is copied by the kernel without going through Python:
+    with `os.sendfile()` for regular files, and `os.splice()` for pipes. Otherwise,
+    it's copied in blocks of 1 MiB. A file descriptor is read from its current
+    position and isn't closed.
+
+    A broken pipe (`EPIPE`) is raised as an `OSError`, and a Typer app exits with
+    code 1, as it does with `typer.echo()`.
+
+    **Example**
+
+    ```python
+    @app.command()
+    def cat(path: Path):
+        typer.echo_file(path)
+    ```
+    """
+    stream = sys.stderr if err else sys.stdout
+    # Keep the order with what was written before
+    _flush_stream(stream)
+    if isinstance(file, int):
+        return _echo_fd(file, stream)
+    in_fd = os.open(file, os.O_RDONLY)
+    try:
+        return _echo_fd(in_fd, stream)
+    finally:
+        os.close(in_fd)
@@ -0,0 +1,147 @@
+import contextvars
+import io
+import os
+import sys
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import click
+
+from ._batch import _local, _redirect_std_streams
+from ._forking import ExecutorMode, get_executor, get_worker_state
+from ._loop import close_event_loops
+from ._resources import close_resources
+from ._typing import Literal
+from .models import ParamMeta
+from .params import Option
+
+ParallelMode = ExecutorMode
+Workers = int | Literal["auto"]
+
+JOBS_PARAM_NAME = "typer_jobs"
+
+# Return value, output, error output and exception of the invocation for a chunk
+_ChunkResult = tuple[Any, str, str, BaseException | None]
+
+
+def get_jobs_param(workers: Workers) -> ParamMeta:
+    auto = workers == "auto"
+    return ParamMeta(
+        name=JOBS_PARAM_NAME,
+        default=Option(
+            None if auto else workers,
+            "--jobs",
+            "-j",
+            min=1,
+            show_default="one per CPU" if auto else True,
+            help="The number of parallel jobs.",
+        ),
+        annotation=int | None,
+    )
+
+
+def get_workers_count(workers: Workers) -> int:
+    if workers != "auto":
+        return workers
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def split_chunks(items: Sequence[Any], count: int) -> Iterator[list[Any]]:
+    """Split the items in `count` contiguous chunks of (almost) the same size."""
+    size, extra = divmod(len(items), count)
+    start = 0
+    for index in range(count):
+        end = start + size + (index < extra)
+        yield list(items[start:end])
+        start = end
+
+
+def _run_chunk(
+    call: Callable[[dict[str, Any]], Any],
+    ctx: click.Context,
+    params: dict[str, Any],
+) -> _ChunkResult:
+    output, stderr = io.StringIO(), io.StringIO()
+    _local.stdout, _local.stderr = output, stderr
+    value, exception = None, None
+    try:
+        with ctx.scope(cleanup=False):
+            value = call(params)
+    except BaseException as e:
+        exception = e
+    finally:
+        _local.stdout = _local.stderr = None
+    return value, output.getvalue(), stderr.getvalue(), exception
+
+
+def _run_chunk_forked(index: int) -> _ChunkResult:
+    call, ctx, chunk_params = get_worker_state()
+    try:
+        return _run_chunk(call, ctx, chunk_params[index])
+    finally:
+        close_resources(ctx.meta)
+        close_event_loops(ctx.meta)
+
+
+def map_chunks(
+    call: Callable[[dict[str, Any]], Any],
+    params: dict[str, Any],
+    *,
+    parallel_over: str,
+    workers: int,
+    mode: ParallelMode,
+) -> list[Any]:
+    """
+    Split the values of the `parallel_over` parameter in one chunk per worker, and
+    call `call` with the parameters for each chunk, in a pool of threads or
+    (forked) processes.
+
+    Returns the values returned for each chunk, in order. The output of each chunk is
+    captured and written once the previous chunks are done, so it's in input order
+    too. The first error, in input order, is re-raised.
+    """
+    value = params[parallel_over]
+    items = list(value) if value is not None else []
+    count = min(workers, len(items))
+    if count <= 1:
+        # Nothing to split, run in the current thread
+        return [call({**params, parallel_over: items if items else value})]
+    ctx = click.get_current_context()
+    chunk_params = [
+        {**params, parallel_over: chunk} for chunk in split_chunks(items, count)
+    ]
+    values: list[Any] = []
+    with _redirect_std_streams():
+        executor = get_executor(mode, count, state=(call, ctx, chunk_params))
+        forked = isinstance(executor, ProcessPoolExecutor)
+        with executor:
+            if forked:
+                futures = [
+                    executor.submit(_run_chunk_forked, index) for index in range(count)
+                ]
+            else:
+                # In copies of this context, e.g. to share the batch resources
+                futures = [
+                    executor.submit(
+                        contextvars.copy_context().run,
+                        _run_chunk,
+                        call,
+                        ctx,
+                        use_params,
+                    )
+                    for use_params in chunk_params
+                ]
+            for future in futures:
+                chunk_value, output, stderr, exception = future.result()
+                sys.stdout.write(output)
+                sys.stdout.flush()
+                sys.stderr.write(stderr)
+                sys.stderr.flush()
+                if exception is not None:
+                    executor.shutdown(cancel_futures=True)
+                    raise exception
+                values.append(chunk_value)
+    return values
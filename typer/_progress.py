@@ -0,0 +1,202 @@
+import sys
+import threading
+from collections.abc import Iterable, Iterator, Sized
+from types import TracebackType
+from typing import Any, TypeVar
+
+from .core import HAS_RICH
+
+T = TypeVar("T")
+
+DEFAULT_REFRESH_PER_SECOND = 4.0
+
+
+class ProgressTask:
+    """
+    A task of a `typer.progress()` display. Advancing it only updates a counter,
+    the display reads it at its own refresh rate, so it's cheap to call in tight
+    loops and safe to call from several threads or async tasks.
+    """
+
+    def __init__(self, description: str, total: float | None) -> None:
+        self.description = description
+        self.total = total
+        self.completed: float = 0
+        self._lock = threading.Lock()
+
+    def advance(self, advance: float = 1) -> None:
+        with self._lock:
+            self.completed += advance
+
+    def update(
+        self,
+        *,
+        completed: float | None = None,
+        total: float | None = None,
+        description: str | None = None,
+    ) -> None:
+        with self._lock:
+            if completed is not None:
+                self.completed = completed
+            if total is not None:
+                self.total = total
+            if description is not None:
+                self.description = description
+
+    def format(self) -> str:
+        completed = f"{self.completed:g}"
+        if not self.total:
+            return f"{self.description}: {completed}"
+        percentage = self.completed / self.total
+        return f"{self.description}: {completed}/{self.total:g} ({percentage:.0%})"
+
+
+class Progress:
+    """
+    Progress display returned by `typer.progress()`. Use it as a context manager
+    and add tasks to it with `add_task()` or `track()`.
+    """
+
+    def __init__(
+        self,
+        *,
+        refresh_per_second: float = DEFAULT_REFRESH_PER_SECOND,
+        log_interval: float | None = None,
+        transient: bool = False,
+    ) -> None:
+        if refresh_per_second <= 0:
+            raise ValueError(
+                f"refresh_per_second must be positive, not {refresh_per_second}"
+            )
+        if log_interval is not None and log_interval <= 0:
+            raise ValueError(f"log_interval must be positive, not {log_interval}")
+        self.refresh_per_second = refresh_per_second
+        self.log_interval = log_interval
+        self.transient = transient
+        self.tasks: list[ProgressTask] = []
+        self._rich_progress: Any = None
+        self._rich_task_ids: list[Any] = []
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def add_task(self, description: str, *, total: float | None = None) -> ProgressTask:
+        task = ProgressTask(description, total)
+        # Appending is atomic, the display only reads the list
+        self.tasks.append(task)
+        return task
+
+    def track(
+        self,
+        iterable: Iterable[T],
+        description: str = "Working...",
+        *,
+        total: float | None = None,
+    ) -> Iterator[T]:
+        """Iterate over `iterable`, advancing a new task for each item."""
+        if total is None and isinstance(iterable, Sized):
+            total = len(iterable)
+        task = self.add_task(description, total=total)
+        # Only this generator advances the task, assigning the count needs no lock
+        for completed, item in enumerate(iterable, 1):
+            yield item
+            task.completed = completed
+
+    def _refresh_rich(self) -> None:
+        progress = self._rich_progress
+        for index, task in enumerate(list(self.tasks)):
+            if index == len(self._rich_task_ids):
+                self._rich_task_ids.append(
+                    progress.add_task(task.description, total=task.total)
+                )
+            progress.update(
+                self._rich_task_ids[index],
+                completed=task.completed,
+                total=task.total,
+                description=task.description,
+            )
+        progress.refresh()
+
+    def _log(self) -> None:
+        lines = "".join(f"{task.format()}\n" for task in list(self.tasks))
+        sys.stderr.write(lines)
+        sys.stderr.flush()
+
+    def _refresh(self) -> None:
+        if self._rich_progress is not None:
+            self._refresh_rich()
+        elif self.log_interval is not None:
+            self._log()
+
+    def _run(self, interval: float) -> None:
+        while not self._stopped.wait(interval):
+            self._refresh()
+
+    def __enter__(self) -> "Progress":
+        if HAS_RICH:
+            from . import rich_utils
+
+            self._rich_progress = rich_utils.make_progress(transient=self.transient)
+        interval: float | None = None
+        if self._rich_progress is not None:
+            self._rich_progress.start()
+            interval = 1 / self.refresh_per_second
+        elif self.log_interval is not None:
+            interval = self.log_interval
+        # Otherwise, nothing is displayed and the tasks are only counters
+        if interval is not None:
+            self._thread = threading.Thread(
+                target=self._run, args=(interval,), name="typer-progress", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+        # Show the final state
+        self._refresh()
+        if self._rich_progress is not None:
+            self._rich_progress.stop()
+            self._rich_progress = None
+
+
+def progress(
+    *,
+    refresh_per_second: float = DEFAULT_REFRESH_PER_SECOND,
+    log_interval: float | None = None,
+    transient: bool = False,
+) -> Progress:
+    """
+    Show the progress of one or more tasks with a Rich progress display on stderr.
+
+    Advancing a task only updates a counter, the display is refreshed from a
+    background thread `refresh_per_second` times per second, so it's cheap even in
+    tight loops. Tasks can be advanced from several threads or async tasks.
+
+    When stderr isn't a terminal (or Rich is disabled), nothing is displayed, or a
+    line per task is logged every `log_interval` seconds, if set. With `transient`,
+    the display is removed at the end.
+
+    **Example**
+
+    ```python
+    @app.command()
+    def main(paths: list[Path]):
+        with typer.progress() as progress:
+            for path in progress.track(paths, "Processing"):
+                process(path)
+    ```
+    """
+    return Progress(
+        refresh_per_second=refresh_per_second,
+        log_interval=log_interval,
+        transient=transient,
+    )
@@ -0,0 +1,162 @@
+import csv
+import dataclasses
+import itertools
+import json
+import sys
+from collections.abc import Iterable, Iterator, Mapping
+from typing import IO, Any
+
+from ._typing import Literal
+from .models import ParamMeta
+from .params import Option
+
+OutputFormat = Literal["table", "json", "jsonl", "csv", "tsv"]
+
+OUTPUT_PARAM_NAME = "typer_output"
+
+# Records used to compute the column widths of a table, the rest are streamed
+TABLE_SAMPLE_SIZE = 100
+MAX_COLUMN_WIDTH = 50
+
+
+def get_output_param(default: OutputFormat) -> ParamMeta:
+    return ParamMeta(
+        name=OUTPUT_PARAM_NAME,
+        default=Option(
+            default,
+            "--output",
+            case_sensitive=False,
+            help="The output format.",
+        ),
+        annotation=OutputFormat,
+    )
+
+
+def _to_record(value: Any) -> Mapping[str, Any]:
+    if isinstance(value, Mapping):
+        return value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            field.name: getattr(value, field.name)
+            for field in dataclasses.fields(value)
+        }
+    if isinstance(value, tuple) and hasattr(value, "_asdict"):
+        record: Mapping[str, Any] = value._asdict()
+        return record
+    return {"value": value}
+
+
+def iter_records(value: Any) -> Iterator[Mapping[str, Any]]:
+    """
+    Iterate over the records returned by a command: an iterable (e.g. a generator)
+    of mappings, dataclasses or named tuples, or a single one of them.
+    """
+    if value is None:
+        return
+    if (
+        isinstance(value, (Mapping, str, bytes))
+        or not isinstance(value, Iterable)
+        or (dataclasses.is_dataclass(value) and not isinstance(value, type))
+        or (isinstance(value, tuple) and hasattr(value, "_asdict"))
+    ):
+        yield _to_record(value)
+        return
+    for item in value:
+        yield _to_record(item)
+
+
+def _dumps(record: Mapping[str, Any]) -> str:
+    return json.dumps(record, default=str, ensure_ascii=False)
+
+
+def _write_json(records: Iterator[Mapping[str, Any]], stream: IO[str]) -> None:
+    # A JSON array written one record at a time
+    separator = "[\n"
+    for record in records:
+        stream.write(f"{separator}  {_dumps(record)}")
+        separator = ",\n"
+    stream.write("[]\n" if separator == "[\n" else "\n]\n")
+
+
+def _write_jsonl(records: Iterator[Mapping[str, Any]], stream: IO[str]) -> None:
+    for record in records:
+        stream.write(f"{_dumps(record)}\n")
+
+
+def _write_delimited(
+    records: Iterator[Mapping[str, Any]], stream: IO[str], *, delimiter: str
+) -> None:
+    first = next(records, None)
+    if first is None:
+        return
+    # The columns are the keys of the first record
+    writer = csv.DictWriter(
+        stream,
+        fieldnames=list(first),
+        delimiter=delimiter,
+        extrasaction="ignore",
+        lineterminator="\n",
+    )
+    writer.writeheader()
+    writer.writerow(first)
+    for record in records:
+        writer.writerow(record)
+
+
+def _format_cell(value: Any) -> str:
+    if value is None:
+        return ""
+    return " ".join(str(value).split())
+
+
+def _fit_cell(value: Any, width: int) -> str:
+    text = _format_cell(value)
+    if len(text) > width:
+        text = text[: width - 1] + "…"
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return text.rjust(width)
+    return text.ljust(width)
+
+
+def _write_table(records: Iterator[Mapping[str, Any]], stream: IO[str]) -> None:
+    sample = list(itertools.islice(records, TABLE_SAMPLE_SIZE))
+    if not sample:
+        return
+    columns: dict[str, int] = {}
+    for record in sample:
+        for key in record:
+            columns.setdefault(key, len(key))
+    for key in columns:
+        for record in sample:
+            columns[key] = max(columns[key], len(_format_cell(record.get(key))))
+        columns[key] = min(columns[key], MAX_COLUMN_WIDTH)
+    stream.write("  ".join(key.ljust(width) for key, width in columns.items()).rstrip())
+    stream.write("\n")
+    stream.write("  ".join("-" * width for width in columns.values()))
+    stream.write("\n")
+    for record in itertools.chain(sample, records):
+        row = "  ".join(
+            _fit_cell(record.get(key), width) for key, width in columns.items()
+        )
+        stream.write(f"{row.rstrip()}\n")
+
+
+def write_records(
+    value: Any, output_format: OutputFormat, stream: IO[str] | None = None
+) -> None:
+    """
+    Write the records returned by a command to `stream` (stdout by default) as
+    they are produced, without keeping them in memory.
+    """
+    use_stream = stream or sys.stdout
+    records = iter_records(value)
+    if output_format == "json":
+        _write_json(records, use_stream)
+    elif output_format == "jsonl":
+        _write_jsonl(records, use_stream)
+    elif output_format == "csv":
+        _write_delimited(records, use_stream, delimiter=",")
+    elif output_format == "tsv":
+        _write_delimited(records, use_stream, delimiter="\t")
+    else:
+        _write_table(records, use_stream)
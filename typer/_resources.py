@@ -0,0 +1,188 @@
+import atexit
+import contextvars
+import inspect
+import os
+import threading
+from collections.abc import Callable, Generator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from typing import Any
+
+import click
+
+from .models import DependsInfo, ResourceScope
+from .utils import get_params_from_function
+
+RESOURCES_META_KEY = "typer.resources"
+
+# Resources shared by the invocations of the current process, per process to not
+# reuse the resources of the parent in forked children
+_process_stores: dict[int, "ResourceStore"] = {}
+# Resources shared by the invocations of the `Typer.invoke_many()` batch running in
+# the current context, batches running at the same time in other threads have
+# their own
+_batch_store: contextvars.ContextVar["ResourceStore | None"] = contextvars.ContextVar(
+    "typer_batch_store", default=None
+)
+_stores_lock = threading.Lock()
+
+
+class ResourceStore:
+    """
+    Resources created by providers, once each, and the teardowns closing them in
+    reverse order.
+    """
+
+    def __init__(self) -> None:
+        self.pid = os.getpid()
+        self._values: dict[Callable[..., Any], Any] = {}
+        # Only held to access the values, not while a provider runs
+        self._lock = threading.Lock()
+        # One per provider, so it's only called once. Reentrant, for the error of
+        # a provider depending on itself
+        self._provider_locks: dict[Callable[..., Any], threading.RLock] = {}
+        self._exit_stack = ExitStack()
+
+    def get(self, ctx: click.Context, provider: Callable[..., Any]) -> Any:
+        with self._lock:
+            if provider in self._values:
+                return self._values[provider]
+            provider_lock = self._provider_locks.setdefault(provider, threading.RLock())
+        with provider_lock:
+            with self._lock:
+                # Created by another thread while waiting
+                if provider in self._values:
+                    return self._values[provider]
+            value = _call_provider(ctx, provider)
+            with self._lock:
+                if inspect.isgenerator(value):
+                    generator = value
+                    value = next(generator)
+                    self._exit_stack.callback(_finish_generator, provider, generator)
+                self._values[provider] = value
+            return value
+
+    def close(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._provider_locks.clear()
+            exit_stack, self._exit_stack = self._exit_stack, ExitStack()
+        # The teardowns can use other resources
+        exit_stack.close()
+
+
+def _finish_generator(
+    provider: Callable[..., Any], generator: Generator[Any, Any, Any]
+) -> None:
+    try:
+        next(generator)
+    except StopIteration:
+        return
+    raise RuntimeError(f"Resource provider didn't stop after yielding: {provider}")
+
+
+def _call_provider(ctx: click.Context, provider: Callable[..., Any]) -> Any:
+    kwargs: dict[str, Any] = {}
+    try:
+        params = get_params_from_function(provider)
+    except (TypeError, ValueError):
+        # No signature, e.g. some builtins
+        params = {}
+    for name, param in params.items():
+        if isinstance(param.default, DependsInfo):
+            kwargs[name] = get_resource(
+                ctx, param.default.dependency, scope=param.default.scope
+            )
+        elif inspect.isclass(param.annotation) and issubclass(
+            param.annotation, click.Context
+        ):
+            kwargs[name] = ctx
+    return provider(**kwargs)
+
+
+def _get_invocation_store(ctx: click.Context) -> ResourceStore:
+    # ctx.meta is shared by all the contexts of the invocation
+    with _stores_lock:
+        stores: dict[int, ResourceStore] = ctx.meta.setdefault(RESOURCES_META_KEY, {})
+        pid = os.getpid()
+        store = stores.get(pid)
+        if store is None:
+            store = stores[pid] = ResourceStore()
+            ctx.find_root().call_on_close(lambda: close_resources(ctx.meta))
+    return store
+
+
+def _get_process_store() -> ResourceStore:
+    with _stores_lock:
+        pid = os.getpid()
+        batch_store = _batch_store.get()
+        if batch_store is not None and batch_store.pid == pid:
+            return batch_store
+        store = _process_stores.get(pid)
+        if store is None:
+            store = _process_stores[pid] = ResourceStore()
+            atexit.register(store.close)
+    return store
+
+
+def get_resource(
+    ctx: click.Context,
+    provider: Callable[..., Any],
+    *,
+    scope: ResourceScope = "invocation",
+) -> Any:
+    """
+    Return the resource created by `provider`, calling it on first use in the
+    `scope`.
+
+    The provider can declare a `typer.Context` parameter and parameters with other
+    `typer.Depends()` resources. When it's a generator, the yielded value is the
+    resource, and the code after the `yield` runs when the scope ends.
+    """
+    if scope == "process":
+        return _get_process_store().get(ctx, provider)
+    return _get_invocation_store(ctx).get(ctx, provider)
+
+
+def close_resources(meta: dict[str, Any]) -> None:
+    """Close the resources created by the current process for an invocation."""
+    stores: dict[int, ResourceStore] = meta.get(RESOURCES_META_KEY, {})
+    store = stores.pop(os.getpid(), None)
+    if store is not None:
+        store.close()
+
+
+def close_process_resources() -> None:
+    """Close the resources shared by the invocations of the current process."""
+    store = _process_stores.pop(os.getpid(), None)
+    if store is not None:
+        atexit.unregister(store.close)
+        store.close()
+
+
+@contextmanager
+def batch_resources() -> Iterator[None]:
+    """
+    Share the `"process"` resources and `ctx.executor` between the invocations run
+    in this block, and close them at the end.
+    """
+    if _batch_store.get() is not None:
+        # Nested batch, the outer one owns the resources
+        yield
+        return
+    store = ResourceStore()
+    token = _batch_store.set(store)
+    try:
+        yield
+    finally:
+        _batch_store.reset(token)
+        store.close()
+
+
+def in_batch() -> bool:
+    return _batch_store.get() is not None
+
+
+def create_executor() -> Iterator[ThreadPoolExecutor]:
+    with ThreadPoolExecutor() as executor:
+        yield executor
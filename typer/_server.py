@@ -0,0 +1,355 @@
+import errno
+import gc
+import inspect
+import json
+import os
+import signal
+import socket
+import stat
+import struct
+import sys
+import traceback
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import click
+
+from ._resources import close_process_resources
+from .core import HAS_RICH
+
+# Invocation requests: a 4 bytes length, then the JSON encoded request, with the
+# stdin, stdout and stderr file descriptors of the client attached (SCM_RIGHTS)
+_LENGTH = struct.Struct("!I")
+# Responses: the pid of the child running the command, so the client can forward
+# signals like SIGINT to it, then its exit code
+_PID = struct.Struct("!i")
+_EXIT_CODE = struct.Struct("!i")
+MAX_REQUEST_SIZE = 64 * 1024 * 1024
+# Seconds a client has to send its request, so a stalled one doesn't block the
+# server, which reads the requests one at a time
+REQUEST_TIMEOUT = 5.0
+# Seconds between checks for finished children while no request arrives
+_REAP_INTERVAL = 1.0
+
+
+def _check_supported() -> None:
+    if not hasattr(socket, "AF_UNIX") or not hasattr(os, "fork"):
+        raise RuntimeError("Serving an app requires UNIX sockets and fork()")
+
+
+def _remove_stale_socket(path: str) -> None:
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(
+            errno.EEXIST, "File exists and is not a socket, not replacing it", path
+        )
+    # A socket left behind by a previous server
+    os.unlink(path)
+
+
+def _bind(server: socket.socket, path: str) -> int:
+    # Only the user running the server can connect to it, the socket is created
+    # with these permissions so there's no window where others can
+    previous_umask = os.umask(0o177)
+    try:
+        server.bind(path)
+    finally:
+        os.umask(previous_umask)
+    os.chmod(path, 0o600)
+    return os.lstat(path).st_ino
+
+
+def _is_same_user(conn: socket.socket) -> bool:
+    if not hasattr(socket, "SO_PEERCRED"):  # pragma: no cover
+        # E.g. macOS, only the permissions of the socket protect it
+        return True
+    credentials = conn.getsockopt(
+        socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+    )
+    uid: int = struct.unpack("3i", credentials)[1]
+    return uid == os.getuid()
+
+
+def _receive_request(conn: socket.socket) -> tuple[dict[str, Any], list[int]]:
+    data, fds, _, _ = socket.recv_fds(conn, 64 * 1024, 3)
+    try:
+        if len(fds) != 3 or len(data) < _LENGTH.size:
+            raise ValueError("Invalid request")
+        (size,) = _LENGTH.unpack_from(data)
+        if size > MAX_REQUEST_SIZE:
+            raise ValueError("Request too large")
+        chunks = [data[_LENGTH.size :]]
+        received = len(chunks[0])
+        while received < size:
+            chunk = conn.recv(min(size - received, 1024 * 1024))
+            if not chunk:
+                raise ValueError("Incomplete request")
+            chunks.append(chunk)
+            received += len(chunk)
+        request = json.loads(b"".join(chunks))
+        if not isinstance(request, dict):
+            raise ValueError("Invalid request")
+        return request, fds
+    except BaseException:
+        for fd in fds:
+            os.close(fd)
+        raise
+
+
+def _open_std_stream(fd: int, mode: str) -> Any:
+    buffering = 1 if "w" in mode and os.isatty(fd) else -1
+    return open(fd, mode, buffering=buffering, closefd=False)
+
+
+def _run_request(
+    command: click.Command,
+    request: dict[str, Any],
+    fds: Sequence[int],
+    prog_name: str | None,
+) -> int:
+    for fd, std_fd in zip(fds, (0, 1, 2), strict=True):
+        os.dup2(fd, std_fd)
+        os.close(fd)
+    sys.stdin = _open_std_stream(0, "r")
+    sys.stdout = _open_std_stream(1, "w")
+    sys.stderr = _open_std_stream(2, "w")
+    args = [str(arg) for arg in request.get("argv", [])]
+    use_prog_name = request.get("prog_name") or prog_name
+    try:
+        os.environ.clear()
+        os.environ.update(request.get("env", {}))
+        os.chdir(request.get("cwd") or "/")
+        sys.argv = [use_prog_name or "", *args]
+        command.main(args=args, prog_name=use_prog_name)
+        exit_code = 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            exit_code = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+            exit_code = 1
+    except BaseException:
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        try:
+            close_process_resources()
+        except Exception:
+            traceback.print_exc()
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except OSError:
+                pass
+    return exit_code
+
+
+def _prewarm() -> None:
+    # Import what invocations would import lazily, once for all the children
+    if HAS_RICH:
+        from . import rich_utils  # noqa: F401
+    # Move everything allocated so far out of the garbage collector's generations,
+    # so that the collections in the children don't write to (and copy) the pages
+    # shared with the server
+    gc.collect()
+    gc.freeze()
+
+
+def _reap_children() -> None:
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+
+
+def serve(
+    command: click.Command,
+    path: str | Path,
+    *,
+    prog_name: str | None,
+    prewarm: bool = True,
+) -> None:
+    """
+    Listen for invocation requests on a UNIX socket, running each one in a forked
+    child that inherits the already imported app and built command.
+
+    With `prewarm`, the lazy imports are done and the heap is frozen (`gc.freeze()`)
+    before serving, so the children share the memory of the server copy-on-write.
+    """
+    _check_supported()
+    path = os.fspath(path)
+    _remove_stale_socket(path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Wake up regularly to reap the finished children
+    server.settimeout(_REAP_INTERVAL)
+    previous_sigterm = signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    inode: int | None = None
+    try:
+        if prewarm:
+            _prewarm()
+        inode = _bind(server, path)
+        server.listen()
+        while True:
+            _reap_children()
+            try:
+                conn, _ = server.accept()
+            except TimeoutError:
+                continue
+            with conn:
+                conn.settimeout(REQUEST_TIMEOUT)
+                try:
+                    if not _is_same_user(conn):
+                        continue
+                    request, fds = _receive_request(conn)
+                except (OSError, ValueError):
+                    # Including timeouts, socket.timeout is an OSError
+                    continue
+                # Don't duplicate pending output in the child
+                sys.stdout.flush()
+                sys.stderr.flush()
+                pid = os.fork()
+                if pid == 0:  # pragma: no cover
+                    exit_code = 1
+                    try:
+                        signal.signal(signal.SIGTERM, previous_sigterm)
+                        server.close()
+                        conn.settimeout(None)
+                        conn.sendall(_PID.pack(os.getpid()))
+                        exit_code = _run_request(command, request, fds, prog_name)
+                        conn.sendall(_EXIT_CODE.pack(exit_code))
+                    finally:
+                        os._exit(exit_code & 0xFF)
+                for fd in fds:
+                    os.close(fd)
+    finally:
+        if prewarm:
+            gc.unfreeze()
+        signal.signal(signal.SIGTERM, previous_sigterm)
+        server.close()
+        # Only remove the socket this server created
+        try:
+            if inode is not None and os.lstat(path).st_ino == inode:
+                os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+def run_client(
+    path: str,
+    argv: Sequence[str],
+    prog_name: str | None = None,
+    fds: Sequence[int] = (0, 1, 2),
+    fallback: Sequence[str] | None = None,
+) -> int:
+    """
+    Send an invocation request to an app served with `app.serve()` and return the
+    exit code. The output is written directly by the server to the given file
+    descriptors.
+
+    If the server is not running, execute the `fallback` command instead, if any.
+    `SIGINT` (Ctrl-C) and `SIGTERM` received while the command runs are forwarded to
+    the process running it.
+
+    This function is copied in client shims, it has to be self-contained.
+    """
+    import json
+    import os
+    import signal
+    import socket
+    import struct
+
+    payload = json.dumps(
+        {
+            "argv": list(argv),
+            "prog_name": prog_name,
+            "env": dict(os.environ),
+            "cwd": os.getcwd(),
+        }
+    ).encode()
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            client.connect(path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            if not fallback:
+                raise
+            os.execvp(fallback[0], [*fallback, *argv])
+        message = struct.pack("!I", len(payload)) + payload
+        sent = socket.send_fds(client, [message], list(fds))
+        client.sendall(message[sent:])
+
+        def receive_int() -> int | None:
+            response = b""
+            while len(response) < 4:
+                chunk = client.recv(4 - len(response))
+                if not chunk:
+                    return None
+                response += chunk
+            (value,) = struct.unpack("!i", response)
+            return int(value)
+
+        pid = receive_int()
+        if pid is None:
+            raise ConnectionResetError("The server rejected the request")
+
+        def forward(signum: int, frame: object) -> None:
+            os.kill(pid, signum)
+
+        previous_handlers = {}
+        try:
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                previous_handlers[signum] = signal.signal(signum, forward)
+        except ValueError:  # pragma: no cover
+            # Not in the main thread, signals can't be handled
+            pass
+        try:
+            exit_code = receive_int()
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+        # None if the child running the command was killed
+        return 1 if exit_code is None else exit_code
+    finally:
+        client.close()
+
+
+def get_client_shim(
+    path: str | Path,
+    *,
+    prog_name: str | None = None,
+    fallback: Sequence[str] | None = None,
+) -> str:
+    """
+    Return the source of a standalone Python script sending its arguments to the
+    app served at `path`, to use instead of the app's own script.
+
+    It only imports standard library modules, so it starts much faster than an app.
+    """
+    source = inspect.getsource(run_client)
+    arguments = ", ".join(
+        [
+            repr(os.fspath(path)),
+            "sys.argv[1:]",
+            f"prog_name={prog_name!r}",
+            f"fallback={list(fallback) if fallback else None!r}",
+        ]
+    )
+    return (
+        f"#!{sys.executable} -S\n"
+        "# Generated by Typer, a client for an app served with app.serve()\n"
+        "import sys\n"
+        "from collections.abc import Sequence\n"
+        "\n"
+        "\n"
+        f"{source}\n"
+        "\n"
+        'if __name__ == "__main__":\n'
+        f"    sys.exit(run_client({arguments}))\n"
+    )
@@ -0,0 +1,199 @@
+import io
+import os
+import queue
+import secrets
+import shutil
+import sys
+import threading
+from typing import IO, Any
+
+import click
+import click._compat
+
+from ._compression import DEFAULT_BUFFER_SIZE
+
+# Chunks of buffer_size bytes queued for the background writer before write() blocks
+WRITE_BEHIND_QUEUE_SIZE = 8
+
+
+class _Sink(io.RawIOBase):
+    """The raw end of an output file: writes to `stream`, optionally calling
+    `os.fsync()` before closing it. Streams that aren't owned, like stdout, are
+    only flushed when the file is closed.
+    """
+
+    def __init__(self, stream: IO[bytes], *, close: bool, fsync: bool) -> None:
+        self._stream = stream
+        self._close = close
+        self._fsync = fsync
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        written: int | None = self._stream.write(data)
+        return len(data) if written is None else written
+
+    def flush(self) -> None:
+        super().flush()
+        self._stream.flush()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            self.flush()
+            if self._fsync and self._close:
+                os.fsync(self._stream.fileno())
+        finally:
+            super().close()
+            if self._close:
+                self._stream.close()
+
+
+class _WriteBehind(io.RawIOBase):
+    """Hand the writes to a background thread, so the command doesn't wait for
+    the write syscalls. Errors of the background thread are raised by the next
+    `write()`, `flush()` or `close()`.
+    """
+
+    def __init__(self, raw: io.RawIOBase) -> None:
+        self._raw = raw
+        self._queue: queue.Queue[bytes | None] = queue.Queue(WRITE_BEHIND_QUEUE_SIZE)
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(
+            target=self._run, name="typer-write-behind", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            data = self._queue.get()
+            try:
+                if data is None:
+                    return
+                if self._error is None:
+                    view = memoryview(data)
+                    while view:
+                        view = view[self._raw.write(view) or 0 :]
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self) -> None:
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._raise_error()
+        # The buffered writer reuses its buffer, it has to be copied
+        chunk = bytes(data)
+        self._queue.put(chunk)
+        return len(chunk)
+
+    def flush(self) -> None:
+        super().flush()
+        self._queue.join()
+        self._raise_error()
+        self._raw.flush()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._queue.put(None)
+            self._thread.join()
+            super().close()
+            self._raw.close()
+
+
+def open_writer(
+    filename: str | os.PathLike[str],
+    mode: str,
+    *,
+    atomic: bool = False,
+    buffer_size: int | None = None,
+    fsync: bool = False,
+    write_behind: bool = False,
+) -> io.BufferedWriter:
+    """
+    Open a binary output file with a `buffer_size` buffer. `-` is stdout, which is
+    flushed but not closed when the returned file is closed.
+    """
+    stream: IO[bytes]
+    if os.fspath(filename) == "-":
+        stream, should_close = click.get_binary_stream("stdout"), False
+    elif atomic:
+        stream, should_close = click._compat.open_stream(filename, mode, atomic=True)
+    else:
+        # Unbuffered, the only buffer is the one with buffer_size
+        stream, should_close = open(filename, mode, buffering=0), True
+    raw: io.RawIOBase = _Sink(stream, close=should_close, fsync=fsync)
+    if write_behind:
+        raw = _WriteBehind(raw)
+    return io.BufferedWriter(raw, buffer_size or DEFAULT_BUFFER_SIZE)
+
+
+def _succeeded() -> bool:
+    # Close callbacks run while the exception of the command is being handled
+    error = sys.exc_info()[1]
+    return error is None or (
+        isinstance(error, click.exceptions.Exit) and error.exit_code == 0
+    )
+
+
+def _replace_directory(staging: str, target: str) -> None:
+    if not _succeeded():
+        shutil.rmtree(staging, ignore_errors=True)
+        return
+    if not os.path.isdir(target) or os.path.islink(target):
+        os.replace(staging, target)
+        return
+    # A non-empty directory can't be replaced in a single rename, so this isn't
+    # atomic: between the two renames there's nothing at target
+    backup = f"{staging}.old"
+    os.rename(target, backup)
+    try:
+        os.rename(staging, target)
+    except BaseException:
+        os.rename(backup, target)
+        raise
+    shutil.rmtree(backup, ignore_errors=True)
+
+
+def stage_directory(
+    target: str | bytes | os.PathLike[str], ctx: click.Context
+) -> str | bytes | os.PathLike[str]:
+    """
+    Create an empty staging directory next to `target` and return its path. When
+    the command finishes successfully, the staging directory replaces `target`,
+    otherwise it's removed.
+
+    An existing `target` is first renamed to a backup and then replaced, the swap
+    is not atomic.
+    """
+    target_str = os.path.abspath(os.fsdecode(target))
+    parent, name = os.path.split(target_str)
+    while True:
+        # Not tempfile.mkdtemp(), the directory is created with the usual permissions
+        staging = os.path.join(parent, f".{name}.{secrets.token_hex(4)}.tmp")
+        try:
+            os.mkdir(staging)
+        except FileExistsError:  # pragma: no cover
+            continue
+        break
+    if os.path.isdir(target_str):
+        shutil.copymode(target_str, staging)
+    ctx.call_on_close(lambda: _replace_directory(staging, target_str))
+    if isinstance(target, bytes):
+        return os.fsencode(staging)
+    if isinstance(target, str):
+        return staging
+    return type(target)(staging)  # type: ignore[call-arg]
@@ -314,5 +314,51 @@ def docs(
         typer.echo(clean_docs)
 
 
+@utils_app.command()
+def serve(
+    socket: Path = typer.Option(
+        ..., help="The path of the UNIX socket to serve the app on."
+    ),
+    shim: Path | None = typer.Option(
+        None,
+        help="Write a lightweight client script sending its arguments to the "
+        "served app, it runs the app directly when the server is not running.",
+        file_okay=True,
+        dir_okay=False,
+    ),
+    name: str = typer.Option("", help="The name of the CLI program to use."),
+    prewarm: bool = typer.Option(
+        True,
+        help="Do the lazy imports and freeze the heap (gc.freeze()) before serving, "
+        "to share the memory of the server with the invocations.",
+    ),
+) -> None:
+    """
+    Serve a Typer app on a UNIX socket, running each invocation in a forked process.
+    """
+    typer_obj = get_typer_from_state()
+    if not typer_obj:
+        typer.echo("No Typer app found", err=True)
+        raise typer.Abort()
+    typer_obj._add_completion = False
+    if shim:
+        target = str(state.file.resolve()) if state.file else str(state.module)
+        # This package, whatever its name (e.g. when renamed in a build)
+        fallback = [sys.executable, "-m", __name__.rpartition(".")[0], target]
+        if state.app:
+            fallback.extend(["--app", state.app])
+        elif state.func:
+            fallback.extend(["--func", state.func])
+        fallback.append("run")
+        shim.write_text(
+            typer.get_client_shim(
+                socket.resolve(), prog_name=name or None, fallback=fallback
+            )
+        )
+        shim.chmod(0o755)
+        typer.echo(f"Client saved to: {shim}")
+    typer_obj.serve(socket, prog_name=name or None, prewarm=prewarm)
+
+
 def main() -> Any:
     return app()
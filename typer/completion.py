@@ -143,8 +143,17 @@ def shell_complete(
         return 0
 
     # Typer override to print the completion help msg with Rich
+    # and to write the completions as they are produced
     if instruction == "complete":
-        click.echo(comp.complete())
+        stream_complete = getattr(comp, "stream_complete", None)
+        if stream_complete is None:  # pragma: no cover
+            click.echo(comp.complete())
+            return 0
+        out = click.get_text_stream("stdout")
+        for chunk in stream_complete():
+            out.write(chunk)
+        out.write("\n")
+        out.flush()
         return 0
     # Typer override end
 
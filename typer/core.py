@@ -1,12 +1,22 @@
+import contextlib
 import errno
+import importlib.metadata
 import inspect
+import itertools
 import os
 import sys
-from collections.abc import Callable, MutableMapping, Sequence
-from difflib import get_close_matches
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
 from enum import Enum
 from gettext import gettext as _
 from typing import (
+    TYPE_CHECKING,
     Any,
     TextIO,
     Union,
@@ -16,11 +26,19 @@ from typing import (
 import click
 import click.core
 import click.formatting
+import click.parser
 import click.shell_completion
 import click.types
 import click.utils
 
+from ._argsfile import expand_argsfiles, iter_stdin_arguments
+from ._buffers import BufferFactory
+from ._chain import ChainParallelMode, invoke_parallel, invoke_sequential
+from ._lookup import FuzzyIndex, PrefixIndex, TrackedDict, TrackedList
+from ._loop import LoopFactory
+from ._output import buffered_output
 from ._typing import Literal
+from .models import Context
 from .utils import parse_boolean_env_var
 
 MarkupMode = Literal["markdown", "rich", None]
@@ -66,11 +84,11 @@ def _typer_param_setup_autocompletion_compat(
 
         def compat_autocompletion(
             ctx: click.Context, param: click.core.Parameter, incomplete: str
-        ) -> list["click.shell_completion.CompletionItem"]:
+        ) -> Iterator["click.shell_completion.CompletionItem"]:
             from click.shell_completion import CompletionItem
 
-            out = []
-
+            # Lazy, so that the items of generator callbacks are written to the
+            # shell as they are produced
             for c in autocompletion(ctx, [], incomplete):
                 if isinstance(c, tuple):
                     use_completion = CompletionItem(c[0], help=c[1])
@@ -79,11 +97,22 @@ def _typer_param_setup_autocompletion_compat(
                     use_completion = CompletionItem(c)
 
                 if use_completion.value.startswith(incomplete):
-                    out.append(use_completion)
+                    yield use_completion
+
+        self._custom_shell_complete = compat_autocompletion  # type: ignore[assignment]
 
-            return out
 
-        self._custom_shell_complete = compat_autocompletion
+def _typer_param_shell_complete(
+    self: click.Parameter, *, ctx: click.Context, incomplete: str
+) -> Iterable["click.shell_completion.CompletionItem"]:
+    # Modified version of click.core.Parameter.shell_complete() that doesn't
+    # materialize the results of the custom completion function
+    if self._custom_shell_complete is not None:
+        from click.shell_completion import CompletionItem
+
+        results = self._custom_shell_complete(ctx, self, incomplete)
+        return (CompletionItem(c) if isinstance(c, str) else c for c in results)
+    return self.type.shell_complete(ctx, self, incomplete)
 
 
 def _get_default_string(
@@ -184,7 +213,16 @@ def _main(
 
     try:
         try:
-            with self.make_context(prog_name, args, **extra) as ctx:
+            # Typer override
+            if getattr(self, "expand_argsfiles", False):
+                args = expand_argsfiles(args)
+            output = (
+                buffered_output()
+                if getattr(self, "buffered_output", False)
+                else contextlib.nullcontext()
+            )
+            # Typer override end
+            with output, self.make_context(prog_name, args, **extra) as ctx:
                 rv = self.invoke(ctx)
                 if not standalone_mode:
                     return rv
@@ -205,12 +243,7 @@ def _main(
             if not standalone_mode:
                 raise
             # Typer override
-            if HAS_RICH and rich_markup_mode is not None:
-                from . import rich_utils
-
-                rich_utils.rich_format_error(e)
-            else:
-                e.show()
+            _show_click_exception(e, rich_markup_mode=rich_markup_mode)
             # Typer override end
             sys.exit(e.exit_code)
         except OSError as e:
@@ -237,16 +270,92 @@ def _main(
         if not standalone_mode:
             raise
         # Typer override
-        if HAS_RICH and rich_markup_mode is not None:
-            from . import rich_utils
-
-            rich_utils.rich_abort_error()
-        else:
-            click.echo(_("Aborted!"), file=sys.stderr)
+        _show_abort(rich_markup_mode=rich_markup_mode)
         # Typer override end
         sys.exit(1)
 
 
+def _show_click_exception(
+    e: click.ClickException, *, rich_markup_mode: MarkupMode
+) -> None:
+    if HAS_RICH and rich_markup_mode is not None:
+        from . import rich_utils
+
+        rich_utils.rich_format_error(e)
+    else:
+        e.show()
+
+
+def _show_abort(*, rich_markup_mode: MarkupMode) -> None:
+    if HAS_RICH and rich_markup_mode is not None:
+        from . import rich_utils
+
+        rich_utils.rich_abort_error()
+    else:
+        click.echo(_("Aborted!"), file=sys.stderr)
+
+
+_NO_VALUE = object()
+
+
+class _LazyValues(Iterable[Any]):
+    """
+    The values of a parameter with `nargs=-1` or `multiple=True`, converted with
+    its type one at a time while they are iterated.
+    """
+
+    def __init__(self, values: Iterable[Any], convert: Callable[[Any], Any]) -> None:
+        self._values = values
+        self._convert = convert
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(self._convert, self._values)
+
+
+def _is_lazy_castable(value: Any) -> bool:
+    # Other values are handled (and rejected) by Click
+    return isinstance(value, Iterable) and not isinstance(value, str)
+
+
+def _typer_lazy_type_cast_value(
+    self: click.Parameter, *, ctx: click.Context, value: Iterable[Any]
+) -> Any:
+    values: Iterable[Any]
+    if isinstance(value, Iterator):
+        # Values streamed e.g. from stdin, only read while they are converted
+        first = next(value, _NO_VALUE)
+        if first is _NO_VALUE:
+            return ()
+        values = itertools.chain([first], value)
+    else:
+        values = tuple(value)
+        if not values:
+            # Keep the required check of Click
+            return ()
+
+    def convert(value: Any) -> Any:
+        return self.type(value, param=self, ctx=ctx)
+
+    return _LazyValues(values, convert)
+
+
+def _typer_buffer_type_cast_value(
+    self: click.Parameter,
+    *,
+    ctx: click.Context,
+    value: Iterable[Any],
+    buffer: BufferFactory,
+) -> Any:
+    values = value if isinstance(value, Sequence) else tuple(value)
+    if not values:
+        # Keep the required check of Click
+        return ()
+    try:
+        return buffer(values)
+    except ValueError as e:
+        self.type.fail(str(e), param=self, ctx=ctx)
+
+
 class TyperArgument(click.core.Argument):
     def __init__(
         self,
@@ -276,6 +385,10 @@ class TyperArgument(click.core.Argument):
         show_envvar: bool = True,
         help: str | None = None,
         hidden: bool = False,
+        lazy: bool = False,
+        buffer: BufferFactory | None = None,
+        stdin: bool = False,
+        delimiter: str | None = None,
         # Rich settings
         rich_help_panel: str | None = None,
         show_none_defaults: bool = False,
@@ -285,6 +398,10 @@ class TyperArgument(click.core.Argument):
         self.show_choices = show_choices
         self.show_envvar = show_envvar
         self.hidden = hidden
+        self.lazy = lazy
+        self.buffer = buffer
+        self.stdin = stdin
+        self.delimiter = delimiter
         self.rich_help_panel = rich_help_panel
         self.show_none_defaults = show_none_defaults
 
@@ -303,6 +420,37 @@ class TyperArgument(click.core.Argument):
         )
         _typer_param_setup_autocompletion_compat(self, autocompletion=autocompletion)
 
+    def consume_value(
+        self, ctx: click.Context, opts: Mapping[str, Any]
+    ) -> tuple[Any, click.core.ParameterSource]:
+        # Like xargs, only when no values were given in the command line
+        command_line_values = opts.get(self.name or "")
+        if (
+            self.stdin
+            and not (
+                isinstance(command_line_values, (tuple, list)) and command_line_values
+            )
+            and not click.get_binary_stream("stdin").isatty()
+        ):
+            values = iter_stdin_arguments(self.delimiter)
+            first = next(values, None)
+            if first is not None:
+                # Not COMMANDLINE, they come from stdin, like prompted values
+                return (
+                    itertools.chain([first], values),
+                    click.core.ParameterSource.PROMPT,
+                )
+        return super().consume_value(ctx, opts)
+
+    def type_cast_value(self, ctx: click.Context, value: Any) -> Any:
+        if self.lazy and _is_lazy_castable(value):
+            return _typer_lazy_type_cast_value(self, ctx=ctx, value=value)
+        if self.buffer is not None and _is_lazy_castable(value):
+            return _typer_buffer_type_cast_value(
+                self, ctx=ctx, value=value, buffer=self.buffer
+            )
+        return super().type_cast_value(ctx, value)
+
     def _get_default_string(
         self,
         *,
@@ -396,6 +544,11 @@ class TyperArgument(click.core.Argument):
             var += "..."
         return var
 
+    def shell_complete(  # type: ignore[override]
+        self, ctx: click.Context, incomplete: str
+    ) -> Iterable["click.shell_completion.CompletionItem"]:
+        return _typer_param_shell_complete(self, ctx=ctx, incomplete=incomplete)
+
     def value_is_missing(self, value: Any) -> bool:
         return _value_is_missing(self, value)
 
@@ -437,6 +590,8 @@ class TyperOption(click.core.Option):
         hidden: bool = False,
         show_choices: bool = True,
         show_envvar: bool = False,
+        lazy: bool = False,
+        buffer: BufferFactory | None = None,
         # Rich settings
         rich_help_panel: str | None = None,
         show_none_defaults: bool = False,
@@ -468,9 +623,30 @@ class TyperOption(click.core.Option):
             shell_complete=shell_complete,
         )
         _typer_param_setup_autocompletion_compat(self, autocompletion=autocompletion)
+        self.lazy = lazy
+        self.buffer = buffer
         self.rich_help_panel = rich_help_panel
         self.show_none_defaults = show_none_defaults
 
+    def type_cast_value(self, ctx: click.Context, value: Any) -> Any:
+        if self.lazy and _is_lazy_castable(value):
+            return _typer_lazy_type_cast_value(self, ctx=ctx, value=value)
+        if self.buffer is not None and _is_lazy_castable(value):
+            return _typer_buffer_type_cast_value(
+                self, ctx=ctx, value=value, buffer=self.buffer
+            )
+        return super().type_cast_value(ctx, value)
+
+    def prompt_for_value(self, ctx: click.Context) -> Any:
+        from ._answers import get_answer
+
+        if self.name is not None:
+            # Answered by the answers file, converted like a value from the command line
+            found, value = get_answer(ctx, self.name)
+            if found:
+                return value
+        return super().prompt_for_value(ctx)
+
     def _get_default_string(
         self,
         *,
@@ -588,6 +764,11 @@ class TyperOption(click.core.Option):
 
         return ("; " if any_prefix_is_slash else " / ").join(rv), help
 
+    def shell_complete(  # type: ignore[override]
+        self, ctx: click.Context, incomplete: str
+    ) -> Iterable["click.shell_completion.CompletionItem"]:
+        return _typer_param_shell_complete(self, ctx=ctx, incomplete=incomplete)
+
     def value_is_missing(self, value: Any) -> bool:
         return _value_is_missing(self, value)
 
@@ -648,7 +829,118 @@ def _typer_main_shell_completion(
     sys.exit(rv)
 
 
+def _get_option_index(
+    self: Union["TyperCommand", "TyperGroup"], *, ctx: click.Context
+) -> PrefixIndex[click.Option]:
+    # Built on first use, and rebuilt when the params change (they count their
+    # changes) or the help option does
+    help_option = self.get_help_option(ctx)
+    key = (self.params.version, help_option)
+    if self._option_index is None or self._option_index[0] != key:
+        index = PrefixIndex(
+            (name, param)
+            for param in self.get_params(ctx)
+            if isinstance(param, click.Option)
+            for name in [*param.opts, *param.secondary_opts]
+        )
+        self._option_index = (key, index)
+    return self._option_index[1]
+
+
+def _is_click_parser_supported() -> bool:
+    # The "did you mean" override below subclasses Click's private parser, only use
+    # it with the Click versions it was written for, and Click's own otherwise
+    try:
+        major = int(importlib.metadata.version("click").split(".")[0])
+    except (importlib.metadata.PackageNotFoundError, ValueError):  # pragma: no cover
+        return False
+    parser_class = getattr(click.parser, "_OptionParser", None)
+    return major == 8 and hasattr(parser_class, "_match_long_opt")
+
+
+_USE_TYPER_OPTION_PARSER = _is_click_parser_supported()
+
+if TYPE_CHECKING:
+    _ClickOptionParser = click.parser._OptionParser
+else:
+    _ClickOptionParser = getattr(click.parser, "_OptionParser", object)
+
+
+class _TyperOptionParser(_ClickOptionParser):
+    def _match_long_opt(
+        self, opt: str, explicit_value: str | None, state: click.parser._ParsingState
+    ) -> None:
+        # Typer override, look up the "did you mean" suggestions in the command's
+        # index instead of scoring all the long options with difflib
+        if opt not in self._long_opt and self.ctx is not None:
+            command = cast(Union["TyperCommand", "TyperGroup"], self.ctx.command)
+            # Keyed on the option names, rebuilt if they changed
+            names = frozenset(self._long_opt)
+            cached = command._option_suggestion_index
+            if cached is None or cached[0] != names:
+                cached = (names, FuzzyIndex(self._long_opt))
+                command._option_suggestion_index = cached
+            raise click.NoSuchOption(
+                opt, possibilities=cached[1].get_close_matches(opt), ctx=self.ctx
+            )
+        super()._match_long_opt(opt, explicit_value, state)
+
+
+def _typer_make_parser(
+    self: click.core.Command, *, ctx: click.Context
+) -> "click.parser._OptionParser":
+    if not _USE_TYPER_OPTION_PARSER:
+        return click.core.Command.make_parser(self, ctx)
+    parser = _TyperOptionParser(ctx)
+    for param in self.get_params(ctx):
+        param.add_to_parser(parser, ctx)
+    return parser
+
+
+def _complete_visible_commands(
+    ctx: click.Context, incomplete: str
+) -> Iterator[tuple[str, click.Command]]:
+    group = cast(click.Group, ctx.command)
+    if isinstance(group, TyperGroup):
+        return group._complete_visible_commands(ctx, incomplete)
+    return click.core._complete_visible_commands(ctx, incomplete)
+
+
+def _typer_shell_complete(
+    self: Union["TyperCommand", "TyperGroup"], *, ctx: click.Context, incomplete: str
+) -> list["click.shell_completion.CompletionItem"]:
+    # Modified version of click.core.Command.shell_complete() to look up the
+    # option names in a prefix index instead of scanning every param's opts
+    from click.shell_completion import CompletionItem
+
+    results: list[CompletionItem] = []
+
+    if incomplete and not incomplete[0].isalnum():
+        for name, param in _get_option_index(self, ctx=ctx).prefix(incomplete):
+            if param.hidden or (
+                not param.multiple
+                and ctx.get_parameter_source(param.name)  # type: ignore
+                is click.core.ParameterSource.COMMANDLINE
+            ):
+                continue
+            results.append(CompletionItem(name, help=param.help))
+
+    while ctx.parent is not None:
+        ctx = ctx.parent
+
+        if isinstance(ctx.command, click.Group) and ctx.command.chain:
+            results.extend(
+                CompletionItem(name, help=command.get_short_help_str())
+                for name, command in _complete_visible_commands(ctx, incomplete)
+                if name not in ctx._protected_args
+            )
+
+    return results
+
+
 class TyperCommand(click.core.Command):
+    context_class = Context
+
     def __init__(
         self,
         name: str | None,
@@ -667,6 +959,10 @@ class TyperCommand(click.core.Command):
         # Rich settings
         rich_markup_mode: MarkupMode = DEFAULT_MARKUP_MODE,
         rich_help_panel: str | None = None,
+        loop_factory: LoopFactory | None = None,
+        pipeline_input_name: str | None = None,
+        expand_argsfiles: bool = False,
+        buffered_output: bool = False,
     ) -> None:
         super().__init__(
             name=name,
@@ -684,12 +980,46 @@ class TyperCommand(click.core.Command):
         )
         self.rich_markup_mode: MarkupMode = rich_markup_mode
         self.rich_help_panel = rich_help_panel
+        self.loop_factory = loop_factory
+        self.pipeline_input_name = pipeline_input_name
+        self.expand_argsfiles = expand_argsfiles
+        self.buffered_output = buffered_output
+        self._option_index: (
+            tuple[tuple[int, click.Option | None], PrefixIndex[click.Option]] | None
+        ) = None
+        self._option_suggestion_index: tuple[frozenset[str], FuzzyIndex] | None = None
+
+    @property
+    def params(self) -> TrackedList[click.Parameter]:
+        return self._params
+
+    @params.setter
+    def params(self, params: list[click.Parameter]) -> None:
+        self._params: TrackedList[click.Parameter] = TrackedList(params)
 
     def format_options(
         self, ctx: click.Context, formatter: click.HelpFormatter
     ) -> None:
         _typer_format_options(self, ctx=ctx, formatter=formatter)
 
+    def invoke(self, ctx: click.Context) -> Any:
+        # Only set when chained after another command, see invoke_sequential()
+        if self.pipeline_input_name and self.pipeline_input_name not in ctx.params:
+            raise click.UsageError(
+                "This command reads the output of a previous chained command, it "
+                "can only be run after another one in a group with chain=True.",
+                ctx=ctx,
+            )
+        return super().invoke(ctx)
+
+    def make_parser(self, ctx: click.Context) -> "click.parser._OptionParser":
+        return _typer_make_parser(self, ctx=ctx)
+
+    def shell_complete(
+        self, ctx: click.Context, incomplete: str
+    ) -> list["click.shell_completion.CompletionItem"]:
+        return _typer_shell_complete(self, ctx=ctx, incomplete=incomplete)
+
     def _main_shell_completion(
         self,
         ctx_args: MutableMapping[str, Any],
@@ -737,6 +1067,8 @@ class TyperCommand(click.core.Command):
 
 
 class TyperGroup(click.core.Group):
+    context_class = Context
+
     def __init__(
         self,
         *,
@@ -746,12 +1078,28 @@ class TyperGroup(click.core.Group):
         rich_markup_mode: MarkupMode = DEFAULT_MARKUP_MODE,
         rich_help_panel: str | None = None,
         suggest_commands: bool = True,
+        loop_factory: LoopFactory | None = None,
+        chain_parallel: ChainParallelMode | None = None,
+        chain_max_workers: int | None = None,
+        expand_argsfiles: bool = False,
+        buffered_output: bool = False,
         **attrs: Any,
     ) -> None:
         super().__init__(name=name, commands=commands, **attrs)
         self.rich_markup_mode: MarkupMode = rich_markup_mode
         self.rich_help_panel = rich_help_panel
         self.suggest_commands = suggest_commands
+        self.loop_factory = loop_factory
+        self.chain_parallel = chain_parallel
+        self.chain_max_workers = chain_max_workers
+        self.expand_argsfiles = expand_argsfiles
+        self.buffered_output = buffered_output
+        self._option_index: (
+            tuple[tuple[int, click.Option | None], PrefixIndex[click.Option]] | None
+        ) = None
+        self._option_suggestion_index: tuple[frozenset[str], FuzzyIndex] | None = None
+        self._command_index: tuple[int, PrefixIndex[click.Command]] | None = None
+        self._command_suggestion_index: tuple[int, FuzzyIndex] | None = None
 
     def format_options(
         self, ctx: click.Context, formatter: click.HelpFormatter
@@ -759,6 +1107,71 @@ class TyperGroup(click.core.Group):
         _typer_format_options(self, ctx=ctx, formatter=formatter)
         self.format_commands(ctx, formatter)
 
+    def make_parser(self, ctx: click.Context) -> "click.parser._OptionParser":
+        return _typer_make_parser(self, ctx=ctx)
+
+    @property
+    def params(self) -> TrackedList[click.Parameter]:
+        return self._params
+
+    @params.setter
+    def params(self, params: list[click.Parameter]) -> None:
+        self._params: TrackedList[click.Parameter] = TrackedList(params)
+
+    @property
+    def commands(self) -> TrackedDict[str, click.Command]:
+        return self._commands
+
+    @commands.setter
+    def commands(self, commands: MutableMapping[str, click.Command]) -> None:
+        self._commands: TrackedDict[str, click.Command] = TrackedDict(commands)
+
+    def _get_command_suggestion_index(self) -> FuzzyIndex:
+        # Built on first use, and rebuilt when self.commands changes
+        version = self.commands.version
+        if (
+            self._command_suggestion_index is None
+            or self._command_suggestion_index[0] != version
+        ):
+            self._command_suggestion_index = (version, FuzzyIndex(self.commands))
+        return self._command_suggestion_index[1]
+
+    def _get_command_index(self) -> PrefixIndex[click.Command]:
+        # Built on first use, and rebuilt when self.commands changes, including a
+        # command replaced or renamed directly in it
+        version = self.commands.version
+        if self._command_index is None or self._command_index[0] != version:
+            self._command_index = (version, PrefixIndex(self.commands.items()))
+        return self._command_index[1]
+
+    def _complete_visible_commands(
+        self, ctx: click.Context, incomplete: str
+    ) -> Iterator[tuple[str, click.Command]]:
+        # Subclasses that compute their commands dynamically can't be indexed
+        if (
+            type(self).list_commands is not TyperGroup.list_commands
+            or type(self).get_command is not click.core.Group.get_command
+        ):
+            yield from click.core._complete_visible_commands(ctx, incomplete)
+            return
+        for name, command in self._get_command_index().prefix(incomplete):
+            if not command.hidden:
+                yield name, command
+
+    def shell_complete(
+        self, ctx: click.Context, incomplete: str
+    ) -> list["click.shell_completion.CompletionItem"]:
+        # Modified version of click.core.Group.shell_complete() to use the
+        # commands' prefix index
+        from click.shell_completion import CompletionItem
+
+        results = [
+            CompletionItem(name, help=command.get_short_help_str())
+            for name, command in self._complete_visible_commands(ctx, incomplete)
+        ]
+        results.extend(_typer_shell_complete(self, ctx=ctx, incomplete=incomplete))
+        return results
+
     def _main_shell_completion(
         self,
         ctx_args: MutableMapping[str, Any],
@@ -776,16 +1189,53 @@ class TyperGroup(click.core.Group):
             return super().resolve_command(ctx, args)
         except click.UsageError as e:
             if self.suggest_commands:
-                available_commands = list(self.commands.keys())
-                if available_commands and args:
+                if self.commands and args:
                     typo = args[0]
-                    matches = get_close_matches(typo, available_commands)
+                    matches = self._get_command_suggestion_index().get_close_matches(
+                        typo
+                    )
                     if matches:
                         suggestions = ", ".join(f"{m!r}" for m in matches)
                         message = e.message.rstrip(".")
                         e.message = f"{message}. Did you mean {suggestions}?"
             raise
 
+    def invoke(self, ctx: click.Context) -> Any:
+        if not self.chain or not ctx._protected_args:
+            return super().invoke(ctx)
+        # Same as click.Group.invoke() in chain mode, but the subcommands can stream
+        # their results to the next ones (PipelineInput) or run in parallel
+        args = [*ctx._protected_args, *ctx.args]
+        ctx.args = []
+        ctx._protected_args = []
+        with ctx:
+            ctx.invoked_subcommand = "*"
+            click.Command.invoke(self, ctx)
+            contexts = []
+            while args:
+                cmd_name, cmd, args = self.resolve_command(ctx, args)
+                assert cmd is not None
+                sub_ctx = cmd.make_context(
+                    cmd_name,
+                    args,
+                    parent=ctx,
+                    allow_extra_args=True,
+                    allow_interspersed_args=False,
+                )
+                contexts.append(sub_ctx)
+                args, sub_ctx.args = sub_ctx.args, []
+            if self.chain_parallel is None:
+                rv = invoke_sequential(contexts)
+            else:
+                rv = invoke_parallel(
+                    contexts,
+                    mode=self.chain_parallel,
+                    max_workers=self.chain_max_workers,
+                )
+            if self._result_callback is not None:
+                rv = ctx.invoke(self._result_callback, rv, **ctx.params)
+            return rv
+
     def main(
         self,
         args: Sequence[str] | None = None,
@@ -1,11 +1,13 @@
+import asyncio
 import inspect
+import itertools
 import os
 import platform
 import shutil
 import subprocess
 import sys
 import traceback
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from datetime import datetime
 from enum import Enum
 from functools import update_wrapper
@@ -19,6 +21,34 @@ import click
 from annotated_doc import Doc
 from typer._types import TyperChoice
 
+from ._answers import get_answers_param
+from ._batch import invoke_many
+from ._buffers import (
+    DEFAULT_TYPECODE,
+    INTEGER_TYPECODES,
+    BufferFactory,
+    get_buffer_factory,
+    get_ndarray_typecode,
+    is_buffer_type,
+)
+from ._loop import LoopFactory, iter_async, run_coroutine
+from ._parallel import (
+    JOBS_PARAM_NAME,
+    ParallelMode,
+    Workers,
+    get_jobs_param,
+    get_workers_count,
+    map_chunks,
+)
+from ._records import (
+    OUTPUT_PARAM_NAME,
+    OutputFormat,
+    get_output_param,
+    iter_records,
+    write_records,
+)
+from ._resources import get_resource
+from ._server import serve
 from ._typing import (
     all_literal_values,
     get_args,
@@ -45,19 +75,25 @@ from .models import (
     CommandInfo,
     Default,
     DefaultPlaceholder,
+    DependsInfo,
     DeveloperExceptionConfig,
     DocTyperOptions,
     FileBinaryRead,
     FileBinaryWrite,
+    FileMmap,
     FileText,
     FileTextWrite,
     IgnoreInfo,
+    InvocationResult,
     NoneType,
     OptionInfo,
     ParameterInfo,
     ParamMeta,
+    PipelineInput,
     Required,
+    TyperFile,
     TyperInfo,
+    TyperMmapFile,
     TyperPath,
 )
 from .utils import get_params_from_function
@@ -129,6 +165,16 @@ def get_install_completion_arguments(
     return click_install_param, click_show_param
 
 
+def get_answers_option(
+    *,
+    doctyper_opts: DocTyperOptions = DocTyperOptions(),
+) -> click.Parameter:
+    click_answers_param, _ = get_click_param(
+        get_answers_param(), doctyper_opts=doctyper_opts
+    )
+    return click_answers_param
+
+
 class Typer:
     """
     `Typer` main class, the main entrypoint to use Typer.
@@ -240,6 +286,34 @@ class Typer:
                 """
             ),
         ] = Default(False),
+        chain_parallel: Annotated[
+            Literal["thread", "process"] | None,
+            Doc(
+                """
+                With `chain=True`, run the chained subcommands in parallel in a pool of
+                threads (`"thread"`) or processes (`"process"`), instead of one after the
+                other. Use it for independent subcommands.
+
+                The `result_callback` still receives the results in the order of the
+                command line. If several subcommands fail, their errors are reported
+                together.
+
+                With `"process"`, the subcommands are run in forked processes, so their
+                results have to be picklable. Where `fork()` is not available, threads
+                are used. Subcommands streaming their results to each other with
+                `typer.PipelineInput` always run in threads, with a warning.
+                """
+            ),
+        ] = Default(None),
+        chain_max_workers: Annotated[
+            int | None,
+            Doc(
+                """
+                The maximum number of threads or processes used with `chain_parallel`.
+                By default, the default of `concurrent.futures` is used.
+                """
+            ),
+        ] = Default(None),
         result_callback: Annotated[
             Callable[..., Any] | None,
             Doc(
@@ -529,6 +603,107 @@ class Typer:
                 """
             ),
         ] = True,
+        expand_argsfiles: Annotated[
+            bool,
+            Doc(
+                """
+                Replace each `@path` CLI argument with the arguments read from the file at
+                `path`, one per line, or separated by NUL characters (like the output of
+                `find -print0`). Use `@-` to read them from standard input.
+
+                This allows passing more arguments than the operating system allows in a
+                command line, e.g. for a `list[Path]` *CLI argument*.
+
+                **Example**
+
+                ```python
+                import typer
+
+                app = typer.Typer(expand_argsfiles=True)
+                ```
+
+                ```console
+                $ find . -name "*.py" -print0 > files.txt
+                $ python main.py @files.txt
+                ```
+                """
+            ),
+        ] = False,
+        buffered_output: Annotated[
+            bool,
+            Doc(
+                """
+                Run each invocation inside [`typer.buffered_output()`](#typer.buffered_output),
+                so that the standard output is written in large chunks instead of being
+                flushed after each `typer.echo()`. Useful for commands printing many lines.
+
+                **Example**
+
+                ```python
+                import typer
+
+                app = typer.Typer(buffered_output=True)
+                ```
+                """
+            ),
+        ] = False,
+        answers_option: Annotated[
+            bool,
+            Doc(
+                """
+                Add an `--answers FILE` *CLI option* (also read from the `TYPER_ANSWERS`
+                environment variable) with the values of the options declared with
+                `prompt=True`, so that they aren't prompted in non-interactive runs.
+
+                The file is a TOML table (or JSON, for `.json` files) with the option
+                names as keys, and optionally a table per subcommand. It's parsed once
+                per invocation, shared by chained subcommands and by all the invocations
+                of a `Typer.invoke_many()` batch. Options without an answer are prompted.
+
+                **Example**
+
+                ```python
+                import typer
+
+                app = typer.Typer(answers_option=True)
+                ```
+
+                ```toml
+                name = "Camila"
+
+                [deploy]
+                confirm = true
+                ```
+
+                ```console
+                $ python main.py --answers answers.toml deploy
+                ```
+                """
+            ),
+        ] = False,
+        loop_factory: Annotated[
+            Callable[[], asyncio.AbstractEventLoop] | None,
+            Doc(
+                """
+                A function creating the event loop used to run `async def` commands and callbacks.
+                One loop is created per invocation, shared by the group callbacks, the (chained)
+                subcommands and the parameter callbacks, and closed at the end of the invocation.
+                By default, `asyncio.new_event_loop` is used.
+
+                As the loop is shared, only the `loop_factory` of the app being run is used,
+                the one of sub-Typers added with `app.add_typer()` is ignored.
+
+                **Example**
+
+                ```python
+                import uvloop
+                import typer
+
+                app = typer.Typer(loop_factory=uvloop.new_event_loop)
+                ```
+                """
+            ),
+        ] = None,
         parse_docstrings: bool = False,
         show_none_defaults: bool = False,
     ):
@@ -539,6 +714,10 @@ class Typer:
         self.pretty_exceptions_enable = pretty_exceptions_enable
         self.pretty_exceptions_show_locals = pretty_exceptions_show_locals
         self.pretty_exceptions_short = pretty_exceptions_short
+        self.loop_factory = loop_factory
+        self.expand_argsfiles = expand_argsfiles
+        self.buffered_output = buffered_output
+        self.answers_option = answers_option
         self.doctyper_opts = DocTyperOptions(
             parse_docstrings=parse_docstrings,
             show_none_defaults=show_none_defaults,
@@ -550,6 +729,8 @@ class Typer:
             no_args_is_help=no_args_is_help,
             subcommand_metavar=subcommand_metavar,
             chain=chain,
+            chain_parallel=chain_parallel,
+            chain_max_workers=chain_max_workers,
             result_callback=result_callback,
             context_settings=context_settings,
             callback=callback,
@@ -619,6 +800,34 @@ class Typer:
                 """
             ),
         ] = Default(False),
+        chain_parallel: Annotated[
+            Literal["thread", "process"] | None,
+            Doc(
+                """
+                With `chain=True`, run the chained subcommands in parallel in a pool of
+                threads (`"thread"`) or processes (`"process"`), instead of one after the
+                other. Use it for independent subcommands.
+
+                The `result_callback` still receives the results in the order of the
+                command line. If several subcommands fail, their errors are reported
+                together.
+
+                With `"process"`, the subcommands are run in forked processes, so their
+                results have to be picklable. Where `fork()` is not available, threads
+                are used. Subcommands streaming their results to each other with
+                `typer.PipelineInput` always run in threads, with a warning.
+                """
+            ),
+        ] = Default(None),
+        chain_max_workers: Annotated[
+            int | None,
+            Doc(
+                """
+                The maximum number of threads or processes used with `chain_parallel`.
+                By default, the default of `concurrent.futures` is used.
+                """
+            ),
+        ] = Default(None),
         result_callback: Annotated[
             Callable[..., Any] | None,
             Doc(
@@ -751,6 +960,8 @@ class Typer:
                 no_args_is_help=no_args_is_help,
                 subcommand_metavar=subcommand_metavar,
                 chain=chain,
+                chain_parallel=chain_parallel,
+                chain_max_workers=chain_max_workers,
                 result_callback=result_callback,
                 context_settings=context_settings,
                 callback=f,
@@ -871,6 +1082,82 @@ class Typer:
                 """
             ),
         ] = False,
+        parallel_over: Annotated[
+            str | None,
+            Doc(
+                """
+                The name of a parameter with multiple values (e.g. `files: list[Path]`)
+                to split across a pool of workers. The values are split in one chunk
+                per worker, and the function is called once per chunk, with only the
+                values of that chunk.
+
+                The command gets a `--jobs`/`-j` option to set the number of workers,
+                and returns the list of the values returned for each chunk. The output
+                of each chunk is written in input order.
+
+                **Example**
+
+                ```python
+                @app.command(parallel_over="files")
+                def compress(files: list[Path]):
+                    for file in files:
+                        ...
+                ```
+                """
+            ),
+        ] = None,
+        parallel_mode: Annotated[
+            Literal["thread", "process"],
+            Doc(
+                """
+                With `parallel_over`, run the chunks in a pool of threads (`"thread"`)
+                or of forked processes (`"process"`). With `"process"`, the return
+                values and exceptions have to be picklable. Where `fork()` is not
+                available, threads are used.
+                """
+            ),
+        ] = "thread",
+        workers: Annotated[
+            int | Literal["auto"],
+            Doc(
+                """
+                With `parallel_over`, the default number of workers, when `--jobs` is
+                not given. `"auto"` uses one worker per available CPU.
+                """
+            ),
+        ] = "auto",
+        output_format: Annotated[
+            Literal["table", "json", "jsonl", "csv", "tsv"] | None,
+            Doc(
+                """
+                For a command that returns or yields records (mappings, dataclasses
+                or named tuples), add an `--output` option to choose how they are
+                written to standard output, with this default format: an aligned
+                `"table"`, a `"json"` array, `"jsonl"` (one JSON object per line),
+                `"csv"` or `"tsv"`.
+
+                The records are written as they are yielded, without keeping them
+                in memory. The widths of the table columns are computed from the
+                first 100 records. Async generator commands are iterated in the
+                event loop of the invocation.
+
+                The command can't declare its own `--output` option.
+
+                **Example**
+
+                ```python
+                @app.command(output_format="table")
+                def users():
+                    for user in fetch_users():
+                        yield {"name": user.name, "email": user.email}
+                ```
+
+                ```console
+                $ python main.py --output jsonl
+                ```
+                """
+            ),
+        ] = None,
         # Rich settings
         rich_help_panel: Annotated[
             str | None,
@@ -923,6 +1210,10 @@ class Typer:
                     no_args_is_help=no_args_is_help,
                     hidden=hidden,
                     deprecated=deprecated,
+                    parallel_over=parallel_over,
+                    parallel_mode=parallel_mode,
+                    workers=workers,
+                    output_format=output_format,
                     # Rich settings
                     rich_help_panel=rich_help_panel,
                 )
@@ -996,6 +1287,34 @@ class Typer:
                 """
             ),
         ] = Default(False),
+        chain_parallel: Annotated[
+            Literal["thread", "process"] | None,
+            Doc(
+                """
+                With `chain=True`, run the chained subcommands in parallel in a pool of
+                threads (`"thread"`) or processes (`"process"`), instead of one after the
+                other. Use it for independent subcommands.
+
+                The `result_callback` still receives the results in the order of the
+                command line. If several subcommands fail, their errors are reported
+                together.
+
+                With `"process"`, the subcommands are run in forked processes, so their
+                results have to be picklable. Where `fork()` is not available, threads
+                are used. Subcommands streaming their results to each other with
+                `typer.PipelineInput` always run in threads, with a warning.
+                """
+            ),
+        ] = Default(None),
+        chain_max_workers: Annotated[
+            int | None,
+            Doc(
+                """
+                The maximum number of threads or processes used with `chain_parallel`.
+                By default, the default of `concurrent.futures` is used.
+                """
+            ),
+        ] = Default(None),
         result_callback: Annotated[
             Callable[..., Any] | None,
             Doc(
@@ -1133,6 +1452,8 @@ class Typer:
                 no_args_is_help=no_args_is_help,
                 subcommand_metavar=subcommand_metavar,
                 chain=chain,
+                chain_parallel=chain_parallel,
+                chain_max_workers=chain_max_workers,
                 result_callback=result_callback,
                 context_settings=context_settings,
                 callback=callback,
@@ -1172,6 +1493,164 @@ class Typer:
             )
             raise e
 
+    def invoke_many(
+        self,
+        argvs: Annotated[
+            Iterable[Sequence[str]],
+            Doc(
+                """
+                The CLI arguments of each invocation, e.g. `[["hello", "Camila"], ["bye"]]`.
+                """
+            ),
+        ],
+        *,
+        workers: Annotated[
+            int,
+            Doc(
+                """
+                The number of threads or processes running the invocations. By default,
+                they run one after the other in the current thread.
+                """
+            ),
+        ] = 1,
+        mode: Annotated[
+            Literal["thread", "process"],
+            Doc(
+                """
+                Run the invocations in a pool of threads (`"thread"`) or of forked
+                processes (`"process"`). With `"process"`, the return values and
+                exceptions have to be picklable. Where `fork()` is not available, threads
+                are used.
+                """
+            ),
+        ] = "thread",
+        prog_name: Annotated[
+            str | None,
+            Doc(
+                """
+                The program name used in the help and error messages. By default, it's
+                detected from `sys.argv`.
+                """
+            ),
+        ] = None,
+        catch_exceptions: Annotated[
+            bool,
+            Doc(
+                """
+                Store the exceptions raised by the commands in the results instead of
+                raising them.
+                """
+            ),
+        ] = True,
+    ) -> list[InvocationResult]:
+        """
+        Invoke this app many times in the current process, once per list of CLI
+        arguments, without building the Click command again for each invocation.
+
+        Returns one `InvocationResult` per invocation, in the same order, with the
+        exit code, the captured output (`output` and `stderr`), the value returned by
+        the command and the exception raised, if any.
+
+        **Example**
+
+        ```python
+        import typer
+
+        app = typer.Typer()
+
+
+        @app.command()
+        def hello(name: str):
+            print(f"Hello {name}")
+
+
+        results = app.invoke_many([["Camila"], ["Rick"]], workers=2)
+        for result in results:
+            print(result.exit_code, result.output)
+        ```
+        """
+        return invoke_many(
+            get_command(self),
+            argvs,
+            prog_name=prog_name or click.utils._detect_program_name(),
+            workers=workers,
+            mode=mode,
+            catch_exceptions=catch_exceptions,
+        )
+
+    def serve(
+        self,
+        path: Annotated[
+            str | Path,
+            Doc(
+                """
+                The path of the UNIX socket to listen on. A socket left behind by a
+                previous server is replaced, any other existing file is an error.
+                """
+            ),
+        ],
+        *,
+        prog_name: Annotated[
+            str | None,
+            Doc(
+                """
+                The program name used in the help and error messages, when the client
+                doesn't send one. By default, it's detected from `sys.argv`.
+                """
+            ),
+        ] = None,
+        prewarm: Annotated[
+            bool,
+            Doc(
+                """
+                Before serving, import the modules Typer would import lazily (e.g. Rich)
+                and freeze the heap with `gc.freeze()`. The children then share the
+                memory of the server copy-on-write, instead of copying the pages the
+                garbage collector touches.
+                """
+            ),
+        ] = True,
+    ) -> None:
+        """
+        Serve this app on a UNIX socket, until the process receives `SIGTERM`.
+
+        The app is imported and its Click command built once. Each invocation
+        request is run in a forked child process, with the stdin, stdout and stderr
+        of the client passed over the socket, and with its arguments, environment
+        and working directory. Use `typer.get_client_shim()` to generate a
+        lightweight client script.
+
+        The socket is only accessible to the user running the server, and where
+        the platform tells (`SO_PEERCRED`), requests from other users are rejected.
+        A client has 5 seconds to send its request, so a stalled one doesn't block
+        the others.
+
+        Only available on platforms with UNIX sockets and `fork()`.
+
+        **Example**
+
+        ```python
+        import typer
+
+        app = typer.Typer()
+
+
+        @app.command()
+        def hello(name: str):
+            print(f"Hello {name}")
+
+
+        if __name__ == "__main__":
+            app.serve("/tmp/hello.sock")
+        ```
+        """
+        serve(
+            get_command(self),
+            path,
+            prog_name=prog_name or click.utils._detect_program_name(),
+            prewarm=prewarm,
+        )
+
     def _info_val_str(self, name: str) -> str:
         val = getattr(self.info, name)
         val_str = val.value if isinstance(val, DefaultPlaceholder) else val
@@ -1207,6 +1686,9 @@ def get_group(typer_instance: Typer) -> TyperGroup:
         pretty_exceptions_short=typer_instance.pretty_exceptions_short,
         rich_markup_mode=typer_instance.rich_markup_mode,
         suggest_commands=typer_instance.suggest_commands,
+        loop_factory=typer_instance.loop_factory,
+        expand_argsfiles=typer_instance.expand_argsfiles,
+        buffered_output=typer_instance.buffered_output,
         doctyper_opts=typer_instance.doctyper_opts,
     )
     return group
@@ -1228,6 +1710,10 @@ def get_command(typer_instance: Typer) -> click.Command:
         if typer_instance._add_completion:
             click_command.params.append(click_install_param)
             click_command.params.append(click_show_param)
+        if typer_instance.answers_option:
+            click_command.params.append(
+                get_answers_option(doctyper_opts=typer_instance.doctyper_opts)
+            )
         return click_command
     elif len(typer_instance.registered_commands) == 1:
         # Create a single Command
@@ -1242,11 +1728,18 @@ def get_command(typer_instance: Typer) -> click.Command:
             single_command,
             pretty_exceptions_short=typer_instance.pretty_exceptions_short,
             rich_markup_mode=typer_instance.rich_markup_mode,
+            loop_factory=typer_instance.loop_factory,
+            expand_argsfiles=typer_instance.expand_argsfiles,
+            buffered_output=typer_instance.buffered_output,
             doctyper_opts=typer_instance.doctyper_opts,
         )
         if typer_instance._add_completion:
             click_command.params.append(click_install_param)
             click_command.params.append(click_show_param)
+        if typer_instance.answers_option:
+            click_command.params.append(
+                get_answers_option(doctyper_opts=typer_instance.doctyper_opts)
+            )
         return click_command
     raise RuntimeError(
         "Could not get a command for this Typer instance"
@@ -1331,6 +1824,9 @@ def get_group_from_info(
     pretty_exceptions_short: bool,
     suggest_commands: bool,
     rich_markup_mode: MarkupMode,
+    loop_factory: LoopFactory | None = None,
+    expand_argsfiles: bool = False,
+    buffered_output: bool = False,
     doctyper_opts: DocTyperOptions = DocTyperOptions(),
 ) -> TyperGroup:
     assert group_info.typer_instance, (
@@ -1342,6 +1838,7 @@ def get_group_from_info(
             command_info=command_info,
             pretty_exceptions_short=pretty_exceptions_short,
             rich_markup_mode=rich_markup_mode,
+            loop_factory=loop_factory,
             doctyper_opts=doctyper_opts,
         )
         if command.name:
@@ -1352,6 +1849,7 @@ def get_group_from_info(
             pretty_exceptions_short=pretty_exceptions_short,
             rich_markup_mode=rich_markup_mode,
             suggest_commands=suggest_commands,
+            loop_factory=loop_factory,
             doctyper_opts=doctyper_opts,
         )
         if sub_group.name:
@@ -1383,7 +1881,9 @@ def get_group_from_info(
         no_args_is_help=solved_info.no_args_is_help,
         subcommand_metavar=solved_info.subcommand_metavar,
         chain=solved_info.chain,
-        result_callback=solved_info.result_callback,
+        chain_parallel=solved_info.chain_parallel,
+        chain_max_workers=solved_info.chain_max_workers,
+        result_callback=get_result_callback(solved_info.result_callback),
         context_settings=solved_info.context_settings,
         callback=get_callback(
             callback=solved_info.callback,
@@ -1405,6 +1905,9 @@ def get_group_from_info(
         # Rich settings
         rich_help_panel=solved_info.rich_help_panel,
         suggest_commands=suggest_commands,
+        loop_factory=loop_factory,
+        expand_argsfiles=expand_argsfiles,
+        buffered_output=buffered_output,
     )
     return group
 
@@ -1433,6 +1936,10 @@ def get_params_convertors_ctx_param_name_from_function(
             if lenient_issubclass(param.annotation, click.Context):
                 context_param_name = param_name
                 continue
+            if is_pipeline_input(param.annotation):
+                continue
+            if isinstance(param.default, DependsInfo):
+                continue
             click_param, convertor = get_click_param(param, doctyper_opts=doctyper_opts)
             if convertor:
                 convertors[param_name] = convertor
@@ -1440,11 +1947,31 @@ def get_params_convertors_ctx_param_name_from_function(
     return params, convertors, context_param_name
 
 
+def is_pipeline_input(annotation: Any) -> bool:
+    return lenient_issubclass(get_origin(annotation) or annotation, PipelineInput)
+
+
+def get_pipeline_input_param_name(
+    callback: Callable[..., Any] | None,
+    *,
+    doctyper_opts: DocTyperOptions = DocTyperOptions(),
+) -> str | None:
+    if callback:
+        parameters = get_params_from_function(callback, doctyper_opts=doctyper_opts)
+        for param_name, param in parameters.items():
+            if is_pipeline_input(param.annotation):
+                return param_name
+    return None
+
+
 def get_command_from_info(
     command_info: CommandInfo,
     *,
     pretty_exceptions_short: bool,
     rich_markup_mode: MarkupMode,
+    loop_factory: LoopFactory | None = None,
+    expand_argsfiles: bool = False,
+    buffered_output: bool = False,
     doctyper_opts: DocTyperOptions = DocTyperOptions(),
 ) -> click.Command:
     assert command_info.callback, "A command must have a callback function"
@@ -1474,6 +2001,29 @@ def get_command_from_info(
     ) = get_params_convertors_ctx_param_name_from_function(
         command_info.callback, doctyper_opts=doctyper_opts
     )
+    if command_info.parallel_over:
+        jobs_param = get_parallel_jobs_param(
+            params,
+            parallel_over=command_info.parallel_over,
+            workers=command_info.workers,
+            doctyper_opts=doctyper_opts,
+        )
+        check_added_param_names(params, jobs_param, setting="parallel_over")
+        params.append(jobs_param)
+    if command_info.output_format:
+        if command_info.parallel_over and inspect.isasyncgenfunction(
+            command_info.callback
+        ):
+            raise ValueError(
+                "output_format with parallel_over doesn't support async generator "
+                f"commands: {command_info.callback}"
+            )
+        output_param, _ = get_click_param(
+            get_output_param(command_info.output_format),
+            doctyper_opts=doctyper_opts,
+        )
+        check_added_param_names(params, output_param, setting="output_format")
+        params.append(output_param)
     cls = command_info.cls or TyperCommand
     command = cls(
         name=name,
@@ -1484,6 +2034,10 @@ def get_command_from_info(
             convertors=convertors,
             context_param_name=context_param_name,
             pretty_exceptions_short=pretty_exceptions_short,
+            parallel_over=command_info.parallel_over,
+            parallel_mode=command_info.parallel_mode,
+            workers=command_info.workers,
+            output_format=command_info.output_format,
             doctyper_opts=doctyper_opts,
         ),
         params=params,  # type: ignore
@@ -1498,10 +2052,53 @@ def get_command_from_info(
         rich_markup_mode=rich_markup_mode,
         # Rich settings
         rich_help_panel=command_info.rich_help_panel,
+        loop_factory=loop_factory,
+        pipeline_input_name=get_pipeline_input_param_name(
+            command_info.callback, doctyper_opts=doctyper_opts
+        ),
+        expand_argsfiles=expand_argsfiles,
+        buffered_output=buffered_output,
     )
     return command
 
 
+def check_added_param_names(
+    params: Sequence[click.Parameter], added: click.Parameter, *, setting: str
+) -> None:
+    """Fail if a parameter added by a command setting (e.g. `--output` for
+    `output_format`) would shadow one of the command's own parameters.
+    """
+    taken = {name for param in params for name in param.opts + param.secondary_opts}
+    collisions = sorted(taken.intersection(added.opts))
+    if collisions:
+        raise ValueError(
+            f"{setting} adds the option {', '.join(collisions)}, which the command "
+            "already declares"
+        )
+
+
+def get_parallel_jobs_param(
+    params: Sequence[click.Parameter],
+    *,
+    parallel_over: str,
+    workers: Workers,
+    doctyper_opts: DocTyperOptions = DocTyperOptions(),
+) -> click.Argument | click.Option:
+    for param in params:
+        if param.name == parallel_over:
+            if not (param.multiple or param.nargs == -1):
+                raise ValueError(
+                    f"parallel_over parameter must have multiple values: {parallel_over}"
+                )
+            break
+    else:
+        raise ValueError(f"parallel_over parameter not found: {parallel_over}")
+    jobs_param, _ = get_click_param(
+        get_jobs_param(workers), doctyper_opts=doctyper_opts
+    )
+    return jobs_param
+
+
 def determine_type_convertor(type_: Any) -> Callable[[Any], Any] | None:
     convertor: Callable[[Any], Any] | None = None
     if lenient_issubclass(type_, Path):
@@ -1543,6 +2140,28 @@ def generate_list_convertor(
     return internal_convertor
 
 
+def generate_iterable_convertor(
+    convertor: Callable[[Any], Any] | None, default_value: Any | None
+) -> Callable[[Iterable[Any] | None], Iterator[Any] | None]:
+    def internal_convertor(value: Iterable[Any] | None) -> Iterator[Any] | None:
+        if (value is None) or (default_value is None and value == ()):
+            return None
+        if convertor:
+            return (convertor(v) for v in value)
+        return iter(value)
+
+    return internal_convertor
+
+
+def generate_buffer_convertor(default_value: Any | None) -> Callable[[Any], Any]:
+    def internal_convertor(value: Any) -> Any:
+        if (value is None) or (default_value is None and value == ()):
+            return None
+        return value
+
+    return internal_convertor
+
+
 def generate_tuple_convertor(
     types: Sequence[Any],
 ) -> Callable[[tuple[Any, ...] | None], tuple[Any, ...] | None]:
@@ -1568,21 +2187,40 @@ def get_callback(
     convertors: dict[str, Callable[[str], Any]] | None = None,
     context_param_name: str | None = None,
     pretty_exceptions_short: bool,
+    parallel_over: str | None = None,
+    parallel_mode: ParallelMode = "thread",
+    workers: Workers = "auto",
+    output_format: OutputFormat | None = None,
     doctyper_opts: DocTyperOptions = DocTyperOptions(),
 ) -> Callable[..., Any] | None:
     use_convertors = convertors or {}
     if not callback:
         return None
     parameters = get_params_from_function(callback, doctyper_opts=doctyper_opts)
-    use_params: dict[str, Any] = {}
+    default_params: dict[str, Any] = {}
     for param_name in parameters:
-        use_params[param_name] = None
+        default_params[param_name] = None
     for param in params:
-        if param.name:
-            use_params[param.name] = param.default
+        if param.name and param.name not in (JOBS_PARAM_NAME, OUTPUT_PARAM_NAME):
+            default_params[param.name] = param.default
+    dependencies = {
+        param_name: param.default
+        for param_name, param in parameters.items()
+        if isinstance(param.default, DependsInfo)
+    }
+    is_coroutine = inspect.iscoroutinefunction(callback)
+
+    def call(use_params: dict[str, Any]) -> Any:
+        if is_coroutine:
+            return run_coroutine(click.get_current_context(), callback(**use_params))
+        return callback(**use_params)
 
     def wrapper(**kwargs: Any) -> Any:
         _rich_traceback_guard = pretty_exceptions_short  # noqa: F841
+        jobs = kwargs.pop(JOBS_PARAM_NAME, None) if parallel_over else None
+        use_format = kwargs.pop(OUTPUT_PARAM_NAME, None) if output_format else None
+        # A copy per call, the same command can run in parallel (chain_parallel)
+        use_params = dict(default_params)
         for k, v in kwargs.items():
             if k in use_convertors:
                 use_params[k] = use_convertors[k](v)
@@ -1590,7 +2228,47 @@ def get_callback(
                 use_params[k] = v
         if context_param_name:
             use_params[context_param_name] = click.get_current_context()
-        return callback(**use_params)
+        for param_name, depends_info in dependencies.items():
+            use_params[param_name] = get_resource(
+                click.get_current_context(),
+                depends_info.dependency,
+                scope=depends_info.scope,
+            )
+        value: Any
+        if parallel_over:
+            value = map_chunks(
+                call,
+                use_params,
+                parallel_over=parallel_over,
+                workers=jobs or get_workers_count(workers),
+                mode=parallel_mode,
+            )
+            if use_format:
+                # The records of each chunk, in input order
+                value = itertools.chain.from_iterable(
+                    iter_records(chunk_value) for chunk_value in value
+                )
+        else:
+            value = call(use_params)
+        if use_format:
+            if inspect.isasyncgen(value):
+                value = iter_async(click.get_current_context(), value)
+            write_records(value, use_format)
+            return None
+        return value
+
+    update_wrapper(wrapper, callback)
+    return wrapper
+
+
+def get_result_callback(
+    callback: Callable[..., Any] | None,
+) -> Callable[..., Any] | None:
+    if not callback or not inspect.iscoroutinefunction(callback):
+        return callback
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return run_coroutine(click.get_current_context(), callback(*args, **kwargs))
 
     update_wrapper(wrapper, callback)
     return wrapper
@@ -1644,6 +2322,8 @@ def get_click_type(
         return click.UUID
     elif annotation == datetime:
         return click.DateTime(formats=parameter_info.formats)
+    elif annotation is FileMmap:
+        return TyperMmapFile()
     elif (
         annotation == Path
         or parameter_info.allow_dash
@@ -1659,38 +2339,59 @@ def get_click_type(
             resolve_path=parameter_info.resolve_path,
             allow_dash=parameter_info.allow_dash,
             path_type=parameter_info.path_type,
+            atomic=parameter_info.atomic,
         )
     elif lenient_issubclass(annotation, FileTextWrite):
-        return click.File(
+        return TyperFile(
             mode=parameter_info.mode or "w",
             encoding=parameter_info.encoding,
             errors=parameter_info.errors,
             lazy=parameter_info.lazy,
             atomic=parameter_info.atomic,
+            compression=parameter_info.compression,
+            compresslevel=parameter_info.compresslevel,
+            buffer_size=parameter_info.buffer_size,
+            fsync=parameter_info.fsync,
+            write_behind=parameter_info.write_behind,
         )
     elif lenient_issubclass(annotation, FileText):
-        return click.File(
+        return TyperFile(
             mode=parameter_info.mode or "r",
             encoding=parameter_info.encoding,
             errors=parameter_info.errors,
             lazy=parameter_info.lazy,
             atomic=parameter_info.atomic,
+            compression=parameter_info.compression,
+            compresslevel=parameter_info.compresslevel,
+            buffer_size=parameter_info.buffer_size,
+            fsync=parameter_info.fsync,
+            write_behind=parameter_info.write_behind,
         )
     elif lenient_issubclass(annotation, FileBinaryRead):
-        return click.File(
+        return TyperFile(
             mode=parameter_info.mode or "rb",
             encoding=parameter_info.encoding,
             errors=parameter_info.errors,
             lazy=parameter_info.lazy,
             atomic=parameter_info.atomic,
+            compression=parameter_info.compression,
+            compresslevel=parameter_info.compresslevel,
+            buffer_size=parameter_info.buffer_size,
+            fsync=parameter_info.fsync,
+            write_behind=parameter_info.write_behind,
         )
     elif lenient_issubclass(annotation, FileBinaryWrite):
-        return click.File(
+        return TyperFile(
             mode=parameter_info.mode or "wb",
             encoding=parameter_info.encoding,
             errors=parameter_info.errors,
             lazy=parameter_info.lazy,
             atomic=parameter_info.atomic,
+            compression=parameter_info.compression,
+            compresslevel=parameter_info.compresslevel,
+            buffer_size=parameter_info.buffer_size,
+            fsync=parameter_info.fsync,
+            write_behind=parameter_info.write_behind,
         )
     elif lenient_issubclass(annotation, Enum):
         # The custom TyperChoice is only needed for Click < 8.2.0, to parse the
@@ -1774,7 +2475,9 @@ def get_click_param(
 
     main_type = annotation
     is_list = False
+    is_lazy = False
     is_tuple = False
+    buffer_factory: BufferFactory | None = None
     parameter_type: Any = None
     is_flag = None
     origin = get_origin(main_type)
@@ -1792,7 +2495,8 @@ def get_click_param(
             main_type = types[0]
             origin = get_origin(main_type)
         # Handle Tuples and Lists
-        if lenient_issubclass(origin, list):
+        if lenient_issubclass(origin, list) or origin in (Iterable, Iterator):
+            is_lazy = origin in (Iterable, Iterator)
             main_type = get_args(main_type)[0]
             main_type = combine_literals_union(main_type)
             if not is_literal_type(main_type):
@@ -1813,12 +2517,28 @@ def get_click_param(
                 )
             parameter_type = tuple(types)
             is_tuple = True
+    if is_buffer_type(main_type):
+        # Numbers parsed all at once into a typed buffer, not one by one by Click
+        typecode = (
+            parameter_info.typecode
+            or get_ndarray_typecode(main_type)
+            or DEFAULT_TYPECODE
+        )
+        buffer_factory = get_buffer_factory(main_type, typecode)
+        parameter_type = click.INT if typecode in INTEGER_TYPECODES else click.FLOAT
+        is_list = True
     if parameter_type is None:
         parameter_type = get_click_type(
             annotation=main_type, parameter_info=parameter_info
         )
     convertor = determine_type_convertor(main_type)
-    if is_list:
+    if buffer_factory is not None:
+        convertor = generate_buffer_convertor(default_value=default_value)
+    elif is_lazy:
+        convertor = generate_iterable_convertor(
+            convertor=convertor, default_value=default_value
+        )
+    elif is_list:
         convertor = generate_list_convertor(
             convertor=convertor, default_value=default_value
         )
@@ -1860,6 +2580,8 @@ def get_click_param(
                 hidden=parameter_info.hidden,
                 show_choices=parameter_info.show_choices,
                 show_envvar=parameter_info.show_envvar,
+                lazy=is_lazy,
+                buffer=buffer_factory,
                 # Parameter
                 required=required,
                 default=default_value,
@@ -1888,6 +2610,11 @@ def get_click_param(
         nargs = None
         if is_list:
             nargs = -1
+        if parameter_info.stdin and not is_list:
+            raise ValueError(
+                f"Only CLI arguments with multiple values can be read from stdin, "
+                f"not {param.name!r}"
+            )
         return (
             TyperArgument(
                 # Argument
@@ -1901,6 +2628,10 @@ def get_click_param(
                 show_envvar=parameter_info.show_envvar,
                 help=parameter_info.help,
                 hidden=parameter_info.hidden,
+                lazy=is_lazy,
+                buffer=buffer_factory,
+                stdin=parameter_info.stdin,
+                delimiter=parameter_info.delimiter,
                 # Parameter
                 default=default_value,
                 callback=get_param_callback(
@@ -1960,6 +2691,7 @@ def get_param_callback(
             raise click.ClickException(
                 "Too many CLI parameter callback function parameters"
             )
+    is_coroutine = inspect.iscoroutinefunction(callback)
 
     def wrapper(ctx: click.Context, param: click.Parameter, value: Any) -> Any:
         use_params: dict[str, Any] = {}
@@ -1973,6 +2705,8 @@ def get_param_callback(
             else:
                 use_value = value
             use_params[value_name] = use_value
+        if is_coroutine:
+            return run_coroutine(ctx, callback(**use_params))
         return callback(**use_params)
 
     update_wrapper(wrapper, callback)
@@ -1,23 +1,41 @@
+import heapq
 import inspect
 import io
-from collections.abc import Callable, Sequence
+import mmap
+import os
+import stat
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
+    Generic,
     Optional,
     TypeVar,
 )
 
 import click
+import click._compat
 import click.shell_completion
+import click.utils
+
+from ._buffers import FLOAT_TYPECODES, INTEGER_TYPECODES
+from ._compression import COMPRESSIONS, Compression, check_compresslevel
+from ._typing import Literal
 
 if TYPE_CHECKING:  # pragma: no cover
+    from ._chain import ChainParallelMode
+    from ._parallel import ParallelMode, Workers
+    from ._records import OutputFormat
     from .core import TyperCommand, TyperGroup
     from .main import Typer
 
 
 NoneType = type(None)
 
+ResourceScope = Literal["invocation", "process"]
+
 AnyType = type[Any]
 
 Required = ...
@@ -30,7 +48,90 @@ class Context(click.Context):
     you can access this additional information.
     """
 
-    pass
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        A thread pool created on first use and shut down when the invocation ends.
+
+        It's shared by the group callbacks, the (chained) commands and the parameter
+        callbacks of the invocation, and by all the invocations of a
+        `Typer.invoke_many()` batch.
+        """
+        from ._resources import create_executor, get_resource, in_batch
+
+        executor: ThreadPoolExecutor = get_resource(
+            self, create_executor, scope="process" if in_batch() else "invocation"
+        )
+        return executor
+
+    def get_resource(
+        self,
+        provider: Callable[..., Any],
+        *,
+        scope: ResourceScope = "invocation",
+    ) -> Any:
+        """
+        Return the resource created by `provider`, calling it on first use, like a
+        `typer.Depends()` parameter.
+
+        With the `"invocation"` scope, the resource is shared by all the commands and
+        callbacks of the invocation and cleaned up when it ends. With `"process"`,
+        it's shared by all the invocations of the process (e.g. with
+        `Typer.invoke_many()`).
+        """
+        from ._resources import get_resource
+
+        return get_resource(self, provider, scope=scope)
+
+
+_PipelineItem = TypeVar("_PipelineItem")
+
+
+class PipelineInput(Generic[_PipelineItem]):
+    """
+    In a group with `chain=True`, a command parameter of this type receives the
+    value returned by the previous chained command, as an iterator.
+
+    When the previous command returns a generator, the items are streamed from one
+    command to the next without being collected in memory.
+
+    **Example**
+
+    ```python
+    import typer
+
+    app = typer.Typer(chain=True)
+
+    @app.command()
+    def read(path: str):
+        with open(path) as f:
+            yield from f
+
+    @app.command()
+    def upper(lines: typer.PipelineInput[str]):
+        for line in lines:
+            yield line.upper()
+
+    @app.command()
+    def show(lines: typer.PipelineInput[str]):
+        for line in lines:
+            print(line, end="")
+
+    if __name__ == "__main__":
+        app()
+    ```
+    """
+
+    def __init__(self, iterable: Iterable[_PipelineItem] | None = None) -> None:
+        self._iterator: Iterator[_PipelineItem] = iter(
+            () if iterable is None else iterable
+        )
+
+    def __iter__(self) -> Iterator[_PipelineItem]:
+        return self
+
+    def __next__(self) -> _PipelineItem:
+        return next(self._iterator)
 
 
 class FileText(io.TextIOWrapper):
@@ -153,6 +254,39 @@ class FileBinaryWrite(io.BufferedWriter):
     pass
 
 
+if TYPE_CHECKING:  # pragma: no cover
+    FileMmap = memoryview
+else:
+
+    class FileMmap:
+        """
+        You can use this class to read a whole binary file without copying it, receiving
+        a read-only `memoryview` of the file mapped in memory with `mmap`.
+        Slicing the `memoryview` doesn't copy the data either.
+
+        The file is unmapped when the command finishes. If the file is `-`, or isn't a
+        regular file, its content is read into memory instead.
+
+        **Example**
+
+        ```python
+        from typing import Annotated
+
+        import typer
+
+        app = typer.Typer()
+
+        @app.command()
+        def main(log: Annotated[typer.FileMmap, typer.Argument()]):
+            print(f"Records: {log.nbytes // 64}")
+            print(f"First header: {log[:8].hex()}")
+
+        if __name__ == "__main__":
+            app()
+        ```
+        """
+
+
 class CallbackParam(click.Parameter):
     """
     In a callback function, you can declare a function parameter with type `CallbackParam`
@@ -208,6 +342,10 @@ class CommandInfo:
         no_args_is_help: bool = False,
         hidden: bool = False,
         deprecated: bool = False,
+        parallel_over: str | None = None,
+        parallel_mode: "ParallelMode" = "thread",
+        workers: "Workers" = "auto",
+        output_format: "OutputFormat | None" = None,
         # Rich settings
         rich_help_panel: str | None = None,
     ):
@@ -223,6 +361,10 @@ class CommandInfo:
         self.no_args_is_help = no_args_is_help
         self.hidden = hidden
         self.deprecated = deprecated
+        self.parallel_over = parallel_over
+        self.parallel_mode = parallel_mode
+        self.workers = workers
+        self.output_format = output_format
         # Rich settings
         self.rich_help_panel = rich_help_panel
 
@@ -238,6 +380,8 @@ class TyperInfo:
         no_args_is_help: bool = Default(False),
         subcommand_metavar: str | None = Default(None),
         chain: bool = Default(False),
+        chain_parallel: "ChainParallelMode | None" = Default(None),
+        chain_max_workers: int | None = Default(None),
         result_callback: Callable[..., Any] | None = Default(None),
         # Command
         context_settings: dict[Any, Any] | None = Default(None),
@@ -259,6 +403,8 @@ class TyperInfo:
         self.no_args_is_help = no_args_is_help
         self.subcommand_metavar = subcommand_metavar
         self.chain = chain
+        self.chain_parallel = chain_parallel
+        self.chain_max_workers = chain_max_workers
         self.result_callback = result_callback
         self.context_settings = context_settings
         self.callback = callback
@@ -307,6 +453,7 @@ class ParameterInfo:
         min: int | float | None = None,
         max: int | float | None = None,
         clamp: bool = False,
+        typecode: str | None = None,
         # DateTime
         formats: list[str] | None = None,
         # File
@@ -315,6 +462,11 @@ class ParameterInfo:
         errors: str | None = "strict",
         lazy: bool | None = None,
         atomic: bool = False,
+        compression: Compression | None = None,
+        compresslevel: int | None = None,
+        buffer_size: int | None = None,
+        fsync: bool = False,
+        write_behind: bool = False,
         # Path
         exists: bool = False,
         file_okay: bool = True,
@@ -358,7 +510,10 @@ class ParameterInfo:
         # Numbers
         self.min = min
         self.max = max
+        if typecode is not None and typecode not in INTEGER_TYPECODES + FLOAT_TYPECODES:
+            raise ValueError(f"Unsupported numeric array type code: {typecode!r}")
         self.clamp = clamp
+        self.typecode = typecode
         # DateTime
         self.formats = formats
         # File
@@ -367,6 +522,15 @@ class ParameterInfo:
         self.errors = errors
         self.lazy = lazy
         self.atomic = atomic
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ValueError(f"Unsupported compression: {compression!r}")
+        # With "auto", checked again when the files are opened
+        check_compresslevel(compression, compresslevel)
+        self.compression = compression
+        self.compresslevel = compresslevel
+        self.buffer_size = buffer_size
+        self.fsync = fsync
+        self.write_behind = write_behind
         # Path
         self.exists = exists
         self.file_okay = file_okay
@@ -425,6 +589,7 @@ class OptionInfo(ParameterInfo):
         min: int | float | None = None,
         max: int | float | None = None,
         clamp: bool = False,
+        typecode: str | None = None,
         # DateTime
         formats: list[str] | None = None,
         # File
@@ -433,6 +598,11 @@ class OptionInfo(ParameterInfo):
         errors: str | None = "strict",
         lazy: bool | None = None,
         atomic: bool = False,
+        compression: Compression | None = None,
+        compresslevel: int | None = None,
+        buffer_size: int | None = None,
+        fsync: bool = False,
+        write_behind: bool = False,
         # Path
         exists: bool = False,
         file_okay: bool = True,
@@ -471,6 +641,7 @@ class OptionInfo(ParameterInfo):
             min=min,
             max=max,
             clamp=clamp,
+            typecode=typecode,
             # DateTime
             formats=formats,
             # File
@@ -479,6 +650,11 @@ class OptionInfo(ParameterInfo):
             errors=errors,
             lazy=lazy,
             atomic=atomic,
+            compression=compression,
+            compresslevel=compresslevel,
+            buffer_size=buffer_size,
+            fsync=fsync,
+            write_behind=write_behind,
             # Path
             exists=exists,
             file_okay=file_okay,
@@ -538,12 +714,15 @@ class ArgumentInfo(ParameterInfo):
         show_envvar: bool = True,
         help: str | None = None,
         hidden: bool = False,
+        stdin: bool = False,
+        delimiter: str | None = None,
         # Choice
         case_sensitive: bool = True,
         # Numbers
         min: int | float | None = None,
         max: int | float | None = None,
         clamp: bool = False,
+        typecode: str | None = None,
         # DateTime
         formats: list[str] | None = None,
         # File
@@ -552,6 +731,11 @@ class ArgumentInfo(ParameterInfo):
         errors: str | None = "strict",
         lazy: bool | None = None,
         atomic: bool = False,
+        compression: Compression | None = None,
+        compresslevel: int | None = None,
+        buffer_size: int | None = None,
+        fsync: bool = False,
+        write_behind: bool = False,
         # Path
         exists: bool = False,
         file_okay: bool = True,
@@ -590,6 +774,7 @@ class ArgumentInfo(ParameterInfo):
             min=min,
             max=max,
             clamp=clamp,
+            typecode=typecode,
             # DateTime
             formats=formats,
             # File
@@ -598,6 +783,11 @@ class ArgumentInfo(ParameterInfo):
             errors=errors,
             lazy=lazy,
             atomic=atomic,
+            compression=compression,
+            compresslevel=compresslevel,
+            buffer_size=buffer_size,
+            fsync=fsync,
+            write_behind=write_behind,
             # Path
             exists=exists,
             file_okay=file_okay,
@@ -610,11 +800,27 @@ class ArgumentInfo(ParameterInfo):
             # Rich settings
             rich_help_panel=rich_help_panel,
         )
+        if delimiter is not None and len(delimiter) != 1:
+            raise ValueError("The stdin delimiter must be a single character.")
+        self.stdin = stdin
+        self.delimiter = delimiter
 
 
 class IgnoreInfo(ParameterInfo): ...
 
 
+class DependsInfo(ParameterInfo):
+    def __init__(
+        self,
+        dependency: Callable[..., Any],
+        *,
+        scope: ResourceScope = "invocation",
+    ):
+        super().__init__(default=...)
+        self.dependency = dependency
+        self.scope = scope
+
+
 class ParamMeta:
     empty = inspect.Parameter.empty
 
@@ -643,15 +849,303 @@ class DeveloperExceptionConfig:
         self.pretty_exceptions_short = pretty_exceptions_short
 
 
+class InvocationResult:
+    """
+    The result of one of the invocations made with `app.invoke_many()`.
+    """
+
+    def __init__(
+        self,
+        *,
+        args: Sequence[str],
+        exit_code: int = 0,
+        output: str = "",
+        stderr: str = "",
+        return_value: Any = None,
+        exception: BaseException | None = None,
+    ) -> None:
+        self.args = args
+        self.exit_code = exit_code
+        self.output = output
+        self.stderr = stderr
+        self.return_value = return_value
+        self.exception = exception
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {list(self.args)!r} exit_code={self.exit_code}>"
+
+
 class TyperPath(click.Path):
+    # Maximum number of entries returned by shell_complete()
+    completion_limit = 1000
+
+    def __init__(self, *, atomic: bool = False, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        if atomic and (self.file_okay or not self.dir_okay):
+            raise ValueError(
+                "atomic=True on a Path parameter stages an output directory, "
+                "it requires file_okay=False and dir_okay=True"
+            )
+        self.atomic = atomic
+
+    def convert(
+        self, value: Any, param: click.Parameter | None, ctx: click.Context | None
+    ) -> Any:
+        path = super().convert(value, param, ctx)
+        if not self.atomic or ctx is None or os.fsdecode(path) == "-":
+            return path
+        from ._writers import stage_directory
+
+        return stage_directory(path, ctx)
+
     # Overwrite Click's behaviour to be compatible with Typer's autocompletion system
     def shell_complete(
         self, ctx: click.Context, param: click.Parameter, incomplete: str
     ) -> list[click.shell_completion.CompletionItem]:
-        """Return an empty list so that the autocompletion functionality
-        will work properly from the commandline.
+        """Return the entries of the directory of `incomplete` that start with its
+        last component. Only that directory is listed (lazily, with `os.scandir()`),
+        and the first `completion_limit` entries in sorted order are returned.
+
+        Directories are always included to allow navigating into them, with a
+        trailing `os.sep` and the `"dir"` type, files only if `file_okay`, with the
+        `"file"` type, so that shells apply their file name handling. Hidden entries
+        are only included if the prefix starts with a dot. If nothing matches, an
+        empty list is returned so that the shell's own completion can take over.
         """
-        return []
+        head, tail = os.path.split(incomplete)
+        directory = os.path.expanduser(head) if head else os.curdir
+        show_hidden = tail.startswith(".")
+
+        def iter_matches(
+            entries: Iterator[os.DirEntry[str]],
+        ) -> Iterator[tuple[str, str]]:
+            for entry in entries:
+                if not entry.name.startswith(tail) or (
+                    entry.name.startswith(".") and not show_hidden
+                ):
+                    continue
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:  # pragma: no cover
+                    continue
+                if is_dir:
+                    yield os.path.join(head, entry.name) + os.sep, "dir"
+                elif self.file_okay:
+                    yield os.path.join(head, entry.name), "file"
+
+        try:
+            with os.scandir(directory) as entries:
+                # Sorted before applying the limit, keeping only the limit in memory
+                matches = heapq.nsmallest(self.completion_limit, iter_matches(entries))
+        except OSError:
+            return []
+        return [
+            click.shell_completion.CompletionItem(value, type=type_)
+            for value, type_ in matches
+        ]
+
+
+class TyperFile(click.File):
+    """A `click.File` that can transparently (de)compress gzip, bz2 and xz files,
+    and write output files through a large buffer, optionally from a background
+    thread and with an `os.fsync()` before closing them.
+
+    With `compression="auto"`, files being read are detected by their magic number
+    and files being written by their extension. Without any of these settings it
+    behaves exactly like `click.File`.
+    """
+
+    def __init__(
+        self,
+        mode: str = "r",
+        encoding: str | None = None,
+        errors: str | None = "strict",
+        lazy: bool | None = None,
+        atomic: bool = False,
+        *,
+        compression: Compression | None = None,
+        compresslevel: int | None = None,
+        buffer_size: int | None = None,
+        fsync: bool = False,
+        write_behind: bool = False,
+    ) -> None:
+        super().__init__(
+            mode=mode, encoding=encoding, errors=errors, lazy=lazy, atomic=atomic
+        )
+        self.compression = compression
+        self.compresslevel = compresslevel
+        self.buffer_size = buffer_size
+        self.fsync = fsync
+        self.write_behind = write_behind
+
+    def _wrap_text(self, stream: IO[bytes]) -> IO[Any]:
+        if "b" in self.mode:
+            return stream
+        return io.TextIOWrapper(stream, encoding=self.encoding, errors=self.errors)
+
+    def _open_input(
+        self, value: str | os.PathLike[str]
+    ) -> tuple[IO[Any], Callable[[], None]] | None:
+        from ._compression import detect_compression, open_compressed
+
+        if self.compression is None and not self.buffer_size:
+            return None
+        stream: IO[bytes]
+        if os.fspath(value) == "-":
+            stream, should_close = click.get_binary_stream("stdin"), False
+        else:
+            stream = open(value, "rb", buffering=self.buffer_size or -1)
+            should_close = True
+        compression: str | None = self.compression
+        if compression == "auto":
+            compression = detect_compression(stream)
+        if compression is None:
+            if not should_close:
+                # Plain stdin, nothing was consumed from it
+                return None
+            file = self._wrap_text(stream)
+        else:
+            file = open_compressed(
+                stream,
+                compression,
+                mode=self.mode,
+                buffer_size=self.buffer_size,
+                encoding=self.encoding,
+                errors=self.errors,
+            )
+        return file, stream.close if should_close else stream.flush
+
+    def _get_output_compression(self, value: str | os.PathLike[str]) -> str | None:
+        from ._compression import get_extension_compression
+
+        if self.compression != "auto":
+            return self.compression
+        if os.fspath(value) == "-":
+            return None
+        return get_extension_compression(value)
+
+    def _open_output(
+        self, value: str | os.PathLike[str]
+    ) -> tuple[IO[Any], Callable[[], None]] | None:
+        from ._compression import open_compressed
+        from ._writers import open_writer
+
+        compression = self._get_output_compression(value)
+        if compression is None and not (
+            self.buffer_size or self.fsync or self.write_behind
+        ):
+            return None
+        stream = open_writer(
+            value,
+            "ab" if "a" in self.mode else "xb" if "x" in self.mode else "wb",
+            atomic=self.atomic,
+            buffer_size=self.buffer_size,
+            fsync=self.fsync,
+            write_behind=self.write_behind,
+        )
+        if compression is None:
+            file = self._wrap_text(stream)
+        else:
+            file = open_compressed(
+                stream,
+                compression,
+                mode=self.mode,
+                compresslevel=self.compresslevel,
+                buffer_size=self.buffer_size,
+                encoding=self.encoding,
+                errors=self.errors,
+            )
+        return file, stream.close
+
+    def convert(
+        self, value: Any, param: click.Parameter | None, ctx: click.Context | None
+    ) -> IO[Any]:
+        if not isinstance(value, (str, os.PathLike)):
+            return super().convert(value, param, ctx)
+        reading = "r" in self.mode
+        try:
+            if reading:
+                opened = self._open_input(value)
+            else:
+                try:
+                    check_compresslevel(
+                        self._get_output_compression(value), self.compresslevel
+                    )
+                except ValueError as e:
+                    self.fail(str(e), param, ctx)
+                opened = self._open_output(value)
+        except OSError as e:
+            self.fail(f"'{click.format_filename(value)}': {e.strerror}", param, ctx)
+        if opened is None:
+            return super().convert(value, param, ctx)
+        file, finish = opened
+        # As with click.File, without a context closing it is the caller's job.
+        # The callbacks run in reverse order: first the file is closed, then the
+        # underlying stream. Errors writing outputs are not silenced, the data
+        # could be lost.
+        if ctx is not None:
+            if reading:
+                ctx.call_on_close(click.utils.safecall(finish))
+                ctx.call_on_close(click.utils.safecall(file.close))
+            else:
+                ctx.call_on_close(finish)
+                ctx.call_on_close(file.close)
+        return file
+
+
+class TyperMmapFile(click.File):
+    """A read-only `click.File` that returns a `memoryview` of the file mapped in
+    memory, instead of a file object. Dash (`-`) means stdin, as with `click.File`.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(mode="rb", lazy=False)
+
+    def convert(  # type: ignore[override]
+        self, value: Any, param: click.Parameter | None, ctx: click.Context | None
+    ) -> memoryview:
+        if isinstance(value, memoryview):
+            return value
+        try:
+            if os.fspath(value) == "-":
+                view, mapped = _map_stream(click.get_binary_stream("stdin"))
+            else:
+                with open(value, "rb") as file:
+                    view, mapped = _map_stream(file)
+        except OSError as e:
+            self.fail(f"'{click.format_filename(value)}': {e.strerror}", param, ctx)
+
+        # As with click.File, without a context closing it is the caller's job
+        if ctx is not None:
+            ctx.call_on_close(lambda: _unmap(view, mapped))
+        return view
+
+
+def _map_stream(stream: IO[bytes]) -> tuple[memoryview, mmap.mmap | None]:
+    try:
+        fd = stream.fileno()
+    except (OSError, ValueError):
+        fd = None
+    if fd is None:
+        return memoryview(stream.read()), None
+    stat_result = os.fstat(fd)
+    # Pipes, terminals and empty files can't be mapped
+    if not stat.S_ISREG(stat_result.st_mode) or not stat_result.st_size:
+        return memoryview(stream.read()), None
+    mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    # Skip whatever was already read from the stream, e.g. from a redirected stdin
+    return memoryview(mapped)[stream.tell() :], mapped
+
+
+def _unmap(view: memoryview, mapped: mmap.mmap | None) -> None:
+    view.release()
+    if mapped is None:
+        return
+    try:
+        mapped.close()
+    except BufferError:
+        # The command kept slices of the view, the mapping is closed with them
+        pass
 
 
 class DocTyperOptions:
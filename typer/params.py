@@ -4,7 +4,8 @@ from typing import TYPE_CHECKING, Annotated, Any, overload
 import click
 from annotated_doc import Doc
 
-from .models import ArgumentInfo, IgnoreInfo, OptionInfo
+from ._compression import Compression
+from .models import ArgumentInfo, DependsInfo, IgnoreInfo, OptionInfo, ResourceScope
 
 if TYPE_CHECKING:  # pragma: no cover
     import click.shell_completion
@@ -14,6 +15,63 @@ def Ignore() -> IgnoreInfo:
     return IgnoreInfo(default=...)
 
 
+def Depends(
+    dependency: Annotated[
+        Callable[..., Any],
+        Doc(
+            """
+            The function providing the value of the parameter. It can declare a
+            `typer.Context` parameter and parameters with other `typer.Depends()`.
+
+            When it's a generator, the value it yields is used, and the code after the
+            `yield` runs at the end of the scope, e.g. to close a connection.
+            """
+        ),
+    ],
+    *,
+    scope: Annotated[
+        ResourceScope,
+        Doc(
+            """
+            `"invocation"` creates the value once per invocation, shared by the group
+            callbacks and the (chained) commands, and cleans it up when the invocation
+            ends. `"process"` creates it once per process, shared by all the
+            invocations of the process (e.g. with `Typer.invoke_many()` or
+            `Typer.serve()`).
+            """
+        ),
+    ] = "invocation",
+) -> Any:
+    """
+    Declare a parameter provided by a function instead of the command line, like a
+    database connection, created on first use and shared with the other commands
+    and callbacks declaring it.
+
+    **Example**
+
+    ```python
+    import sqlite3
+    from typing import Annotated
+
+    import typer
+
+    app = typer.Typer()
+
+
+    def get_db():
+        db = sqlite3.connect("app.db")
+        yield db
+        db.close()
+
+
+    @app.command()
+    def count(db: Annotated[sqlite3.Connection, typer.Depends(get_db)]):
+        print(db.execute("SELECT count(*) FROM users").fetchone()[0])
+    ```
+    """
+    return DependsInfo(dependency, scope=scope)
+
+
 # Overload for Option created with custom type 'parser'
 @overload
 def Option(
@@ -57,6 +115,7 @@ def Option(
     min: int | float | None = None,
     max: int | float | None = None,
     clamp: bool = False,
+    typecode: str | None = None,
     # DateTime
     formats: list[str] | None = None,
     # File
@@ -65,6 +124,11 @@ def Option(
     errors: str | None = "strict",
     lazy: bool | None = None,
     atomic: bool = False,
+    compression: Compression | None = None,
+    compresslevel: int | None = None,
+    buffer_size: int | None = None,
+    fsync: bool = False,
+    write_behind: bool = False,
     # Path
     exists: bool = False,
     file_okay: bool = True,
@@ -122,6 +186,7 @@ def Option(
     min: int | float | None = None,
     max: int | float | None = None,
     clamp: bool = False,
+    typecode: str | None = None,
     # DateTime
     formats: list[str] | None = None,
     # File
@@ -130,6 +195,11 @@ def Option(
     errors: str | None = "strict",
     lazy: bool | None = None,
     atomic: bool = False,
+    compression: Compression | None = None,
+    compresslevel: int | None = None,
+    buffer_size: int | None = None,
+    fsync: bool = False,
+    write_behind: bool = False,
     # Path
     exists: bool = False,
     file_okay: bool = True,
@@ -660,6 +730,28 @@ def Option(
             """
         ),
     ] = False,
+    typecode: Annotated[
+        str | None,
+        Doc(
+            """
+            For a CLI Option with multiple numbers and a buffer type (`array.array`,
+            `memoryview` or NumPy's `ndarray`), the
+            [`array` type code](https://docs.python.org/3/library/array.html) of the
+            values, e.g. `"q"` for 64-bit integers or `"d"` (the default) for floats.
+
+            All the values are parsed in one pass into a compact typed buffer, instead
+            of one Python object per value.
+
+            **Example**
+
+            ```python
+            @app.command()
+            def main(ids: Annotated[array.array, typer.Option(typecode="q")]):
+                print(f"Sum: {sum(ids)}")
+            ```
+            """
+        ),
+    ] = None,
     # DateTime
     formats: Annotated[
         list[str] | None,
@@ -762,6 +854,11 @@ def Option(
             you can ensure that all write instructions first go into a temporal file, and are only moved to the final destination after completing
             by setting `atomic` to `True`. This can be useful for files with potential concurrent access.
 
+            For a [`Path` CLI Option](https://typer.tiangolo.com/tutorial/parameter-types/path/) of an output directory
+            (with `file_okay=False`), your code receives the path of a new empty directory next to it instead. Once the
+            command finishes successfully, it replaces the output directory, otherwise it's removed. Replacing an existing
+            directory takes two renames, so it's not atomic: for a moment, there's no directory at that path.
+
             **Example**
 
             ```python
@@ -772,6 +869,73 @@ def Option(
             """
         ),
     ] = False,
+    compression: Annotated[
+        Compression | None,
+        Doc(
+            """
+            For a CLI Option representing a [File object](https://typer.tiangolo.com/tutorial/parameter-types/file/),
+            transparently decompress the file when reading it and compress it when writing it.
+            It can be `"gzip"`, `"bz2"`, `"xz"` or `"auto"`. With `"auto"`, files being read are detected
+            by their content and files being written by their extension (`.gz`, `.bz2` or `.xz`),
+            other files are read and written as they are.
+
+            **Example**
+
+            ```python
+            @app.command()
+            def main(records: Annotated[typer.FileText, typer.Option(compression="auto")]):
+                for line in records:
+                    print(line.rstrip())
+            ```
+            """
+        ),
+    ] = None,
+    compresslevel: Annotated[
+        int | None,
+        Doc(
+            """
+            The compression level used when writing a compressed File Option, see `compression`.
+            Between `0` and `9` (`1` and `9` for bz2), by default `9` for gzip and bz2 and `6` for xz.
+            """
+        ),
+    ] = None,
+    buffer_size: Annotated[
+        int | None,
+        Doc(
+            """
+            The size in bytes of the buffer of a File Option. For output files and compressed files it's 128 KiB
+            by default, so that writing many small pieces doesn't make a system call for each of them.
+
+            **Example**
+
+            ```python
+            @app.command()
+            def main(out: Annotated[typer.FileTextWrite, typer.Option(buffer_size=1024 * 1024)]):
+                for number in range(10_000_000):
+                    out.write(f"{number}\\n")
+            ```
+            """
+        ),
+    ] = None,
+    fsync: Annotated[
+        bool,
+        Doc(
+            """
+            For a CLI Option representing an output [File object](https://typer.tiangolo.com/tutorial/parameter-types/file/),
+            call `os.fsync()` before closing the file, so that the data is on disk when the command finishes.
+            """
+        ),
+    ] = False,
+    write_behind: Annotated[
+        bool,
+        Doc(
+            """
+            For a CLI Option representing an output [File object](https://typer.tiangolo.com/tutorial/parameter-types/file/),
+            write the data from a background thread, so that your code doesn't wait for the disk.
+            Write errors are raised by the next write, or when the file is closed.
+            """
+        ),
+    ] = False,
     # Path
     exists: Annotated[
         bool,
@@ -982,6 +1146,7 @@ def Option(
         min=min,
         max=max,
         clamp=clamp,
+        typecode=typecode,
         # DateTime
         formats=formats,
         # File
@@ -990,6 +1155,11 @@ def Option(
         errors=errors,
         lazy=lazy,
         atomic=atomic,
+        compression=compression,
+        compresslevel=compresslevel,
+        buffer_size=buffer_size,
+        fsync=fsync,
+        write_behind=write_behind,
         # Path
         exists=exists,
         file_okay=file_okay,
@@ -1032,12 +1202,15 @@ def Argument(
     show_envvar: bool = True,
     help: str | None = None,
     hidden: bool = False,
+    stdin: bool = False,
+    delimiter: str | None = None,
     # Choice
     case_sensitive: bool = True,
     # Numbers
     min: int | float | None = None,
     max: int | float | None = None,
     clamp: bool = False,
+    typecode: str | None = None,
     # DateTime
     formats: list[str] | None = None,
     # File
@@ -1046,6 +1219,11 @@ def Argument(
     errors: str | None = "strict",
     lazy: bool | None = None,
     atomic: bool = False,
+    compression: Compression | None = None,
+    compresslevel: int | None = None,
+    buffer_size: int | None = None,
+    fsync: bool = False,
+    write_behind: bool = False,
     # Path
     exists: bool = False,
     file_okay: bool = True,
@@ -1088,12 +1266,15 @@ def Argument(
     show_envvar: bool = True,
     help: str | None = None,
     hidden: bool = False,
+    stdin: bool = False,
+    delimiter: str | None = None,
     # Choice
     case_sensitive: bool = True,
     # Numbers
     min: int | float | None = None,
     max: int | float | None = None,
     clamp: bool = False,
+    typecode: str | None = None,
     # DateTime
     formats: list[str] | None = None,
     # File
@@ -1102,6 +1283,11 @@ def Argument(
     errors: str | None = "strict",
     lazy: bool | None = None,
     atomic: bool = False,
+    compression: Compression | None = None,
+    compresslevel: int | None = None,
+    buffer_size: int | None = None,
+    fsync: bool = False,
+    write_behind: bool = False,
     # Path
     exists: bool = False,
     file_okay: bool = True,
@@ -1407,6 +1593,46 @@ def Argument(
             """
         ),
     ] = False,
+    stdin: Annotated[
+        bool,
+        Doc(
+            """
+            For a CLI Argument with multiple values (e.g. `list[Path]`), read the values
+            from standard input when none are given in the command line and standard input
+            is not a terminal, like `xargs` does.
+
+            Standard input is read in large blocks and the values are decoded one by one,
+            so, combined with an `Iterable` or `Iterator` type, the command can start
+            processing them before all of them are read.
+
+            Like prompted values, the values read from standard input are reported by
+            `ctx.get_parameter_source()` as `ParameterSource.PROMPT`.
+
+            **Example**
+
+            ```python
+            @app.command()
+            def main(files: Annotated[list[Path], typer.Argument(stdin=True, delimiter="\\0")]):
+                for file in files:
+                    print(f"Processing {file}")
+            ```
+
+            ```console
+            $ find . -name "*.py" -print0 | python main.py
+            ```
+            """
+        ),
+    ] = False,
+    delimiter: Annotated[
+        str | None,
+        Doc(
+            """
+            The character separating the values read from standard input with `stdin=True`,
+            `"\\n"` or `"\\0"`. By default, it's `"\\0"` if the input contains one, and lines
+            otherwise.
+            """
+        ),
+    ] = None,
     # Choice
     case_sensitive: Annotated[
         bool,
@@ -1502,6 +1728,28 @@ def Argument(
             """
         ),
     ] = False,
+    typecode: Annotated[
+        str | None,
+        Doc(
+            """
+            For a CLI Argument with multiple numbers and a buffer type (`array.array`,
+            `memoryview` or NumPy's `ndarray`), the
+            [`array` type code](https://docs.python.org/3/library/array.html) of the
+            values, e.g. `"q"` for 64-bit integers or `"d"` (the default) for floats.
+
+            All the values are parsed in one pass into a compact typed buffer, instead
+            of one Python object per value.
+
+            **Example**
+
+            ```python
+            @app.command()
+            def main(ids: Annotated[array.array, typer.Argument(typecode="q")]):
+                print(f"Sum: {sum(ids)}")
+            ```
+            """
+        ),
+    ] = None,
     # DateTime
     formats: Annotated[
         list[str] | None,
@@ -1604,6 +1852,11 @@ def Argument(
             you can ensure that all write instructions first go into a temporal file, and are only moved to the final destination after completing
             by setting `atomic` to `True`. This can be useful for files with potential concurrent access.
 
+            For a [`Path` CLI Argument](https://typer.tiangolo.com/tutorial/parameter-types/path/) of an output directory
+            (with `file_okay=False`), your code receives the path of a new empty directory next to it instead. Once the
+            command finishes successfully, it replaces the output directory, otherwise it's removed. Replacing an existing
+            directory takes two renames, so it's not atomic: for a moment, there's no directory at that path.
+
             **Example**
 
             ```python
@@ -1614,6 +1867,73 @@ def Argument(
             """
         ),
     ] = False,
+    compression: Annotated[
+        Compression | None,
+        Doc(
+            """
+            For a CLI Argument representing a [File object](https://typer.tiangolo.com/tutorial/parameter-types/file/),
+            transparently decompress the file when reading it and compress it when writing it.
+            It can be `"gzip"`, `"bz2"`, `"xz"` or `"auto"`. With `"auto"`, files being read are detected
+            by their content and files being written by their extension (`.gz`, `.bz2` or `.xz`),
+            other files are read and written as they are.
+
+            **Example**
+
+            ```python
+            @app.command()
+            def main(records: Annotated[typer.FileText, typer.Argument(compression="auto")]):
+                for line in records:
+                    print(line.rstrip())
+            ```
+            """
+        ),
+    ] = None,
+    compresslevel: Annotated[
+        int | None,
+        Doc(
+            """
+            The compression level used when writing a compressed File Argument, see `compression`.
+            Between `0` and `9` (`1` and `9` for bz2), by default `9` for gzip and bz2 and `6` for xz.
+            """
+        ),
+    ] = None,
+    buffer_size: Annotated[
+        int | None,
+        Doc(
+            """
+            The size in bytes of the buffer of a File Argument. For output files and compressed files it's 128 KiB
+            by default, so that writing many small pieces doesn't make a system call for each of them.
+
+            **Example**
+
+            ```python
+            @app.command()
+            def main(out: Annotated[typer.FileTextWrite, typer.Argument(buffer_size=1024 * 1024)]):
+                for number in range(10_000_000):
+                    out.write(f"{number}\\n")
+            ```
+            """
+        ),
+    ] = None,
+    fsync: Annotated[
+        bool,
+        Doc(
+            """
+            For a CLI Argument representing an output [File object](https://typer.tiangolo.com/tutorial/parameter-types/file/),
+            call `os.fsync()` before closing the file, so that the data is on disk when the command finishes.
+            """
+        ),
+    ] = False,
+    write_behind: Annotated[
+        bool,
+        Doc(
+            """
+            For a CLI Argument representing an output [File object](https://typer.tiangolo.com/tutorial/parameter-types/file/),
+            write the data from a background thread, so that your code doesn't wait for the disk.
+            Write errors are raised by the next write, or when the file is closed.
+            """
+        ),
+    ] = False,
     # Path
     exists: Annotated[
         bool,
@@ -1807,12 +2127,15 @@ def Argument(
         show_envvar=show_envvar,
         help=help,
         hidden=hidden,
+        stdin=stdin,
+        delimiter=delimiter,
         # Choice
         case_sensitive=case_sensitive,
         # Numbers
         min=min,
         max=max,
         clamp=clamp,
+        typecode=typecode,
         # DateTime
         formats=formats,
         # File
@@ -1821,6 +2144,11 @@ def Argument(
         errors=errors,
         lazy=lazy,
         atomic=atomic,
+        compression=compression,
+        compresslevel=compresslevel,
+        buffer_size=buffer_size,
+        fsync=fsync,
+        write_behind=write_behind,
         # Path
         exists=exists,
         file_okay=file_okay,
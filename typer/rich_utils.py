@@ -6,7 +6,7 @@ from collections import defaultdict
 from collections.abc import Iterable
 from gettext import gettext as _
 from os import getenv
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import click
 from rich import box
@@ -25,6 +25,9 @@ from rich.theme import Theme
 from rich.traceback import Traceback
 from typer.models import DeveloperExceptionConfig
 
+if TYPE_CHECKING:  # pragma: no cover
+    from rich.progress import Progress
+
 # Default styles
 STYLE_OPTION = "bold cyan"
 STYLE_SWITCH = "bold green"
@@ -754,3 +757,22 @@ def get_traceback(
         word_wrap=True,
     )
     return rich_tb
+
+
+def make_progress(*, transient: bool) -> "Progress | None":
+    """Return a Rich progress display on stderr, or `None` if it's not a terminal.
+
+    It's not refreshed automatically, `typer.progress()` refreshes it at its own rate.
+    """
+    console = _get_rich_console(stderr=True)
+    if not console.is_terminal:
+        return None
+    # Imported here, it's not needed to render help and errors, nor off a terminal
+    from rich.progress import Progress
+
+    return Progress(
+        *Progress.get_default_columns(),
+        console=console,
+        auto_refresh=False,
+        transient=transient,
+    )